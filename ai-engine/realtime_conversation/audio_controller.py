@@ -1,45 +1,123 @@
+import math
+import time
+from collections import deque
+
+import numpy as np
+
+
 class AudioController:
     """
-    [현재 사용되지 않음 / Future Use Only]
-    
-    이 클래스는 현재 프로젝트 구조(프론트엔드 오디오 캡처 + OpenAI 서버 VAD)에서는 사용되지 않습니다.
-    모든 오디오 로직은 LLM과 클라이언트 측에서 처리됩니다.
-
-    [나중에 이 파일이 필요할 수 있는 경우]
-    1. 서버 사이드 노이즈 캔슬링:
-       - 클라이언트에서 raw PCM을 받아 노이즈 필터링 후 OpenAI로 전송하고 싶을 때.
-    
-    2. 커스텀 VAD (Voice Activity Detection):
-       - OpenAI의 VAD가 너무 민감하거나 둔감해서, 직접 파이썬 라이브러리(webrtcvad, silero-vad)로
-         정밀하게 발화를 감지하고 끊고 싶을 때.
-    
-    3. 오디오 저장/분석:
-       - 대화 내용을 서버 파일로 저장하거나, 감정 분석 모델을 별도로 돌리고 싶을 때
-         process_audio_stream() 메서드를 통해 오디오 데이터를 후킹(Hooking)할 수 있습니다.
+    [서버 사이드 VAD 게이트]
+
+    클라이언트 PCM16(mono) 입력을 OpenAI로 보내기 전에 긴 무음 구간을 걸러냅니다.
+    학습자가 말을 멈추고 생각하는 동안의 무음이 업스트림 대역폭과 전사 비용을 차지하지 않도록 합니다.
+    (opt-in: start_listening() 호출 전에는 입력을 그대로 통과시킴)
+
+    판정 방식 (frame_ms 단위 프레임, NumPy 벡터 연산):
+    - 에너지(dBFS)가 threshold_db 이상이고 영교차율(ZCR)이 zcr_max 이하이면 발화
+      (ZCR이 높은 잡음은 제외하되, threshold_db + 15dB 이상으로 큰 프레임은 무조건 발화로 처리)
+    - Pre-roll: 게이트가 닫힌 동안 최근 preroll_ms를 보관했다가 발화 시작 시 함께 전송 (첫 음절 보존)
+    - Hangover: 마지막 발화 프레임 이후 hangover_ms 동안은 계속 전송
+      (OpenAI server VAD의 silence_duration_ms(500ms)보다 길어야 발화 종료가 정상 감지됨)
     """
-    def __init__(self):
+    def __init__(
+        self,
+        sample_rate: int = 24000,
+        frame_ms: int = 20,
+        threshold_db: float = -45.0,
+        zcr_max: float = 0.35,
+        hangover_ms: int = 800,
+        preroll_ms: int = 300,
+    ):
         self.is_listening = False
         self.is_speaking = False
 
+        self.sample_rate = sample_rate
+        self.frame_samples = max(1, sample_rate * frame_ms // 1000)
+        self.frame_bytes = self.frame_samples * 2
+        self.threshold_db = threshold_db
+        self.zcr_max = zcr_max
+        self.hangover_frames = math.ceil(hangover_ms / frame_ms)
+        self.preroll = deque(maxlen=max(1, math.ceil(preroll_ms / frame_ms)))
+
+        self._residual = b""
+        self._hangover_left = 0
+        self.stats = {"frames": 0, "bytes_in": 0, "bytes_suppressed": 0, "cpu_sec": 0.0}
+
     def start_listening(self):
-        """오디오 입력 캡처를 시작합니다. (현재 미사용)"""
+        """VAD 게이트를 켭니다. (상태 초기화)"""
         self.is_listening = True
-        pass
+        self.is_speaking = False
+        self._residual = b""
+        self._hangover_left = 0
+        self.preroll.clear()
 
     def stop_listening(self):
-        """오디오 입력 캡처를 중지합니다. (현재 미사용)"""
+        """VAD 게이트를 끕니다. (이후 입력은 그대로 통과)"""
         self.is_listening = False
-        pass
+
+    def classify_frames(self, frames: np.ndarray) -> np.ndarray:
+        """(프레임 수, frame_samples) int16 배열 -> 프레임별 발화 여부 (bool 배열)"""
+        x = frames.astype(np.float32)
+        energy = np.mean(x * x, axis=1) / (32768.0 * 32768.0)
+        energy_db = 10.0 * np.log10(energy + 1e-12)
+        signs = np.signbit(frames)
+        zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / max(1, frames.shape[1] - 1)
+        loud = energy_db >= self.threshold_db
+        return loud & ((zcr <= self.zcr_max) | (energy_db >= self.threshold_db + 15.0))
 
     def process_audio_stream(self, audio_chunk):
         """
-        오디오 데이터 청크를 처리합니다. (현재 미사용)
-        
-        [활용 예시]
-        def process_audio_stream(self, audio_chunk):
-            cleaned_audio = self.noise_filter.apply(audio_chunk) # 노이즈 제거
-            if self.vad.is_speech(cleaned_audio):                # 발화 감지
-                return cleaned_audio
-            return None
+        PCM16 청크를 받아 OpenAI로 보낼 바이트를 반환합니다. (무음 구간이면 b"")
+
+        프레임 경계에 못 미치는 나머지 바이트는 다음 청크와 합쳐서 처리합니다.
         """
-        pass
+        if not self.is_listening:
+            return bytes(audio_chunk)
+
+        started = time.process_time()
+        data = self._residual + bytes(audio_chunk)
+        count = len(data) // self.frame_bytes
+        self._residual = data[count * self.frame_bytes:]
+        self.stats["bytes_in"] += len(audio_chunk)
+        if count == 0:
+            return b""
+
+        frames = np.frombuffer(data, dtype="<i2", count=count * self.frame_samples)
+        voiced = self.classify_frames(frames.reshape(count, self.frame_samples))
+
+        out = bytearray()
+        for index, is_voiced in enumerate(voiced.tolist()):
+            frame = data[index * self.frame_bytes:(index + 1) * self.frame_bytes]
+            if is_voiced:
+                if not self.is_speaking:
+                    # 발화 시작: 보관해 둔 pre-roll부터 전송
+                    self.is_speaking = True
+                    for buffered in self.preroll:
+                        out += buffered
+                    self.preroll.clear()
+                self._hangover_left = self.hangover_frames
+                out += frame
+            elif self.is_speaking:
+                out += frame
+                self._hangover_left -= 1
+                if self._hangover_left <= 0:
+                    self.is_speaking = False
+            else:
+                if len(self.preroll) == self.preroll.maxlen:
+                    self.stats["bytes_suppressed"] += self.frame_bytes
+                self.preroll.append(frame)
+
+        self.stats["frames"] += count
+        self.stats["cpu_sec"] += time.process_time() - started
+        return bytes(out)
+
+    def snapshot(self) -> dict:
+        """게이트 통계 (억제 비율, 프레임당 CPU 시간)"""
+        bytes_in = self.stats["bytes_in"]
+        frames = self.stats["frames"]
+        return {
+            **self.stats,
+            "suppressed_pct": 100.0 * self.stats["bytes_suppressed"] / bytes_in if bytes_in else 0.0,
+            "cpu_us_per_frame": 1e6 * self.stats["cpu_sec"] / frames if frames else 0.0,
+        }
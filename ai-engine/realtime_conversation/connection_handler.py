@@ -1,10 +1,21 @@
 import asyncio
+import binascii
 import json
 import logging
 import websockets
 from fastapi import WebSocket, WebSocketDisconnect
+from scenario.adaptive_audio import AdaptiveDownstream, AppPingProbe, quality_event, run_link_monitor
+from scenario.audio_egress import OutputAudioCoalescer
+from scenario.audio_frames import FRAME_INPUT_AUDIO, ClientAudioWire, decode_audio_frame
+from scenario.audio_ingress import InputAudioAggregator
+from scenario.client_outbound import ClientOutboundQueue
+from scenario.event_router import EventRouter
+from scenario.json_codec import get_json_codec
+from scenario.resampler import REALTIME_SAMPLE_RATE, StreamingResampler
+from .audio_controller import AudioController
 from .conversation_manager import ConversationManager
 from .conversation_tracker import ConversationTracker
+from .message_checkpoint import CheckpointWriter, MessageCheckpointer
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -12,6 +23,32 @@ logger = logging.getLogger(__name__)
 
 OPENAI_REALTIME_API_URL = "wss://api.openai.com/v1/realtime?model=gpt-4o-realtime-preview"
 
+# 클라이언트 송신 큐 최대 길이 (audio.delta 기준 약 수 초 분량)
+CLIENT_OUTBOUND_MAX_DEPTH = 200
+
+# OpenAI로 보내는 input_audio_buffer.append 프레임 길이 (클라이언트 10~20ms 청크를 병합)
+INPUT_AUDIO_FRAME_MS = 100
+
+# 클라이언트로 보내는 audio.delta 프레임 길이 (OpenAI의 불규칙한 delta를 고정 길이로 병합, 40/60/100)
+OUTPUT_AUDIO_FRAME_MS = 100
+
+# 대화 중 메시지 체크포인트 주기 (미저장 메시지 N개 또는 T초마다 배치 저장)
+CHECKPOINT_EVERY_MESSAGES = 10
+CHECKPOINT_INTERVAL_SEC = 30.0
+
+# handle_openai_event가 처리하는 OpenAI 이벤트 (나머지는 type만 보고 파싱 없이 버림)
+OPENAI_EVENT_TYPES = (
+    "error",
+    "rate_limits.updated",
+    "session.updated",
+    "response.audio.done",
+    "response.done",
+    "response.audio_transcript.done",
+    "input_audio_buffer.speech_started",
+    "input_audio_buffer.speech_stopped",
+    "conversation.item.input_audio_transcription.completed",
+)
+
 class ConnectionHandler:
     """
     [WebSocket 연결 핸들러]
@@ -32,8 +69,46 @@ class ConnectionHandler:
        - 발화 시작/종료 감지 (VAD 이벤트)
        - 사용자/AI 대화 내용(Transcript) 처리 및 로그 출력
        - 에러 핸들링 및 세션 초기화
+
+    4. 클라이언트 송신 분리 (Backpressure):
+       - Client로 가는 모든 이벤트는 전용 writer 태스크의 bounded 큐(ClientOutboundQueue)를 거침
+       - 느린 클라이언트가 OpenAI 수신 루프를 막지 않음 (오래된 audio.delta만 드롭, 제어 이벤트는 보존)
+       - 제어 이벤트(speech.started 등)는 대기 중인 오디오보다 먼저 전송 (barge-in 지연 최소화)
+
+    5. 오디오 전송 방식 (audio_transport):
+       - "json"(기본): base64 오디오를 JSON 메시지에 담아 송수신
+       - "binary": 고정 헤더(버전/타입/seq/샘플레이트) + PCM16 바이너리 프레임 (base64/JSON 오버헤드 제거)
+
+    6. 입력 오디오 병합 (InputAudioAggregator):
+       - 작은 클라이언트 청크를 INPUT_AUDIO_FRAME_MS 단위로 모아 OpenAI에 전송 (메시지 수 감소)
+       - 시간 초과, commit, 발화 시작/종료 시점에 즉시 flush
+
+    7. 서버 사이드 VAD 게이트 (vad_gate=True, opt-in):
+       - AudioController가 긴 무음 구간을 OpenAI로 보내기 전에 걸러냄 (대역폭/전사 비용 절감)
+
+    8. 입력 샘플레이트 변환:
+       - 클라이언트가 16/44.1/48kHz 등 네이티브 레이트로 보내면(append의 sample_rate 또는 바이너리 헤더)
+         StreamingResampler로 24kHz로 변환 후 전송 (JS 리샘플링 불필요)
+
+    9. 클라이언트 오디오 코덱 (audio_codec):
+       - "pcm16"(기본), "mulaw"(2배 압축), "adpcm"(IMA-ADPCM, 약 3.6배 압축)
+       - 클라이언트 구간에만 적용 (입력은 PCM16으로 디코딩 후 OpenAI 전송, 출력은 전송 직전 인코딩)
+
+    10. 적응형 출력 품질 (adaptive_audio=True, opt-in):
+       - ping/pong 이벤트로 RTT를 재고 송신 큐 깊이/드롭을 관찰해 출력 오디오를 24 -> 16 -> 8kHz로 단계 조정
+       - ASGI WebSocket은 프로토콜 ping을 보낼 수 없으므로 {"type": "ping", "id": n} 이벤트 사용 (클라이언트는 pong으로 응답)
+       - 레벨이 바뀌면 audio.quality 이벤트 전송, audio.delta마다 sample_rate 포함
+
+    11. 출력 오디오 프레임 병합 (OutputAudioCoalescer):
+       - OpenAI의 작고 불규칙한 response.audio.delta를 OUTPUT_AUDIO_FRAME_MS 고정 프레임으로 재분할해 전송
+       - response.audio.done / response.done(취소 포함) 시 남은 오디오 즉시 flush
+
+    12. 메시지 체크포인트 (checkpoint_writer가 주어진 경우):
+       - 메시지마다 세션 내 순번(seq, message_seq_start부터)을 부여하고
+         CHECKPOINT_EVERY_MESSAGES개 또는 CHECKPOINT_INTERVAL_SEC초마다 (session_id, connection_id, seq) upsert로 배치 저장
+       - 비정상 종료에도 마지막 체크포인트까지 보존, 종료 시 저장은 남은 delta만 처리
     """
-    def __init__(self, client_ws: WebSocket, api_key: str, history: list = None, session_id: str = None, context: dict = None, voice: str = None):
+    def __init__(self, client_ws: WebSocket, api_key: str, history: list = None, session_id: str = None, context: dict = None, voice: str = None, audio_transport: str = None, vad_gate: bool = False, audio_codec: str = None, adaptive_audio: bool = False, message_seq_start: int = 0, checkpoint_writer: CheckpointWriter = None):
         self.client_ws = client_ws
         self.api_key = api_key
         self.conversation_manager = ConversationManager()
@@ -42,14 +117,77 @@ class ConnectionHandler:
         self.context = context
         self.voice = voice # [New] 보이스 설정
             
-        self.tracker = ConversationTracker(session_id=session_id) 
+        self.tracker = ConversationTracker(session_id=session_id, start_seq=message_seq_start)
+        # [Checkpoint] 대화 중 주기적 메시지 저장 (opt-in: writer가 있을 때만)
+        self.checkpointer = MessageCheckpointer(
+            self.tracker,
+            checkpoint_writer,
+            every_messages=CHECKPOINT_EVERY_MESSAGES,
+            interval_sec=CHECKPOINT_INTERVAL_SEC,
+            logger=logger,
+        ) if checkpoint_writer else None
         self.openai_ws = None
         self.openai_task = None
         self.history = history or [] # 대화 히스토리 저장
 
+        # [JSON] 프로세스 공용 JSON 코덱 (MALANGEE_JSON_CODEC=stdlib|orjson|msgspec, 기본 stdlib)
+        self.json_codec = get_json_codec()
+
+        # [Binary Audio] 연결 시 협상된 오디오 전송 방식 (기본 JSON) + 클라이언트 구간 코덱 (기본 PCM16)
+        self.wire = ClientAudioWire(audio_transport, audio_codec, json_codec=self.json_codec)
+
+        # [Backpressure] 클라이언트 송신 전용 큐 + writer 태스크
+        self.outbound = ClientOutboundQueue(
+            self.write_to_client,
+            max_depth=CLIENT_OUTBOUND_MAX_DEPTH,
+            logger=logger,
+        )
+
+        # [Adaptive Audio] 링크 상태에 따른 출력 샘플레이트 조정 (opt-in)
+        self.downstream = AdaptiveDownstream() if adaptive_audio else None
+        self.ping_probe = AppPingProbe(self.outbound.put)
+        self.link_monitor_task = None
+
+        # [Egress] 출력 오디오 프레임 병합기
+        self.output_coalescer = OutputAudioCoalescer(OUTPUT_AUDIO_FRAME_MS, downstream=self.downstream)
+
+        # [Routing] OpenAI 이벤트 라우터: audio.delta는 delta 문자열만 잘라서 전달 (JSON 파싱 생략)
+        self.openai_router = EventRouter(logger=logger, json_codec=self.json_codec)
+        self.openai_router.subscribe(
+            lambda event: self.put_audio_delta(event["delta"]), "response.audio.delta", fields=("delta",)
+        )
+        self.openai_router.subscribe(self.handle_openai_event, *OPENAI_EVENT_TYPES)
+
+        # [VAD Gate] 무음 구간 필터 (opt-in)
+        self.audio_controller = AudioController()
+        if vad_gate:
+            self.audio_controller.start_listening()
+
+        # [Resampler] 클라이언트 입력 레이트 -> 24kHz (레이트가 바뀔 때만 재생성)
+        self.input_resampler = None
+
+        # [Ingress] 입력 오디오 병합기 (전송 시점의 openai_ws 사용 → 재연결에도 유지)
+        self.input_aggregator = InputAudioAggregator(
+            self.send_input_audio,
+            frame_ms=INPUT_AUDIO_FRAME_MS,
+        )
+
     async def start(self):
         """[메인 실행 루프]"""
         try:
+            # 0. 클라이언트 송신 writer 시작 (+ 적응형 품질 모니터, 메시지 체크포인트 루프)
+            self.outbound.start()
+            if self.checkpointer:
+                self.checkpointer.start()
+            if self.downstream:
+                self.link_monitor_task = asyncio.create_task(run_link_monitor(
+                    self.downstream,
+                    self.ping_probe.ping,
+                    self.outbound_stats,
+                    self.notify_audio_quality,
+                    logger=logger,
+                ))
+
             # 1. 초기 연결
             await self.connect_to_openai()
 
@@ -64,17 +202,58 @@ class ConnectionHandler:
         finally:
             return await self.cleanup()  # 반환값 전달 (Session Report)
 
+    async def write_to_client(self, payload: dict):
+        """송신 큐 writer가 호출: 협상된 전송 방식으로 직렬화 후 전송"""
+        data = self.wire.encode(payload)
+        if isinstance(data, bytes):
+            await self.client_ws.send_bytes(data)
+        else:
+            await self.client_ws.send_text(data)
+
+    def outbound_stats(self):
+        """적응형 품질 판단용 (송신 큐 깊이, 누적 오디오 드롭 수)"""
+        return self.outbound.depth, self.outbound.stats.dropped_audio
+
+    def notify_audio_quality(self, level):
+        """출력 오디오 레벨 변경 알림"""
+        self.outbound.put(quality_event(level))
+
+    def put_audio_delta(self, delta: str):
+        """OpenAI 오디오 delta를 고정 길이 프레임으로 병합해 송신 큐에 추가 (적응형 모드면 현재 레벨로 다운샘플링)"""
+        if self.downstream and self.downstream.observe_queue(*self.outbound_stats()):
+            logger.info(f"출력 오디오 레벨 변경: {self.downstream.snapshot()}")
+            self.notify_audio_quality(self.downstream.level)
+        self.put_audio_frames(self.output_coalescer.push_base64(delta))
+
+    def flush_audio_frames(self):
+        """응답 종료/취소 시 병합 중인 나머지 오디오를 즉시 전송"""
+        self.put_audio_frames(self.output_coalescer.flush())
+
+    def put_audio_frames(self, frames):
+        for pcm, sample_rate in frames:
+            if self.downstream:
+                self.outbound.put({"type": "audio.delta", "delta": pcm, "sample_rate": sample_rate})
+            else:
+                self.outbound.put({"type": "audio.delta", "delta": pcm})
+
+    async def send_input_audio(self, audio: str):
+        """병합된 입력 오디오(base64)를 OpenAI로 전송"""
+        if self.openai_ws:
+            await self.openai_ws.send(self.json_codec.dumps_event({
+                "type": "input_audio_buffer.append",
+                "audio": audio
+            }))
+
     async def send_error_to_client(self, code: str, message: str):
-        """클라이언트에게 에러 메시지 전송"""
-        try:
-            await self.client_ws.send_json({
-                "type": "error",
-                "code": code,
-                "message": message
-            })
+        """클라이언트에게 에러 메시지 전송 (송신 큐 경유, 제어 이벤트라 드롭되지 않음)"""
+        if self.outbound.put({
+            "type": "error",
+            "code": code,
+            "message": message
+        }):
             logger.info(f"클라이언트에게 에러 전송: {code} - {message}")
-        except Exception as e:
-            logger.warning(f"에러 메시지 전송 실패 (연결 끊김): {e}")
+        else:
+            logger.warning(f"에러 메시지 전송 실패 (연결 끊김): {code}")
 
     async def handle_openai_disconnect(self, reason: str = None):
         """OpenAI 연결 끊김 처리 (클라이언트에게 알림 -> cleanup)"""
@@ -148,25 +327,40 @@ class ConnectionHandler:
         """[Client -> Server 메시지 루프]"""
         try:
             while True:
-                message = await self.client_ws.receive_text()
-                data = json.loads(message)
+                message = await self.client_ws.receive()
+                if message["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(message.get("code", 1000))
+
+                # [Binary Audio] 바이너리 프레임은 오디오 입력 (헤더 + PCM16)
+                if message.get("bytes") is not None:
+                    await self.forward_binary_audio(message["bytes"])
+                    continue
+
+                data = self.json_codec.loads(message.get("text") or "{}")
                 
                 if data.get("type") == "input_audio_buffer.append":
-                    if self.openai_ws:
-                        await self.openai_ws.send(json.dumps({
-                            "type": "input_audio_buffer.append",
-                            "audio": data.get("audio")
-                        }))
+                    audio = data.get("audio")
+                    if isinstance(audio, str):
+                        self.update_input_sample_rate(data.get("sample_rate"))
+                        if self.audio_controller.is_listening or self.input_resampler or not self.wire.pcm16:
+                            try:
+                                pcm = self.wire.decode_input(binascii.a2b_base64(audio))
+                            except binascii.Error:
+                                continue
+                            await self.forward_input_pcm(pcm)
+                        else:
+                            await self.input_aggregator.add_base64(audio)
                 
                 elif data.get("type") == "input_audio_buffer.commit":
+                     await self.input_aggregator.flush()
                      if self.openai_ws:
-                        await self.openai_ws.send(json.dumps({
+                        await self.openai_ws.send(self.json_codec.dumps_event({
                             "type": "input_audio_buffer.commit"
                         }))
                      
                 elif data.get("type") == "response.create":
                     if self.openai_ws:
-                        await self.openai_ws.send(json.dumps({
+                        await self.openai_ws.send(self.json_codec.dumps_event({
                             "type": "response.create"
                         }))
 
@@ -179,6 +373,9 @@ class ConnectionHandler:
                         if should_reconnect:
                             await self.reconnect_to_openai()
 
+                elif data.get("type") == "pong":
+                    self.ping_probe.pong(data.get("id"))
+
                 elif data.get("type") == "disconnect":
                     logger.info("클라이언트로부터 연결 종료 요청 수신")
                     break
@@ -188,75 +385,105 @@ class ConnectionHandler:
         except Exception as e:
             logger.error(f"클라이언트 읽기 오류: {e}")
 
+    async def forward_binary_audio(self, raw: bytes):
+        """바이너리 오디오 프레임을 OpenAI input_audio_buffer.append로 변환해 전달"""
+        try:
+            frame = decode_audio_frame(raw, self.wire.codec.name)
+        except ValueError as e:
+            logger.warning(f"잘못된 오디오 프레임 무시: {e}")
+            return
+        if frame.frame_type != FRAME_INPUT_AUDIO or not frame.payload:
+            return
+        self.update_input_sample_rate(frame.sample_rate)
+        await self.forward_input_pcm(self.wire.decode_input(frame.payload))
+
+    def update_input_sample_rate(self, sample_rate):
+        """클라이언트 입력 레이트 갱신 (24kHz가 아니면 리샘플러 사용)"""
+        if not isinstance(sample_rate, int) or not 8000 <= sample_rate <= 96000:
+            return
+        current = self.input_resampler.in_rate if self.input_resampler else REALTIME_SAMPLE_RATE
+        if sample_rate == current:
+            return
+        logger.info(f"클라이언트 입력 샘플레이트 변경: {current} -> {sample_rate}")
+        self.input_resampler = StreamingResampler(sample_rate) if sample_rate != REALTIME_SAMPLE_RATE else None
+
+    async def forward_input_pcm(self, pcm: bytes):
+        """PCM16 입력을 (리샘플링 -> VAD 게이트를 거쳐) 병합기로 전달"""
+        if self.input_resampler:
+            pcm = self.input_resampler.process(pcm)
+        gated = self.audio_controller.process_audio_stream(pcm)
+        if gated:
+            await self.input_aggregator.add_pcm(gated)
+
+    async def handle_openai_event(self, event):
+        """[OpenAI 이벤트 처리] 라우터가 OPENAI_EVENT_TYPES 이벤트만 파싱해서 넘겨줌"""
+        event_type = event.get("type")
+
+        if event_type == "error":
+            logger.error(f"OpenAI 오류 발생: {json.dumps(event, ensure_ascii=False)}")
+        
+        # Rate Limit 확인용
+        if event_type == "rate_limits.updated":
+            logger.info(f"Rate Limit 업데이트: {json.dumps(event, ensure_ascii=False)}")
+            # 기본값 로그는 헷갈리므로 생략하거나 명확히 표시
+            logger.debug(f"OpenAI 기본 세션 생성됨: {event.get('session', {}).get('voice')}")
+        
+        elif event_type == "session.updated":
+            logger.info(f"OpenAI 세션 설정 업데이트 완료: {event.get('session', {}).get('voice')}")
+        
+        # [Backpressure] 클라이언트 송신은 큐에 넣기만 하고 즉시 다음 이벤트 처리
+        # (response.audio.delta는 라우터가 put_audio_delta로 바로 넘김)
+        elif event_type == "response.audio.done":
+            self.flush_audio_frames()
+            self.outbound.put({"type": "audio.done"})
+        elif event_type == "response.done":
+            # 취소된 응답은 audio.done 없이 끝날 수 있음
+            self.flush_audio_frames()
+        elif event_type == "response.audio_transcript.done":
+            # 텍스트 자막
+            self.outbound.put({
+                "type": "transcript.done",
+                "transcript": event["transcript"]
+            })
+            # [Tracker] AI 응답 자막 기록
+            self.tracker.add_transcript("assistant", event["transcript"])
+            if self.checkpointer:
+                self.checkpointer.notify()
+        elif event_type == "input_audio_buffer.speech_started":
+            logger.info("VAD가 발화 시작을 감지함")
+            await self.input_aggregator.flush()
+            self.outbound.put({"type": "speech.started"})
+            # [Tracker] 사용자 발화 시작
+            self.tracker.start_user_speech()
+
+        elif event_type == "input_audio_buffer.speech_stopped":
+            # [Tracker] 사용자 발화 종료 (VAD)
+            self.tracker.stop_user_speech()
+            await self.input_aggregator.flush()
+            self.outbound.put({"type": "speech.stopped"})
+        elif event_type == "conversation.item.input_audio_transcription.completed":
+            transcript = event.get("transcript", "")
+            logger.info(f"사용자 자막: {transcript}")
+            self.outbound.put({
+                "type": "user.transcript",
+                "transcript": transcript
+            })
+            # [Tracker] 사용자 자막 기록 & WPM 분석
+            wpm_status = self.tracker.add_transcript("user", transcript)
+            if self.checkpointer:
+                self.checkpointer.notify()
+            
+            # [Manager] 발화 속도에 따라 스타일 업데이트 (비동기 호출)
+            await self.conversation_manager.update_speaking_style(wpm_status)
+        elif event_type == "error":
+            logger.error(f"OpenAI 오류: {event.get('error')}")
+
     async def receive_from_openai(self):
         """[OpenAI -> Client 중계 루프]"""
         try:
             async for message in self.openai_ws:
-                event = json.loads(message)
-                event_type = event.get("type")
-                
-                # 로그 필터링 (디버깅을 위해 일시 해제)
-                # if event_type not in ["response.audio.delta", "response.audio_transcript.delta"]:
-                #    pass
-                
-                # 모든 이벤트 로그 출력 (너무 많으면 나중에 다시 필터링)
-                # print(f"[OpenAI Event] {event_type}") 
-                pass # print는 주석처리하고 필요한 중요 로그만 아래에서 처리하도록 내버려두거나,
-                     # 아니면 디버깅을 위해 다 찍어볼 수도 있음. 
-                     # 여기서는 사용자가 원인 파악을 원하므로 'Warning' 이상이나 'Error'는 무조건 찍히게 되어있지만,
-                     # RateLimit 같은 걸 보려면 다 찍는 게 좋음.
-                     
-                if event_type == "error":
-                    logger.error(f"OpenAI 오류 발생: {json.dumps(event, ensure_ascii=False)}")
-                
-                # Rate Limit 확인용
-                if event_type == "rate_limits.updated":
-                    logger.info(f"Rate Limit 업데이트: {json.dumps(event, ensure_ascii=False)}")
-                    # 기본값 로그는 헷갈리므로 생략하거나 명확히 표시
-                    logger.debug(f"OpenAI 기본 세션 생성됨: {event.get('session', {}).get('voice')}")
-                
-                elif event_type == "session.updated":
-                    logger.info(f"OpenAI 세션 설정 업데이트 완료: {event.get('session', {}).get('voice')}")
-                
-                elif event_type == "response.audio.delta":
-                    await self.client_ws.send_json({
-                        "type": "audio.delta",
-                        "delta": event["delta"]
-                    })
-                elif event_type == "response.audio.done":
-                     await self.client_ws.send_json({"type": "audio.done"})
-                elif event_type == "response.audio_transcript.done":
-                    # 텍스트 자막
-                    await self.client_ws.send_json({
-                        "type": "transcript.done",
-                        "transcript": event["transcript"]
-                    })
-                    # [Tracker] AI 응답 자막 기록
-                    self.tracker.add_transcript("assistant", event["transcript"])
-                elif event_type == "input_audio_buffer.speech_started":
-                    logger.info("VAD가 발화 시작을 감지함")
-                    await self.client_ws.send_json({"type": "speech.started"})
-                    # [Tracker] 사용자 발화 시작
-                    self.tracker.start_user_speech()
-
-                elif event_type == "input_audio_buffer.speech_stopped":
-                    # [Tracker] 사용자 발화 종료 (VAD)
-                    self.tracker.stop_user_speech()
-                    await self.client_ws.send_json({"type": "speech.stopped"})
-                elif event_type == "conversation.item.input_audio_transcription.completed":
-                    transcript = event.get("transcript", "")
-                    logger.info(f"사용자 자막: {transcript}")
-                    await self.client_ws.send_json({
-                        "type": "user.transcript",
-                        "transcript": transcript
-                    })
-                    # [Tracker] 사용자 자막 기록 & WPM 분석
-                    wpm_status = self.tracker.add_transcript("user", transcript)
-                    
-                    # [Manager] 발화 속도에 따라 스타일 업데이트 (비동기 호출)
-                    await self.conversation_manager.update_speaking_style(wpm_status)
-                elif event_type == "error":
-                    logger.error(f"OpenAI 오류: {event.get('error')}")
+                # type만 먼저 읽고, 구독된 이벤트만 파싱해서 전달
+                await self.openai_router.dispatch(message)
 
         except Exception as e:
             logger.error(f"OpenAI 수신 루프 중지됨: {e}")
@@ -272,29 +499,43 @@ class ConnectionHandler:
 
     async def cleanup(self):
         """자원 정리"""
+        self.input_aggregator.close()
+        logger.info(f"입력 오디오 병합 통계: {self.input_aggregator.snapshot()}")
+        if self.audio_controller.is_listening:
+            logger.info(f"VAD 게이트 통계: {self.audio_controller.snapshot()}")
+        self.flush_audio_frames()
+        logger.info(f"출력 오디오 병합 통계: {self.output_coalescer.snapshot()}")
+        logger.info(f"OpenAI 이벤트 라우팅 통계: {self.openai_router.snapshot()}")
+        if self.link_monitor_task:
+            self.link_monitor_task.cancel()
+            logger.info(f"적응형 출력 품질 통계: {self.downstream.snapshot()}")
         if self.openai_task:
             self.openai_task.cancel()
         if self.openai_ws:
             await self.openai_ws.close()
             
+        # [Checkpoint] 주기 저장 중단 (진행 중인 배치는 완료 대기, 남은 메시지는 최종 저장에서 처리)
+        if self.checkpointer:
+            await self.checkpointer.close()
+            logger.info(f"메시지 체크포인트 통계: {self.checkpointer.snapshot()}")
+
         # [Tracker] 세션 종료 및 리포트 생성 (전송 & 반환)
         if hasattr(self, 'tracker'):
             report = self.tracker.finalize()
             logger.info(f"### Session Report ###\n{json.dumps(report, indent=2, ensure_ascii=False)}")
             
-            # 클라이언트에게 리포트 전송 (이미 끊겼을 수도 있으므로 try-except)
+            # 클라이언트에게 리포트 전송 (이미 끊겼을 수도 있음)
             # 주의: 에러 발생("error" 타입 전송) 직후라면 리포트 전송이 의미 없거나 실패할 수 있음
-            try:
-                # 연결이 살아있을 때만 "disconnected" 정류 종료 알림과 함께 리포트 전송
-                # (이미 "error"를 보냈거나 소켓이 닫혔으면 실패할 것임)
-                await self.client_ws.send_json({
-                    "type": "disconnected",
-                    "reason": "Session ended",
-                    "report": report
-                })
-                logger.debug("클라이언트에게 세션 리포트 및 종료 알림 전송 완료")
-            except Exception as e:
-                pass # 이미 끊긴 경우 무시
+            # 송신 큐 뒤에 붙여서 남은 이벤트 다음에 전송되도록 하고, 큐를 비운 뒤 writer 종료
+            # (소켓이 닫혀 있으면 put이 False를 반환하므로 무시)
+            if self.outbound.put({
+                "type": "disconnected",
+                "reason": "Session ended",
+                "report": report
+            }):
+                logger.debug("클라이언트에게 세션 리포트 및 종료 알림 전송 예약")
+            await self.outbound.close()
+            logger.info(f"클라이언트 송신 큐 통계: {self.outbound.snapshot()}")
 
             return report
         return None
@@ -3,6 +3,8 @@ import json
 import logging
 import os
 
+from scenario.json_codec import get_json_codec
+
 logger = logging.getLogger(__name__)
 
 class ConversationManager:
@@ -70,6 +72,9 @@ class ConversationManager:
                 "input_audio_transcription": {"model": "whisper-1"}
             }
         
+        # [JSON] OpenAI로 보내는 이벤트 직렬화 (프로세스 공용 코덱)
+        self.json_codec = get_json_codec()
+
         # 기본값으로 초기 설정 세팅
         self.current_config = self.default_config.copy()
         self.current_config["instructions"] = self.instruction_base
@@ -146,7 +151,7 @@ class ConversationManager:
             "session": self.current_config
         }
         
-        await openai_ws.send(json.dumps(session_config))
+        await openai_ws.send(self.json_codec.dumps_event(session_config))
         logger.info("-> session.update 전송 완료 (초기화)")
 
     async def inject_history(self, messages: list):
@@ -181,7 +186,7 @@ class ConversationManager:
                     ]
                 }
             }
-            await self.openai_ws.send(json.dumps(item_event))
+            await self.openai_ws.send(self.json_codec.dumps_event(item_event))
             
         logger.info("-> 대화 히스토리 주입 완료")
 
@@ -239,7 +244,7 @@ class ConversationManager:
                     "type": "session.update",
                     "session": new_settings
                 }
-                await self.openai_ws.send(json.dumps(update_payload))
+                await self.openai_ws.send(self.json_codec.dumps_event(update_payload))
                 logger.info(f"-> 실시간 설정 업데이트 전송 완료: {new_settings.keys()}")
             except Exception as e:
                 logger.error(f"세션 업데이트 전송 실패: {e}")
@@ -275,7 +280,7 @@ class ConversationManager:
         # 직접 전송 (User 레이어 영향 없이)
         if self.openai_ws:
             try:
-                await self.openai_ws.send(json.dumps({
+                await self.openai_ws.send(self.json_codec.dumps_event({
                     "type": "session.update",
                     "session": {
                         "instructions": assembled
@@ -12,9 +12,15 @@ class ConversationTracker:
     
     세션 동안의 대화 흐름, 발화 시간, 자막(Transcript)을 메모리 상에서 추적합니다.
     세션이 종료되면 DB 저장을 위한 정형화된 데이터를 반환합니다.
+
+    메시지마다 연결 ID(connection_id)와 순번(seq)을 부여합니다. (session_id, connection_id, seq)가
+    DB의 유니크 키이므로 같은 메시지를 여러 번 저장(체크포인트 재시도 등)해도 행이 중복되지 않고,
+    빠른 재연결로 같은 세션에 트래커가 겹쳐 순번이 겹쳐도 다른 연결의 메시지를 덮지 않습니다.
     """
-    def __init__(self, session_id: Optional[str] = None):
+    def __init__(self, session_id: Optional[str] = None, start_seq: int = 0):
         self.session_id = session_id or str(uuid.uuid4())
+        # 이 연결(트래커)의 식별자: 멱등 키를 연결 단위로 분리
+        self.connection_id = uuid.uuid4().hex
         self.started_at_ts = time.time()
         self.started_at = datetime.now(timezone.utc).isoformat()
         
@@ -25,6 +31,11 @@ class ConversationTracker:
         # 대화 로그 (Messages)
         # item structure: { "role": str, "content": str, "timestamp": str (iso), "duration_sec": float }
         self.messages: List[Dict] = []
+
+        # 메시지 순번 (이어지는 세션이면 DB에 저장된 마지막 seq + 1부터 시작)
+        self._next_seq = start_seq
+        # messages[:checkpointed_count]는 이미 DB에 체크포인트됨
+        self.checkpointed_count = 0
         
         # 임시 저장소
         self._last_message_ts = None
@@ -87,16 +98,27 @@ class ConversationTracker:
             pass 
         
         message_entry = {
+            "seq": self._next_seq,
+            "connection_id": self.connection_id,
             "role": role,
             "content": content,
             "timestamp": now,
             "duration_sec": round(message_duration, 2)
         }
+        self._next_seq += 1
         self.messages.append(message_entry)
         logger.info(f"[Tracker] 메시지 추가 ({role}): {content[:20]}...")
         
         return self._determine_wpm_status()
 
+    def pending_messages(self) -> List[Dict]:
+        """아직 DB에 체크포인트되지 않은 메시지 (저장 순서 = seq 순서)"""
+        return self.messages[self.checkpointed_count:]
+
+    def mark_checkpointed(self, count: int):
+        """pending_messages() 앞에서부터 count개가 저장되었음을 기록"""
+        self.checkpointed_count = min(len(self.messages), self.checkpointed_count + count)
+
     def _determine_wpm_status(self) -> str:
         """최근 WPM 평균을 기반으로 상태 결정"""
         if not self.wpm_history:
@@ -130,7 +152,9 @@ class ConversationTracker:
             "ended_at": ended_at,
             "total_duration_sec": round(total_duration_sec, 2),
             "user_speech_duration_sec": round(self.user_speech_total_seconds, 2),
-            "messages": self.messages
+            "messages": self.messages,
+            # 대화 중 이미 체크포인트된 메시지 수 (최종 저장은 messages[checkpointed_messages:]만 처리)
+            "checkpointed_messages": self.checkpointed_count
         }
         
         logger.info(f"[Tracker] 세션 리포트 생성 완료. 총 시간: {report['total_duration_sec']}초, 유저 발화: {report['user_speech_duration_sec']}초")
@@ -0,0 +1,99 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from .conversation_tracker import ConversationTracker
+
+# writer(session_id, messages): (session_id, connection_id, seq) 기준 upsert로 저장해야 함
+CheckpointWriter = Callable[[str, List[Dict]], Awaitable[None]]
+
+
+class MessageCheckpointer:
+    """
+    [대화 중 메시지 체크포인트]
+
+    Tracker에 쌓인 미저장 메시지를 N개(every_messages)마다 또는 T초(interval_sec)마다
+    writer로 배치 저장합니다. 세션 종료 시 한꺼번에 저장하던 방식과 달리
+    프로세스가 죽어도 마지막 체크포인트까지는 남고, 종료 시 저장은 남은 delta만 처리합니다.
+
+    - writer는 (session_id, connection_id, seq) 기준 upsert이므로 실패 후 재시도해도 중복 행이 생기지 않습니다.
+    - 실패한 배치는 미저장 상태로 남아 다음 주기에 다시 시도됩니다.
+    - 저장 중에 추가된 메시지는 다음 배치로 넘어갑니다. (lock으로 배치 간 순서 보장)
+    """
+    def __init__(
+        self,
+        tracker: ConversationTracker,
+        writer: CheckpointWriter,
+        *,
+        every_messages: int = 10,
+        interval_sec: float = 30.0,
+        logger: Optional[logging.Logger] = None,
+    ):
+        self.tracker = tracker
+        self.writer = writer
+        self.every_messages = max(1, every_messages)
+        self.interval_sec = interval_sec
+        self.logger = logger or logging.getLogger(__name__)
+        self._lock = asyncio.Lock()
+        self._loop_task: Optional[asyncio.Task] = None
+        self._flush_task: Optional[asyncio.Task] = None
+
+        # 통계
+        self.checkpoints = 0
+        self.messages_saved = 0
+        self.failures = 0
+
+    def start(self):
+        """T초 주기 체크포인트 루프 시작"""
+        if self._loop_task is None and self.interval_sec > 0:
+            self._loop_task = asyncio.create_task(self._run())
+
+    def notify(self):
+        """메시지 추가 후 호출: 미저장 메시지가 N개 이상이면 백그라운드로 저장 (대화 흐름을 막지 않음)"""
+        if len(self.tracker.pending_messages()) < self.every_messages:
+            return
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self.flush())
+
+    async def flush(self) -> int:
+        """미저장 메시지를 한 번 저장하고, 저장된 메시지 수를 반환 (실패 시 0)"""
+        async with self._lock:
+            batch = list(self.tracker.pending_messages())
+            if not batch:
+                return 0
+            try:
+                await self.writer(self.tracker.session_id, batch)
+            except Exception as e:
+                self.failures += 1
+                self.logger.warning(f"메시지 체크포인트 실패 ({len(batch)}개, 다음 주기에 재시도): {e}")
+                return 0
+            self.tracker.mark_checkpointed(len(batch))
+            self.checkpoints += 1
+            self.messages_saved += len(batch)
+            return len(batch)
+
+    async def close(self):
+        """주기 루프 중단 + 진행 중인 저장 완료 대기 (남은 메시지는 최종 저장에서 처리)"""
+        if self._loop_task:
+            self._loop_task.cancel()
+            try:
+                await self._loop_task
+            except asyncio.CancelledError:
+                pass
+            self._loop_task = None
+        if self._flush_task:
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+
+    def snapshot(self) -> dict:
+        return {
+            "checkpoints": self.checkpoints,
+            "messages_saved": self.messages_saved,
+            "pending": len(self.tracker.pending_messages()),
+            "failures": self.failures,
+        }
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval_sec)
+            await self.flush()
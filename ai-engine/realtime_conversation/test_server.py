@@ -57,7 +57,7 @@ class DebugConnectionHandler(ConnectionHandler):
         """클라이언트에게 실시간 상태 정보 전송"""
         try:
             print(f"DEBUG: Sending debug.state -> WPM: {wpm_status}")
-            await self.client_ws.send_json({
+            self.outbound.put({
                 "type": "debug.state",
                 "wpm_status": wpm_status,
                 "dynamic_instruction": dynamic_instruction
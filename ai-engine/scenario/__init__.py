@@ -1,8 +1,18 @@
 from .config import AppConfig
-from .fallbacks import build_realtime_error_handler
+from .fallbacks import build_client_error_handler, build_realtime_error_handler
+from .adaptive_audio import AdaptiveAudioConfig, AdaptiveDownstream, QualityLevel
+from .audio_codecs import ImaAdpcmCodec, MuLawCodec, build_audio_codec
+from .audio_egress import OutputAudioCoalescer
+from .audio_frames import AudioFrame, ClientAudioWire, decode_audio_frame, encode_audio_frame
+from .audio_pacing import AudioPacer, AudioPacingConfig
 from .audio_relay import RealtimeAudioRelay
+from .client_outbound import ClientOutboundQueue, OutboundStats
+from .completion_queue import CompletionJob, CompletionOutbox, ScenarioCompletionQueue
+from .event_router import EventRouter
 from .factory import build_scenario_builder
+from .json_codec import JsonCodec, build_json_codec, get_json_codec
 from .llm_client import OpenAIScenarioLLM
+from .openai_clients import OpenAIClientRegistry, get_openai_clients
 from .logging_utils import configure_root, get_logger
 from .prompts import build_extraction_prompt, build_followup_prompt, build_final_prompt
 from .realtime_adapters import (
@@ -10,11 +20,15 @@ from .realtime_adapters import (
     build_response_create_sender,
     build_text_response_sender,
 )
-from .realtime_handlers import fanout_event_handler
+from .realtime_handlers import ConcurrentFanout, HandlerFailedError, fanout_event_handler
 from .realtime_pipeline import RealtimeScenarioPipeline
 from .realtime_session import RealtimeConfig, RealtimeSessionInfo, RealtimeSessionManager, RealtimeWebSocketClient
+from .resampler import StreamingResampler
 from .scenario_builder import ScenarioBuilder
 from .scenario_state import ScenarioState
+from .session_pool import RealtimePoolMetrics, RealtimeSessionPool
+from .transcript_coalescer import TranscriptDeltaCoalescer
+from .tts_stream import OpenAITTSProvider, TTSProvider, WavStreamParser, stream_tts_pcm16
 
 __all__ = [
     "AppConfig",
@@ -22,15 +36,50 @@ __all__ = [
     "ScenarioState",
     "RealtimeScenarioPipeline",
     "RealtimeAudioRelay",
+    "StreamingResampler",
+    "AdaptiveAudioConfig",
+    "AdaptiveDownstream",
+    "QualityLevel",
+    "ImaAdpcmCodec",
+    "MuLawCodec",
+    "build_audio_codec",
+    "OutputAudioCoalescer",
+    "AudioFrame",
+    "ClientAudioWire",
+    "decode_audio_frame",
+    "encode_audio_frame",
+    "AudioPacer",
+    "AudioPacingConfig",
+    "ClientOutboundQueue",
+    "OutboundStats",
+    "CompletionJob",
+    "CompletionOutbox",
+    "ScenarioCompletionQueue",
     "RealtimeConfig",
     "RealtimeSessionInfo",
     "RealtimeSessionManager",
     "RealtimeWebSocketClient",
+    "RealtimeSessionPool",
+    "RealtimePoolMetrics",
     "build_audio_response_sender",
     "build_text_response_sender",
     "build_response_create_sender",
     "fanout_event_handler",
+    "ConcurrentFanout",
+    "HandlerFailedError",
+    "EventRouter",
+    "JsonCodec",
+    "build_json_codec",
+    "get_json_codec",
+    "TranscriptDeltaCoalescer",
+    "OpenAITTSProvider",
+    "TTSProvider",
+    "WavStreamParser",
+    "stream_tts_pcm16",
     "OpenAIScenarioLLM",
+    "OpenAIClientRegistry",
+    "get_openai_clients",
+    "build_client_error_handler",
     "build_realtime_error_handler",
     "build_scenario_builder",
     "configure_root",
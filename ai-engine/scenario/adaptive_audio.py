@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional, Union
+
+from .resampler import REALTIME_SAMPLE_RATE, StreamingResampler
+
+PingFn = Callable[[], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class QualityLevel:
+    sample_rate: int
+    chunk_ms: int
+
+
+# Best first. Lower rates also get longer chunks: fewer messages per second on a
+# link that is already struggling, and a deeper client jitter buffer.
+QUALITY_LEVELS = (
+    QualityLevel(REALTIME_SAMPLE_RATE, 100),
+    QualityLevel(16000, 160),
+    QualityLevel(8000, 200),
+)
+
+
+@dataclass(frozen=True)
+class AdaptiveAudioConfig:
+    degrade_rtt_ms: float = 400.0
+    recover_rtt_ms: float = 150.0
+    degrade_queue_depth: int = 5
+    recover_queue_depth: int = 2
+    degrade_hold_sec: float = 0.5
+    recover_hold_sec: float = 5.0
+    rtt_alpha: float = 0.3
+    ping_interval_sec: float = 2.0
+    ping_timeout_sec: float = 3.0
+
+
+class AdaptiveDownstream:
+    """Per-connection downstream quality ladder driven by RTT and send-queue growth.
+
+    Steps down one level when the smoothed RTT, the outbound queue depth or new
+    audio drops say the link is congested, at most once per `degrade_hold_sec`.
+    Steps back up only after `recover_hold_sec` of a clean link. Audio above the
+    current level's rate goes through a streaming downsampler; it is never
+    upsampled. Each audio source (`stream`: TTS, relayed Realtime audio) has
+    its own downsampler, so interleaved sources never share filter history.
+    """
+
+    def __init__(
+        self,
+        config: Optional[AdaptiveAudioConfig] = None,
+        *,
+        levels: tuple[QualityLevel, ...] = QUALITY_LEVELS,
+        clock: Optional[Callable[[], float]] = None,
+    ) -> None:
+        self.config = config or AdaptiveAudioConfig()
+        self.levels = levels
+        self._clock = clock or time.monotonic
+        self._index = 0
+        self._changed_at = self._clock()
+        self._congested_at = float("-inf")
+        self._rtt_ms: Optional[float] = None
+        self._queue_depth = 0
+        self._dropped = 0
+        self._resamplers: dict[str, StreamingResampler] = {}
+        self.transitions = 0
+
+    @property
+    def level(self) -> QualityLevel:
+        return self.levels[self._index]
+
+    @property
+    def rtt_ms(self) -> Optional[float]:
+        return self._rtt_ms
+
+    def observe_rtt(self, rtt_ms: float) -> bool:
+        alpha = self.config.rtt_alpha
+        self._rtt_ms = rtt_ms if self._rtt_ms is None else alpha * rtt_ms + (1 - alpha) * self._rtt_ms
+        return self._evaluate(new_drops=False)
+
+    def observe_queue(self, depth: int, dropped_total: int = 0) -> bool:
+        new_drops = dropped_total > self._dropped
+        self._dropped = dropped_total
+        self._queue_depth = depth
+        return self._evaluate(new_drops=new_drops)
+
+    def convert(
+        self,
+        pcm: Union[bytes, bytearray, memoryview],
+        sample_rate: int = REALTIME_SAMPLE_RATE,
+        stream: str = "default",
+    ) -> tuple[bytes, int]:
+        """PCM16 at `sample_rate` -> (PCM16 at the current level's rate, that rate)."""
+        target = self.level.sample_rate
+        if sample_rate <= target:
+            return bytes(pcm), sample_rate
+        resampler = self._resamplers.get(stream)
+        if resampler is None or resampler.in_rate != sample_rate or resampler.out_rate != target:
+            resampler = StreamingResampler(sample_rate, target)
+            self._resamplers[stream] = resampler
+        return resampler.process(pcm), target
+
+    def end_stream(self, stream: str = "default") -> None:
+        """Drop `stream`'s filter history at `audio.done`; its next utterance starts clean."""
+        self._resamplers.pop(stream, None)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "sample_rate": self.level.sample_rate,
+            "chunk_ms": self.level.chunk_ms,
+            "rtt_ms": round(self._rtt_ms, 1) if self._rtt_ms is not None else None,
+            "queue_depth": self._queue_depth,
+            "transitions": self.transitions,
+        }
+
+    def _evaluate(self, *, new_drops: bool) -> bool:
+        config = self.config
+        now = self._clock()
+        rtt = self._rtt_ms or 0.0
+        congested = new_drops or rtt > config.degrade_rtt_ms or self._queue_depth > config.degrade_queue_depth
+        if congested:
+            self._congested_at = now
+            if self._index < len(self.levels) - 1 and now - self._changed_at >= config.degrade_hold_sec:
+                return self._step(1, now)
+            return False
+        clean = rtt <= config.recover_rtt_ms and self._queue_depth <= config.recover_queue_depth
+        if (
+            clean
+            and self._index > 0
+            and now - self._changed_at >= config.recover_hold_sec
+            and now - self._congested_at >= config.recover_hold_sec
+        ):
+            return self._step(-1, now)
+        return False
+
+    def _step(self, direction: int, now: float) -> bool:
+        self._index += direction
+        self._changed_at = now
+        self.transitions += 1
+        # Filter state from the previous target rate would click; start clean.
+        self._resamplers.clear()
+        return True
+
+
+class AppPingProbe:
+    """Application-level ping for sockets that cannot send protocol pings (ASGI).
+
+    Sends `{"type": "ping", "id": n}` through the client's send path; the
+    client answers `{"type": "pong", "id": n}` and the receive loop calls `pong()`.
+    """
+
+    def __init__(self, send: Callable[[dict[str, Any]], Any]) -> None:
+        self._send = send
+        self._ids = itertools.count(1)
+        self._pending: dict[int, asyncio.Future] = {}
+
+    async def ping(self) -> None:
+        ping_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[ping_id] = future
+        try:
+            result = self._send({"type": "ping", "id": ping_id})
+            if hasattr(result, "__await__"):
+                await result
+            await future
+        finally:
+            self._pending.pop(ping_id, None)
+
+    def pong(self, ping_id: Any) -> None:
+        future = self._pending.get(ping_id)
+        if future is not None and not future.done():
+            future.set_result(None)
+
+
+def websocket_ping(client_ws) -> Optional[PingFn]:
+    """Protocol ping for `websockets` connections; None when the socket has no ping()."""
+    ping = getattr(client_ws, "ping", None)
+    if ping is None:
+        return None
+
+    async def _ping() -> None:
+        pong_waiter = await ping()
+        await pong_waiter
+
+    return _ping
+
+
+async def run_link_monitor(
+    controller: AdaptiveDownstream,
+    ping: PingFn,
+    queue_stats: Callable[[], tuple[int, int]],
+    on_change: Callable[[QualityLevel], Any],
+    *,
+    logger: Optional[logging.Logger] = None,
+) -> None:
+    """Ping every `ping_interval_sec` and sample the send queue until cancelled.
+
+    A ping that does not come back within `ping_timeout_sec` counts as an RTT of
+    the timeout. `queue_stats` returns (queue depth, total dropped audio frames).
+    """
+    logger = logger or logging.getLogger(__name__)
+    config = controller.config
+    while True:
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(ping(), timeout=config.ping_timeout_sec)
+            rtt_ms = (time.perf_counter() - started) * 1000.0
+        except asyncio.TimeoutError:
+            rtt_ms = config.ping_timeout_sec * 1000.0
+        changed = controller.observe_rtt(rtt_ms)
+        changed = controller.observe_queue(*queue_stats()) or changed
+        if changed:
+            logger.info("Downstream audio level: %s", controller.snapshot())
+            result = on_change(controller.level)
+            if hasattr(result, "__await__"):
+                await result
+        await asyncio.sleep(max(0.0, config.ping_interval_sec - (time.perf_counter() - started)))
+
+
+def quality_event(level: QualityLevel) -> dict[str, Any]:
+    """Client notice of a level change; every audio delta also carries its own sample_rate."""
+    return {"type": "audio.quality", "sample_rate": level.sample_rate, "chunk_ms": level.chunk_ms}
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+from typing import Optional, Protocol, Union
+
+import numpy as np
+
+AUDIO_CODEC_PCM16 = "pcm16"
+AUDIO_CODEC_MULAW = "mulaw"
+AUDIO_CODEC_ADPCM = "adpcm"
+AUDIO_CODECS = (AUDIO_CODEC_PCM16, AUDIO_CODEC_MULAW, AUDIO_CODEC_ADPCM)
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+class AudioCodec(Protocol):
+    name: str
+
+    def encode(self, pcm: BytesLike) -> bytes:
+        ...
+
+    def decode(self, data: BytesLike) -> bytes:
+        ...
+
+
+def negotiate_audio_codec(requested: Optional[str]) -> str:
+    if isinstance(requested, str) and requested.strip().lower() in AUDIO_CODECS:
+        return requested.strip().lower()
+    return AUDIO_CODEC_PCM16
+
+
+def build_audio_codec(name: Optional[str]) -> AudioCodec:
+    name = negotiate_audio_codec(name)
+    if name == AUDIO_CODEC_MULAW:
+        return MuLawCodec()
+    if name == AUDIO_CODEC_ADPCM:
+        return ImaAdpcmCodec()
+    return Pcm16Codec()
+
+
+class Pcm16Codec:
+    name = AUDIO_CODEC_PCM16
+
+    def encode(self, pcm: BytesLike) -> bytes:
+        return bytes(pcm)
+
+    def decode(self, data: BytesLike) -> bytes:
+        return bytes(data)
+
+
+def _build_mulaw_tables() -> tuple[np.ndarray, np.ndarray]:
+    # Encode table indexed by the int16 sample's uint16 bit pattern (G.711, bias 0x84).
+    samples = np.arange(65536, dtype=np.uint32).astype(np.uint16).view(np.int16).astype(np.int32)
+    sign = (samples < 0).astype(np.int32) << 7
+    magnitude = np.minimum(np.abs(samples), 32635) + 0x84
+    exponent = np.clip(np.floor(np.log2(magnitude)).astype(np.int32) - 7, 0, 7)
+    mantissa = (magnitude >> (exponent + 3)) & 0x0F
+    encode = (~(sign | (exponent << 4) | mantissa) & 0xFF).astype(np.uint8)
+
+    codes = ~np.arange(256, dtype=np.int32) & 0xFF
+    exponent = (codes >> 4) & 0x07
+    magnitude = (((codes & 0x0F) << 3) + 0x84 << exponent) - 0x84
+    decode = np.where(codes & 0x80, -magnitude, magnitude).astype("<i2")
+    return encode, decode
+
+
+_MULAW_ENCODE, _MULAW_DECODE = _build_mulaw_tables()
+
+
+class MuLawCodec:
+    """G.711 mu-law, 8 bits per sample (2x smaller than PCM16); table lookups only."""
+
+    name = AUDIO_CODEC_MULAW
+
+    def encode(self, pcm: BytesLike) -> bytes:
+        samples = np.frombuffer(pcm, dtype="<u2", count=len(pcm) // 2)
+        return _MULAW_ENCODE[samples].tobytes()
+
+    def decode(self, data: BytesLike) -> bytes:
+        return _MULAW_DECODE[np.frombuffer(data, dtype=np.uint8)].tobytes()
+
+
+_IMA_STEPS = np.array(
+    [
+        7, 8, 9, 10, 11, 12, 13, 14, 16, 17, 19, 21, 23, 25, 28, 31, 34, 37, 41, 45,
+        50, 55, 60, 66, 73, 80, 88, 97, 107, 118, 130, 143, 157, 173, 190, 209, 230,
+        253, 279, 307, 337, 371, 408, 449, 494, 544, 598, 658, 724, 796, 876, 963,
+        1060, 1166, 1282, 1411, 1552, 1707, 1878, 2066, 2272, 2499, 2749, 3024, 3327,
+        3660, 4026, 4428, 4871, 5358, 5894, 6484, 7132, 7845, 8630, 9493, 10442, 11487,
+        12635, 13899, 15289, 16818, 18500, 20350, 22385, 24623, 27086, 29794, 32767,
+    ],
+    dtype=np.int32,
+)
+_IMA_INDEX_ADJUST = np.array([-1, -1, -1, -1, 2, 4, 6, 8], dtype=np.int32)
+
+
+def _build_ima_tables() -> tuple[np.ndarray, np.ndarray]:
+    # Flattened [step_index * 16 + code] -> signed predictor delta / next step index.
+    step = _IMA_STEPS[:, None]
+    code = np.arange(16, dtype=np.int32)[None, :]
+    magnitude = code & 0x07
+    delta = (step >> 3) + np.where(magnitude & 4, step, 0) + np.where(magnitude & 2, step >> 1, 0)
+    delta = delta + np.where(magnitude & 1, step >> 2, 0)
+    delta = np.where(code & 0x08, -delta, delta)
+    index = np.clip(np.arange(89, dtype=np.int32)[:, None] + _IMA_INDEX_ADJUST[magnitude], 0, 88)
+    return delta.astype(np.int32).reshape(-1), (index * 16).astype(np.int32).reshape(-1)
+
+
+_IMA_DELTA, _IMA_NEXT = _build_ima_tables()
+_ADPCM_HEADER_BYTES = 4
+
+
+class ImaAdpcmCodec:
+    """IMA-ADPCM in self-describing blocks, 4 bits per sample (~3.6x smaller than PCM16 at 64-sample blocks).
+
+    Block layout: int16 first sample, u8 step index, u8 sample count - 1, then
+    packed 4-bit codes (low nibble first). Each block starts from its own
+    header, so all blocks of a chunk are coded in parallel: the sample loop
+    runs `block_samples` times with every step vectorized across blocks.
+    Working arrays are preallocated and only grow.
+    """
+
+    name = AUDIO_CODEC_ADPCM
+
+    def __init__(self, block_samples: int = 64) -> None:
+        if not 2 <= block_samples <= 256:
+            raise ValueError("block_samples must be between 2 and 256")
+        self.block_samples = block_samples
+        self._code_bytes = block_samples // 2
+        self.block_bytes = _ADPCM_HEADER_BYTES + self._code_bytes
+        self._blocks = np.zeros((0, block_samples), dtype=np.int32)
+        self._codes = np.zeros((0, self._code_bytes * 2), dtype=np.uint8)
+
+    def _reserve(self, blocks: int) -> None:
+        if self._blocks.shape[0] < blocks:
+            self._blocks = np.zeros((blocks * 2, self.block_samples), dtype=np.int32)
+            self._codes = np.zeros((blocks * 2, self._code_bytes * 2), dtype=np.uint8)
+
+    def encode(self, pcm: BytesLike) -> bytes:
+        samples = np.frombuffer(pcm, dtype="<i2", count=len(pcm) // 2)
+        count = samples.size
+        if count == 0:
+            return b""
+        size = self.block_samples
+        blocks = -(-count // size)
+        last = count - (blocks - 1) * size
+        self._reserve(blocks)
+        x = self._blocks[:blocks]
+        x.reshape(-1)[:count] = samples
+        x.reshape(-1)[count : blocks * size] = samples[-1]
+        codes = self._codes[:blocks]
+        codes[:] = 0
+
+        predictor = x[:, 0].copy()
+        # Start each block at the step size that matches its opening slope.
+        opening = np.abs(np.diff(x[:, : min(size, 9)], axis=1)).mean(axis=1)
+        header_index = np.clip(np.searchsorted(_IMA_STEPS, opening), 0, 88).astype(np.int32)
+        state = header_index * 16  # step index pre-scaled into the table row
+        diff = np.empty(blocks, dtype=np.int32)
+        code = np.empty(blocks, dtype=np.int32)
+        for i in range(1, size):
+            np.subtract(x[:, i], predictor, out=diff)
+            np.less(diff, 0, out=code)
+            np.abs(diff, out=diff)
+            np.left_shift(diff, 2, out=diff)
+            np.floor_divide(diff, _IMA_STEPS[state >> 4], out=diff)
+            np.minimum(diff, 7, out=diff)
+            np.left_shift(code, 3, out=code)
+            np.bitwise_or(code, diff, out=code)
+            np.add(state, code, out=state)
+            np.add(predictor, _IMA_DELTA[state], out=predictor)
+            np.clip(predictor, -32768, 32767, out=predictor)
+            state = _IMA_NEXT[state]
+            codes[:, i - 1] = code
+
+        out = np.empty((blocks, self.block_bytes), dtype=np.uint8)
+        out[:, 0:2] = x[:, 0].astype("<i2").view(np.uint8).reshape(blocks, 2)
+        out[:, 2] = header_index
+        out[:, 3] = size - 1
+        out[-1, 3] = last - 1
+        out[:, 4:] = codes[:, 0::2] | (codes[:, 1::2] << 4)
+        encoded = out.reshape(-1)
+        trimmed = (blocks - 1) * self.block_bytes + _ADPCM_HEADER_BYTES + last // 2
+        return encoded[:trimmed].tobytes()
+
+    def decode(self, data: BytesLike) -> bytes:
+        raw = np.frombuffer(data, dtype=np.uint8)
+        if raw.size < _ADPCM_HEADER_BYTES:
+            return b""
+        blocks = -(-raw.size // self.block_bytes)
+        padded = np.zeros((blocks, self.block_bytes), dtype=np.uint8)
+        padded.reshape(-1)[: raw.size] = raw
+        predictor = padded[:, 0:2].copy().view("<i2").reshape(blocks).astype(np.int32)
+        index = np.minimum(padded[:, 2].astype(np.int32), 88)
+        counts = padded[:, 3].astype(np.int32) + 1
+        packed = padded[:, 4:]
+        codes = np.empty((blocks, self._code_bytes * 2), dtype=np.int32)
+        codes[:, 0::2] = packed & 0x0F
+        codes[:, 1::2] = packed >> 4
+
+        size = self.block_samples
+        out = np.empty((blocks, size), dtype=np.int32)
+        out[:, 0] = predictor
+        state = index * 16
+        for i in range(1, size):
+            np.add(state, codes[:, i - 1], out=state)
+            np.add(predictor, _IMA_DELTA[state], out=predictor)
+            np.clip(predictor, -32768, 32767, out=predictor)
+            state = _IMA_NEXT[state]
+            out[:, i] = predictor
+
+        last = min(int(counts[-1]), size, 1 + 2 * (raw.size - (blocks - 1) * self.block_bytes - _ADPCM_HEADER_BYTES))
+        pcm = np.concatenate((out[:-1].reshape(-1), out[-1, :last]))
+        return pcm.astype("<i2").tobytes()
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import binascii
+from dataclasses import asdict, dataclass
+from typing import Any, Optional, Union
+
+from .adaptive_audio import AdaptiveDownstream
+from .resampler import REALTIME_SAMPLE_RATE
+
+# Client-bound frame durations that line up with common playout buffer sizes.
+OUTPUT_FRAME_MS_CHOICES = (40, 60, 100)
+
+AudioFrames = list[tuple[bytes, int]]
+
+
+@dataclass
+class EgressStats:
+    deltas_in: int = 0
+    frames_out: int = 0
+    flushes: int = 0
+    bytes_in: int = 0
+    discarded_bytes: int = 0
+
+
+class OutputAudioCoalescer:
+    """Re-frames irregular OpenAI audio deltas into fixed `frame_ms` client frames.
+
+    Deltas are decoded straight into one reusable bytearray and whole frames are
+    cut from it, so the client sees one message per frame instead of one per
+    delta. Only the tail of a response is shorter: callers `flush()` on
+    `response.audio.done` / `response.done`. Returns `(pcm, sample_rate)` pairs.
+    With an AdaptiveDownstream the audio is converted to its current level
+    first and the frame grows to the level's `chunk_ms`; a rate change flushes
+    what was buffered at the old rate. `stream` names this source's downsampler
+    in the shared AdaptiveDownstream; `end_response()` flushes and resets it.
+    """
+
+    def __init__(
+        self,
+        frame_ms: int = 100,
+        *,
+        sample_rate: int = REALTIME_SAMPLE_RATE,
+        downstream: Optional[AdaptiveDownstream] = None,
+        stream: str = "relay",
+    ) -> None:
+        if frame_ms <= 0:
+            raise ValueError("frame_ms must be positive")
+        self.frame_ms = frame_ms
+        self.sample_rate = sample_rate
+        self.downstream = downstream
+        self.stream = stream
+        self._buffer = bytearray()
+        self.stats = EgressStats()
+
+    @property
+    def buffered_bytes(self) -> int:
+        return len(self._buffer)
+
+    def push_base64(self, delta: str) -> AudioFrames:
+        try:
+            pcm = binascii.a2b_base64(delta)
+        except binascii.Error:
+            return []
+        return self.push(pcm)
+
+    def push(self, pcm: Union[bytes, bytearray, memoryview], sample_rate: int = REALTIME_SAMPLE_RATE) -> AudioFrames:
+        self.stats.deltas_in += 1
+        self.stats.bytes_in += len(pcm)
+        frame_ms = self.frame_ms
+        if self.downstream is not None:
+            pcm, sample_rate = self.downstream.convert(pcm, sample_rate, self.stream)
+            frame_ms = max(frame_ms, self.downstream.level.chunk_ms)
+        frames = self.flush() if sample_rate != self.sample_rate else []
+        self.sample_rate = sample_rate
+
+        buffer = self._buffer
+        buffer += pcm
+        frame_bytes = max(1, sample_rate * frame_ms // 1000) * 2
+        count = len(buffer) // frame_bytes
+        if count:
+            frames.extend(
+                (bytes(buffer[i * frame_bytes : (i + 1) * frame_bytes]), sample_rate) for i in range(count)
+            )
+            del buffer[: count * frame_bytes]
+            self.stats.frames_out += count
+        return frames
+
+    def flush(self) -> AudioFrames:
+        if not self._buffer:
+            return []
+        frame = bytes(self._buffer)
+        self._buffer.clear()
+        self.stats.frames_out += 1
+        self.stats.flushes += 1
+        return [(frame, self.sample_rate)]
+
+    def end_response(self) -> AudioFrames:
+        frames = self.flush()
+        if self.downstream is not None:
+            self.downstream.end_stream(self.stream)
+        return frames
+
+    def discard(self) -> None:
+        self.stats.discarded_bytes += len(self._buffer)
+        self._buffer.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        data = asdict(self.stats)
+        frames = self.stats.frames_out
+        data["deltas_per_frame"] = self.stats.deltas_in / frames if frames else 0.0
+        return data
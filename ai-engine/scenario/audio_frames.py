@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import base64
+import struct
+from dataclasses import dataclass
+from typing import Any, Optional, Union
+
+from .audio_codecs import AUDIO_CODEC_PCM16, build_audio_codec
+from .json_codec import JsonCodec, get_json_codec
+
+AUDIO_TRANSPORT_JSON = "json"
+AUDIO_TRANSPORT_BINARY = "binary"
+AUDIO_TRANSPORTS = (AUDIO_TRANSPORT_JSON, AUDIO_TRANSPORT_BINARY)
+
+# version (u8), frame type (u8), sequence (u32), sample rate (u32), then audio in the
+# negotiated codec (PCM16 LE unless the client asked for mulaw/adpcm).
+FRAME_HEADER = struct.Struct("<BBII")
+FRAME_VERSION = 1
+FRAME_INPUT_AUDIO = 0x01
+FRAME_OUTPUT_AUDIO = 0x02
+
+# Client-bound events whose `delta` becomes a binary frame on the binary transport.
+OUTPUT_AUDIO_EVENT_TYPES = frozenset({"audio.delta", "response.audio.delta"})
+
+
+@dataclass(frozen=True)
+class AudioFrame:
+    frame_type: int
+    seq: int
+    sample_rate: int
+    payload: memoryview
+
+
+def negotiate_audio_transport(requested: Optional[str]) -> str:
+    if isinstance(requested, str) and requested.strip().lower() == AUDIO_TRANSPORT_BINARY:
+        return AUDIO_TRANSPORT_BINARY
+    return AUDIO_TRANSPORT_JSON
+
+
+def encode_audio_frame(frame_type: int, seq: int, sample_rate: int, pcm: bytes) -> bytes:
+    return FRAME_HEADER.pack(FRAME_VERSION, frame_type, seq & 0xFFFFFFFF, sample_rate) + pcm
+
+
+def decode_audio_frame(data: Union[bytes, bytearray, memoryview], codec: str = AUDIO_CODEC_PCM16) -> AudioFrame:
+    view = memoryview(data)
+    if len(view) < FRAME_HEADER.size:
+        raise ValueError("audio frame shorter than header")
+    version, frame_type, seq, sample_rate = FRAME_HEADER.unpack_from(view)
+    if version != FRAME_VERSION:
+        raise ValueError(f"unsupported audio frame version: {version}")
+    payload = view[FRAME_HEADER.size:]
+    if codec == AUDIO_CODEC_PCM16 and len(payload) % 2:
+        raise ValueError("PCM16 payload has an odd byte count")
+    return AudioFrame(frame_type=frame_type, seq=seq, sample_rate=sample_rate, payload=payload)
+
+
+class ClientAudioWire:
+    """Serializes client-bound events for the transport negotiated at connect time.
+
+    Audio deltas may carry either raw PCM16 bytes or base64 text; the wire
+    converts only when the transport or codec needs the other form, so JSON
+    PCM16 clients keep the existing `{"type": ..., "delta": "<base64>"}` messages.
+    The codec applies to the client link only; OpenAI always sees PCM16.
+    """
+
+    def __init__(
+        self,
+        transport: str = AUDIO_TRANSPORT_JSON,
+        codec: Optional[str] = None,
+        *,
+        default_sample_rate: int = 24000,
+        json_codec: Optional[JsonCodec] = None,
+    ) -> None:
+        self.transport = negotiate_audio_transport(transport)
+        self.codec = build_audio_codec(codec)
+        self._output_codec = build_audio_codec(codec)  # separate working buffers per direction
+        self._default_sample_rate = default_sample_rate
+        self._json = json_codec or get_json_codec()
+        self._seq = 0
+
+    @property
+    def binary(self) -> bool:
+        return self.transport == AUDIO_TRANSPORT_BINARY
+
+    @property
+    def pcm16(self) -> bool:
+        return self.codec.name == AUDIO_CODEC_PCM16
+
+    def decode_input(self, data: Union[bytes, bytearray, memoryview]) -> bytes:
+        """Client input audio in the negotiated codec -> PCM16."""
+        return self.codec.decode(data)
+
+    def encode(self, payload: dict[str, Any]) -> Union[str, bytes]:
+        if payload.get("type") in OUTPUT_AUDIO_EVENT_TYPES:
+            delta = payload.get("delta")
+            if not self.pcm16:
+                pcm = base64.b64decode(delta) if isinstance(delta, str) else bytes(delta or b"")
+                delta = self._output_codec.encode(pcm)
+            if self.binary:
+                data = base64.b64decode(delta) if isinstance(delta, str) else bytes(delta or b"")
+                frame = encode_audio_frame(
+                    FRAME_OUTPUT_AUDIO,
+                    self._seq,
+                    payload.get("sample_rate") or self._default_sample_rate,
+                    data,
+                )
+                self._seq += 1
+                return frame
+            if isinstance(delta, (bytes, bytearray, memoryview)):
+                payload = {**payload, "delta": base64.b64encode(delta).decode("ascii")}
+        return self._json.dumps_event(payload)
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import asyncio
+import binascii
+import re
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Optional
+
+AppendSender = Callable[[str], Awaitable[None]]
+
+_B64_BODY = re.compile(r"[A-Za-z0-9+/]*")
+_B64_TAIL = re.compile(r"[A-Za-z0-9+/]*={0,2}")
+_SAMPLE_CHARS = 64
+
+
+def base64_decoded_length(data: str) -> int:
+    """Decoded byte length of base64 `data` without decoding it; -1 if malformed.
+
+    Length and padding are checked exactly. The alphabet is checked on the
+    head, middle and tail windows only, which bounds the cost per frame;
+    OpenAI decodes the full payload and rejects anything the sample missed.
+    """
+    size = len(data)
+    if size == 0:
+        return 0
+    if size % 4 or not data.isascii():
+        return -1
+    window = _SAMPLE_CHARS
+    if size <= 3 * window:
+        if not _B64_TAIL.fullmatch(data):
+            return -1
+    else:
+        middle = (size - window) // 2
+        if (
+            not _B64_BODY.fullmatch(data, 0, window)
+            or not _B64_BODY.fullmatch(data, middle, middle + window)
+            or not _B64_TAIL.fullmatch(data, size - window)
+        ):
+            return -1
+    padding = 2 if data.endswith("==") else 1 if data.endswith("=") else 0
+    return size // 4 * 3 - padding
+
+
+@dataclass
+class IngressStats:
+    chunks_in: int = 0
+    frames_out: int = 0
+    bytes_in: int = 0
+    added_latency_max_ms: float = 0.0
+    added_latency_total_ms: float = 0.0
+
+
+class InputAudioAggregator:
+    """Merges small client audio chunks into `frame_ms` upstream appends.
+
+    A frame goes out as soon as it is full, or `max_delay_ms` after its first
+    chunk arrived, so the added latency is bounded by `max_delay_ms`. Callers
+    `flush()` before commits and on speech boundaries. Unpadded base64 chunks
+    are joined as text; a padded chunk or raw PCM switches the pending frame to
+    bytes and it is re-encoded once at flush. `frame_ms=0` forwards every
+    chunk as-is.
+    """
+
+    def __init__(
+        self,
+        send: AppendSender,
+        *,
+        frame_ms: int = 100,
+        max_delay_ms: Optional[int] = None,
+        sample_rate: int = 24000,
+    ) -> None:
+        self._send = send
+        self.frame_ms = max(0, frame_ms)
+        self.max_delay_ms = self.frame_ms if max_delay_ms is None else max(0, max_delay_ms)
+        self.sample_rate = sample_rate
+        self._parts: list[str] = []
+        self._pcm: Optional[bytearray] = None
+        self._pending_bytes = 0
+        self._first_at: Optional[float] = None
+        self._timer: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+        self.stats = IngressStats()
+
+    @property
+    def frame_bytes(self) -> int:
+        return int(self.sample_rate * self.frame_ms / 1000) * 2
+
+    @property
+    def pending_bytes(self) -> int:
+        return self._pending_bytes
+
+    async def add_base64(self, audio: str, decoded_len: Optional[int] = None) -> None:
+        if decoded_len is None:
+            decoded_len = base64_decoded_length(audio)
+        if decoded_len <= 0:
+            return
+        if self._pcm is None and not audio.endswith("="):
+            self._parts.append(audio)
+        else:
+            self._to_pcm().extend(binascii.a2b_base64(audio))
+        await self._added(decoded_len)
+
+    async def add_pcm(self, pcm: bytes) -> None:
+        if not pcm:
+            return
+        self._to_pcm().extend(pcm)
+        await self._added(len(pcm))
+
+    async def flush(self) -> None:
+        self._cancel_timer()
+        async with self._lock:
+            if not self._pending_bytes:
+                return
+            if self._pcm is not None:
+                audio = binascii.b2a_base64(self._pcm, newline=False).decode("ascii")
+            else:
+                audio = "".join(self._parts)
+            added_ms = (time.perf_counter() - self._first_at) * 1000.0 if self._first_at is not None else 0.0
+            self._reset()
+            self.stats.frames_out += 1
+            self.stats.added_latency_total_ms += added_ms
+            if added_ms > self.stats.added_latency_max_ms:
+                self.stats.added_latency_max_ms = added_ms
+            await self._send(audio)
+
+    def discard(self) -> None:
+        self._cancel_timer()
+        self._reset()
+
+    def close(self) -> None:
+        self.discard()
+
+    def snapshot(self) -> dict[str, Any]:
+        data = asdict(self.stats)
+        frames = self.stats.frames_out
+        data["added_latency_mean_ms"] = self.stats.added_latency_total_ms / frames if frames else 0.0
+        data["chunks_per_frame"] = self.stats.chunks_in / frames if frames else 0.0
+        return data
+
+    async def _added(self, size: int) -> None:
+        self.stats.chunks_in += 1
+        self.stats.bytes_in += size
+        self._pending_bytes += size
+        if self._first_at is None:
+            self._first_at = time.perf_counter()
+        if self._pending_bytes >= self.frame_bytes or self.max_delay_ms == 0:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_after(self.max_delay_ms / 1000.0))
+
+    async def _flush_after(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        self._timer = None
+        await self.flush()
+
+    def _to_pcm(self) -> bytearray:
+        if self._pcm is None:
+            self._pcm = bytearray(binascii.a2b_base64("".join(self._parts))) if self._parts else bytearray()
+            self._parts.clear()
+        return self._pcm
+
+    def _reset(self) -> None:
+        self._parts = []
+        self._pcm = None
+        self._pending_bytes = 0
+        self._first_at = None
+
+    def _cancel_timer(self) -> None:
+        timer, self._timer = self._timer, None
+        if timer is not None and timer is not asyncio.current_task():
+            timer.cancel()
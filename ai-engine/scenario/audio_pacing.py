@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+
+@dataclass(frozen=True)
+class AudioPacingConfig:
+    chunk_ms: int = 100
+    initial_burst_ms: int = 300
+
+    def chunk_bytes(self, sample_rate: int, sample_width: int = 2) -> int:
+        frames = max(1, int(sample_rate * self.chunk_ms / 1000))
+        return frames * sample_width
+
+
+class AudioPacer:
+    """Paces audio sends against a monotonic clock instead of per-chunk sleeps.
+
+    Every chunk gets an absolute deadline `epoch + audio_sent - initial_burst`,
+    so send time and scheduler jitter never accumulate: a late wake-up only
+    shortens the next wait. The first `initial_burst_ms` of audio goes out
+    immediately to fill the client's jitter buffer. Deadlines are absolute, so
+    any number of pacers can share one event loop without drifting.
+    """
+
+    def __init__(
+        self,
+        initial_burst_ms: int = 300,
+        *,
+        clock: Optional[Callable[[], float]] = None,
+    ) -> None:
+        self._burst_sec = max(0, initial_burst_ms) / 1000.0
+        self._clock = clock
+        self._epoch: Optional[float] = None
+        self._sent_sec = 0.0
+
+    @property
+    def audio_sent_sec(self) -> float:
+        return self._sent_sec
+
+    def now(self) -> float:
+        if self._clock is not None:
+            return self._clock()
+        return asyncio.get_running_loop().time()
+
+    def start(self) -> None:
+        self._epoch = self.now()
+        self._sent_sec = 0.0
+
+    def next_deadline(self) -> float:
+        if self._epoch is None:
+            self.start()
+        return self._epoch + self._sent_sec - self._burst_sec
+
+    def lag(self) -> float:
+        """Seconds the sender is behind its schedule (negative when ahead)."""
+        return self.now() - self.next_deadline()
+
+    async def wait_turn(self) -> None:
+        delay = self.next_deadline() - self.now()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def advance(self, duration_sec: float) -> None:
+        if self._epoch is None:
+            self.start()
+        self._sent_sec += duration_sec
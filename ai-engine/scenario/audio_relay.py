@@ -4,10 +4,23 @@ import base64
 import binascii
 from typing import Any, Awaitable, Callable, Optional, Union
 
+from .audio_egress import OutputAudioCoalescer
+from .transcript_coalescer import TranscriptDeltaCoalescer
 
 AudioChunkHandler = Callable[[bytes], Union[Awaitable[None], None]]
 AudioChunkBase64Handler = Callable[[str], Union[Awaitable[None], None]]
 TranscriptHandler = Callable[[str, bool], Union[Awaitable[None], None]]
+AudioFrameHandler = Callable[[bytes, int], Union[Awaitable[None], None]]
+
+# Events after which no more audio arrives for the response (done or cancelled).
+AUDIO_FLUSH_EVENT_TYPES = frozenset({"response.audio.done", "response.done"})
+
+# Everything handle_event reacts to besides response.audio.delta, which only needs its `delta`.
+RELAY_EVENT_TYPES = (
+    "response.audio_transcript.delta",
+    "response.audio_transcript.done",
+    *sorted(AUDIO_FLUSH_EVENT_TYPES),
+)
 
 
 class RealtimeAudioRelay:
@@ -17,10 +30,18 @@ class RealtimeAudioRelay:
         on_audio_chunk: Optional[AudioChunkHandler] = None,
         on_audio_chunk_base64: Optional[AudioChunkBase64Handler] = None,
         on_transcript: Optional[TranscriptHandler] = None,
+        on_audio_frame: Optional[AudioFrameHandler] = None,
+        coalescer: Optional[OutputAudioCoalescer] = None,
+        transcript_coalescer: Optional[TranscriptDeltaCoalescer] = None,
     ) -> None:
         self._on_audio_chunk = on_audio_chunk
         self._on_audio_chunk_base64 = on_audio_chunk_base64
         self._on_transcript = on_transcript
+        # Fixed-duration frames (pcm, sample_rate) instead of one callback per delta.
+        self._on_audio_frame = on_audio_frame
+        self._coalescer = coalescer if on_audio_frame is not None else None
+        # Merged transcript deltas; the coalescer's sender delivers them as non-final transcripts.
+        self._transcript_coalescer = transcript_coalescer
 
     async def handle_event(self, event: dict[str, Any]) -> None:
         event_type = event.get("type", "")
@@ -28,7 +49,10 @@ class RealtimeAudioRelay:
         if event_type == "response.audio.delta":
             await self._handle_audio_delta(event)
             return
-        if event_type == "response.audio.done":
+        if event_type in AUDIO_FLUSH_EVENT_TYPES:
+            await self.flush_audio()
+            if event_type == "response.done" and self._transcript_coalescer is not None:
+                await self._transcript_coalescer.end_response()
             return
         if event_type == "response.audio_transcript.delta":
             await self._handle_transcript(event, is_final=False)
@@ -40,6 +64,8 @@ class RealtimeAudioRelay:
         chunk_base64 = event.get("delta") or event.get("audio")
         if not isinstance(chunk_base64, str) or not chunk_base64:
             return
+        if self._coalescer is not None:
+            await self._emit_frames(self._coalescer.push_base64(chunk_base64))
         if self._on_audio_chunk_base64 is not None:
             result = self._on_audio_chunk_base64(chunk_base64)
             if hasattr(result, "__await__"):
@@ -53,12 +79,27 @@ class RealtimeAudioRelay:
             if hasattr(result, "__await__"):
                 await result
 
+    async def flush_audio(self) -> None:
+        if self._coalescer is not None:
+            await self._emit_frames(self._coalescer.end_response())
+
+    async def _emit_frames(self, frames: list[tuple[bytes, int]]) -> None:
+        for pcm, sample_rate in frames:
+            result = self._on_audio_frame(pcm, sample_rate)
+            if hasattr(result, "__await__"):
+                await result
+
     async def _handle_transcript(self, event: dict[str, Any], *, is_final: bool) -> None:
         transcript = event.get("transcript_delta") or event.get("transcript")
         if not isinstance(transcript, str) or not transcript:
             return
         if self._on_transcript is None:
             return
+        if self._transcript_coalescer is not None:
+            if not is_final:
+                await self._transcript_coalescer.add(transcript)
+                return
+            await self._transcript_coalescer.end_response()
         result = self._on_transcript(transcript, is_final)
         if hasattr(result, "__await__"):
             await result
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Optional
+
+ClientSend = Callable[[dict[str, Any]], Awaitable[None]]
+
+# Audio frames are droppable: once the client is this far behind, the oldest
+# queued frame is already stale.
+DROPPABLE_EVENT_TYPES = frozenset({"audio.delta", "response.audio.delta"})
+
+# Transcript deltas merge into the queued delta right before them; the value is
+# the payload field that carries the text.
+COALESCIBLE_EVENT_FIELDS = {
+    "transcript.delta": "delta",
+    "response.audio_transcript.delta": "transcript_delta",
+}
+
+# Done markers that close an audio-lane stream; they must follow their own
+# queued deltas, so they ride the audio lane too.
+AUDIO_LANE_DONE_EVENT_TYPES = frozenset(
+    {"audio.done", "response.audio.done", "transcript.done", "response.audio_transcript.done"}
+)
+
+# The audio lane keeps the response stream in order (deltas, their transcript,
+# then the done marker). Everything else is a control event and jumps ahead.
+AUDIO_LANE_EVENT_TYPES = DROPPABLE_EVENT_TYPES | frozenset(COALESCIBLE_EVENT_FIELDS) | AUDIO_LANE_DONE_EVENT_TYPES
+
+
+@dataclass
+class OutboundStats:
+    sent: int = 0
+    dropped_audio: int = 0
+    coalesced_transcripts: int = 0
+    depth: int = 0
+    max_depth_seen: int = 0
+    overflow_events: int = 0
+    control_sent: int = 0
+    control_wait_max_ms: float = 0.0
+
+
+class ClientOutboundQueue:
+    """Bounded per-client send queue drained by a dedicated writer task.
+
+    `put()` never blocks, so the upstream read loop keeps consuming OpenAI
+    events however slow the client link is. Events go into one of two lanes:
+    control events (`speech.started`, `error`, ...) are always written before
+    anything waiting in the audio lane, and audio, transcript deltas and their
+    done markers keep their order within that lane. When the queue is full the oldest queued
+    audio frame is dropped; control events are never dropped and may exceed
+    the bound. Consecutive transcript deltas are merged.
+    """
+
+    def __init__(
+        self,
+        send: ClientSend,
+        *,
+        max_depth: int = 200,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        self._send = send
+        self._max_depth = max(1, max_depth)
+        self._logger = logger or logging.getLogger(__name__)
+        self._control: deque[tuple[float, dict[str, Any]]] = deque()
+        self._audio: deque[dict[str, Any]] = deque()
+        self._audio_queued = 0
+        self._wakeup = asyncio.Event()
+        self._writer: Optional[asyncio.Task] = None
+        self._closed = False
+        self.stats = OutboundStats()
+
+    @property
+    def depth(self) -> int:
+        return len(self._control) + len(self._audio)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def start(self) -> None:
+        if self._writer is None:
+            self._writer = asyncio.create_task(self._run())
+
+    def put(self, payload: dict[str, Any]) -> bool:
+        if self._closed:
+            return False
+        if not isinstance(payload, dict):
+            self._logger.warning("Dropping non-event client payload: %r", payload)
+            return False
+        event_type = payload.get("type")
+        if event_type in COALESCIBLE_EVENT_FIELDS and self._coalesce(event_type, payload):
+            return True
+        if self.depth >= self._max_depth:
+            self.stats.overflow_events += 1
+            if event_type in DROPPABLE_EVENT_TYPES and self._audio_queued == 0:
+                self.stats.dropped_audio += 1
+                return False
+            self._drop_oldest_audio()
+        if event_type in AUDIO_LANE_EVENT_TYPES:
+            self._audio.append(payload)
+            if event_type in DROPPABLE_EVENT_TYPES:
+                self._audio_queued += 1
+        else:
+            self._control.append((time.perf_counter(), payload))
+        self._update_depth()
+        self._wakeup.set()
+        return True
+
+    async def close(self, *, drain_timeout: float = 2.0) -> None:
+        if self._writer is None:
+            self._closed = True
+            return
+        self._closed = True
+        self._wakeup.set()
+        try:
+            await asyncio.wait_for(asyncio.shield(self._writer), timeout=drain_timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            self._writer.cancel()
+        except Exception:
+            pass
+        self._writer = None
+
+    def snapshot(self) -> dict[str, Any]:
+        return asdict(self.stats)
+
+    async def _run(self) -> None:
+        while True:
+            if self._control:
+                queued_at, payload = self._control.popleft()
+                wait_ms = (time.perf_counter() - queued_at) * 1000.0
+                if wait_ms > self.stats.control_wait_max_ms:
+                    self.stats.control_wait_max_ms = wait_ms
+                self.stats.control_sent += 1
+            elif self._audio:
+                payload = self._audio.popleft()
+                if payload.get("type") in DROPPABLE_EVENT_TYPES:
+                    self._audio_queued -= 1
+            elif self._closed:
+                return
+            else:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            self._update_depth()
+            try:
+                await self._send(payload)
+            except Exception as exc:
+                self._logger.warning("Client send failed, stopping writer: %s", exc)
+                self._closed = True
+                self._control.clear()
+                self._audio.clear()
+                self._audio_queued = 0
+                self._update_depth()
+                return
+            self.stats.sent += 1
+
+    def _coalesce(self, event_type: str, payload: dict[str, Any]) -> bool:
+        if not self._audio:
+            return False
+        tail = self._audio[-1]
+        if tail.get("type") != event_type:
+            return False
+        field = COALESCIBLE_EVENT_FIELDS[event_type]
+        head_text, new_text = tail.get(field), payload.get(field)
+        if not isinstance(head_text, str) or not isinstance(new_text, str):
+            return False
+        self._audio[-1] = {**tail, field: head_text + new_text}
+        self.stats.coalesced_transcripts += 1
+        return True
+
+    def _drop_oldest_audio(self) -> None:
+        if self._audio_queued == 0:
+            return
+        for index, queued in enumerate(self._audio):
+            if queued.get("type") in DROPPABLE_EVENT_TYPES:
+                del self._audio[index]
+                self._audio_queued -= 1
+                self.stats.dropped_audio += 1
+                return
+
+    def _update_depth(self) -> None:
+        depth = self.depth
+        self.stats.depth = depth
+        if depth > self.stats.max_depth_seen:
+            self.stats.max_depth_seen = depth
@@ -0,0 +1,338 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Optional, Protocol
+
+from .config import AppConfig
+from .session_pool import _percentile
+
+COMPLETION_PENDING = "pending"
+COMPLETION_PERSISTED = "persisted"
+COMPLETION_FAILED = "failed"
+
+
+@dataclass
+class CompletionJob:
+    session_id: str
+    scenario_state: dict[str, Any]
+    transcripts: list[str]
+    fallback_title: str
+    user_id: Optional[int] = None
+    config: Optional[AppConfig] = None
+    enqueued_at: float = field(default_factory=time.monotonic)
+    # Set once the session row is stored; a recovered job with it set only needs its title.
+    persisted: bool = False
+    # Called once when persisting gives up (e.g. to tell a still-connected client).
+    on_failed: Optional[Callable[["CompletionJob"], Awaitable[None]]] = field(default=None, repr=False)
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            "session_id": self.session_id,
+            "scenario_state": self.scenario_state,
+            "transcripts": self.transcripts,
+            "fallback_title": self.fallback_title,
+            "user_id": self.user_id,
+        }
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any], *, persisted: bool = False) -> "CompletionJob":
+        return cls(
+            session_id=payload["session_id"],
+            scenario_state=payload.get("scenario_state") or {},
+            transcripts=list(payload.get("transcripts") or []),
+            fallback_title=payload.get("fallback_title") or "",
+            user_id=payload.get("user_id"),
+            persisted=persisted,
+        )
+
+
+class CompletionOutbox(Protocol):
+    """Durable record of accepted jobs, written before the client hears `scenario.completed`."""
+
+    async def add(self, job: CompletionJob) -> None:
+        ...
+
+    async def mark(self, session_id: str, status: str, error: Optional[str] = None) -> None:
+        ...
+
+    async def remove(self, session_id: str) -> None:
+        ...
+
+    async def unfinished(self) -> list[CompletionJob]:
+        """Jobs still pending or persisted-but-untitled, oldest first."""
+        ...
+
+
+PersistFn = Callable[[CompletionJob], Awaitable[None]]
+TitleFn = Callable[[CompletionJob], Awaitable[str]]
+BackfillFn = Callable[[str, str], Awaitable[None]]
+
+
+@dataclass
+class CompletionQueueMetrics:
+    submitted: int = 0
+    recovered: int = 0
+    persisted: int = 0
+    titled: int = 0
+    retries: int = 0
+    failed: int = 0
+    dropped: int = 0
+    max_queue_len: int = 0
+    persist_ms: deque = field(default_factory=lambda: deque(maxlen=256))
+    title_ms: deque = field(default_factory=lambda: deque(maxlen=256))
+
+    def snapshot(self) -> dict[str, Any]:
+        persist = sorted(self.persist_ms)
+        title = sorted(self.title_ms)
+        return {
+            "submitted": self.submitted,
+            "recovered": self.recovered,
+            "persisted": self.persisted,
+            "titled": self.titled,
+            "retries": self.retries,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "max_queue_len": self.max_queue_len,
+            "persist_ms_p50": _percentile(persist, 0.5),
+            "persist_ms_p95": _percentile(persist, 0.95),
+            "title_ms_p50": _percentile(title, 0.5),
+            "title_ms_p95": _percentile(title, 0.95),
+        }
+
+
+class ScenarioCompletionQueue:
+    """Post-completion work (persist, then title) run off the client's critical path.
+
+    Each job first stores the session under its fallback title, then asks for a
+    generated title and backfills it. Both steps are retried `max_attempts`
+    times with exponential backoff; a title that never arrives leaves the
+    fallback in place. A persist that never succeeds marks the job failed:
+    `wait_persisted()` reports it and the job's `on_failed` hook runs.
+
+    With an `outbox`, `submit()` records the job durably before returning, each
+    step updates the record, and `start()` resumes unfinished records, so a
+    restart or a `close()` that cuts work short loses nothing. Without one, jobs
+    live in process memory only. Jobs interrupted or still queued at `close()`
+    (after up to `drain_timeout`) count as `dropped`.
+    """
+
+    def __init__(
+        self,
+        *,
+        persist: PersistFn,
+        generate_title: TitleFn,
+        backfill_title: BackfillFn,
+        outbox: Optional[CompletionOutbox] = None,
+        workers: int = 2,
+        max_attempts: int = 3,
+        retry_delay_sec: float = 0.5,
+        drain_timeout: float = 10.0,
+        recent_statuses: int = 1024,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        self._persist = persist
+        self._generate_title = generate_title
+        self._backfill_title = backfill_title
+        self._outbox = outbox
+        self._workers = max(1, workers)
+        self._max_attempts = max(1, max_attempts)
+        self._retry_delay_sec = retry_delay_sec
+        self._drain_timeout = drain_timeout
+        self._recent_limit = max(1, recent_statuses)
+        self._logger = logger or logging.getLogger(__name__)
+        self._queue: asyncio.Queue[CompletionJob] = asyncio.Queue()
+        self._pending: dict[str, asyncio.Future[str]] = {}
+        # Outcome of recently finished jobs, for readers that ask after the job settled.
+        self._recent: OrderedDict[str, str] = OrderedDict()
+        self._tasks: list[asyncio.Task] = []
+        self._recovery: Optional[asyncio.Task] = None
+        self.metrics = CompletionQueueMetrics()
+
+    def start(self) -> None:
+        if not self._tasks:
+            self._tasks = [asyncio.create_task(self._worker()) for _ in range(self._workers)]
+            if self._outbox is not None:
+                self._recovery = asyncio.create_task(self._recover())
+                self._tasks.append(self._recovery)
+
+    async def submit(self, job: CompletionJob) -> int:
+        """Record the job in the outbox and queue it; returns the queue length after it."""
+        self.start()
+        if self._outbox is not None:
+            try:
+                await self._outbox.add(job)
+            except Exception as exc:
+                self._logger.error("Scenario outbox write failed [%s], job kept in memory: %s", job.session_id, exc)
+        self._enqueue(job)
+        self.metrics.submitted += 1
+        return self._queue.qsize()
+
+    def queue_len(self) -> int:
+        return self._queue.qsize()
+
+    def status(self, session_id: str) -> Optional[str]:
+        """COMPLETION_PENDING / PERSISTED / FAILED for sessions seen recently; None otherwise."""
+        if session_id in self._pending:
+            return COMPLETION_PENDING
+        return self._recent.get(session_id)
+
+    async def wait_persisted(self, session_id: str, timeout: float = 5.0) -> Optional[str]:
+        """Wait for a queued session to be stored.
+
+        Returns COMPLETION_PERSISTED, COMPLETION_FAILED, COMPLETION_PENDING when the
+        wait times out (or the queue closed first), or None when the session is unknown.
+        """
+        future = self._pending.get(session_id)
+        if future is None and self._recovery is not None and not self._recovery.done():
+            # Right after a restart the session may still be on its way back from the outbox.
+            await asyncio.wait({self._recovery}, timeout=timeout)
+            future = self._pending.get(session_id)
+        if future is None:
+            return self._recent.get(session_id)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            return COMPLETION_PENDING
+
+    async def close(self) -> None:
+        if self._tasks:
+            try:
+                await asyncio.wait_for(self._queue.join(), self._drain_timeout)
+            except asyncio.TimeoutError:
+                pass
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._recovery = None
+        while not self._queue.empty():
+            job = self._queue.get_nowait()
+            self._drop(job, "queued")
+        for future in self._pending.values():
+            if not future.done():
+                future.set_result(COMPLETION_PENDING)
+        self._pending.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        data = self.metrics.snapshot()
+        data["queue_len"] = self._queue.qsize()
+        return data
+
+    def _enqueue(self, job: CompletionJob) -> None:
+        if not job.persisted:
+            self._pending.setdefault(job.session_id, asyncio.get_running_loop().create_future())
+        self._queue.put_nowait(job)
+        self.metrics.max_queue_len = max(self.metrics.max_queue_len, self._queue.qsize())
+
+    async def _recover(self) -> None:
+        try:
+            jobs = await self._outbox.unfinished()
+        except Exception as exc:
+            self._logger.error("Scenario outbox recovery failed: %s", exc)
+            return
+        for job in jobs:
+            if job.session_id in self._pending:
+                continue
+            self._enqueue(job)
+            self.metrics.recovered += 1
+        if jobs:
+            self._logger.info("Scenario completions resumed from outbox: %d", len(jobs))
+
+    def _drop(self, job: CompletionJob, stage: str) -> None:
+        self.metrics.dropped += 1
+        if self._outbox is not None:
+            self._logger.warning(
+                "Scenario completion %s at shutdown, left in outbox: %s", stage, job.session_id
+            )
+        else:
+            self._logger.error("Scenario completion dropped on shutdown (%s): %s", stage, job.session_id)
+
+    def _settle(self, session_id: str, status: str) -> None:
+        self._recent[session_id] = status
+        self._recent.move_to_end(session_id)
+        while len(self._recent) > self._recent_limit:
+            self._recent.popitem(last=False)
+        future = self._pending.pop(session_id, None)
+        if future is not None and not future.done():
+            future.set_result(status)
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._process(job)
+            except asyncio.CancelledError:
+                self._drop(job, "interrupted")
+                raise
+            except Exception:
+                self._logger.exception("Scenario completion failed: %s", job.session_id)
+            finally:
+                self._queue.task_done()
+
+    async def _process(self, job: CompletionJob) -> None:
+        if not job.persisted:
+            error = await self._retry("persist", job, lambda: self._persist(job))
+            if error is not None:
+                await self._fail(job, error)
+                return
+            job.persisted = True
+            self.metrics.persisted += 1
+            self.metrics.persist_ms.append((time.monotonic() - job.enqueued_at) * 1000.0)
+            self._settle(job.session_id, COMPLETION_PERSISTED)
+            await self._record("mark", job.session_id, lambda: self._outbox.mark(job.session_id, COMPLETION_PERSISTED))
+
+        async def backfill() -> None:
+            title = await self._generate_title(job)
+            if title and title != job.fallback_title:
+                await self._backfill_title(job.session_id, title)
+
+        if await self._retry("title", job, backfill) is None:
+            self.metrics.titled += 1
+            self.metrics.title_ms.append((time.monotonic() - job.enqueued_at) * 1000.0)
+        # Title failures keep the fallback title; either way the job is finished.
+        await self._record("remove", job.session_id, lambda: self._outbox.remove(job.session_id))
+
+    async def _fail(self, job: CompletionJob, error: Exception) -> None:
+        self.metrics.failed += 1
+        self._settle(job.session_id, COMPLETION_FAILED)
+        # The record stays (as failed, not resumed) so the lost session can be found and replayed.
+        await self._record(
+            "mark", job.session_id, lambda: self._outbox.mark(job.session_id, COMPLETION_FAILED, str(error))
+        )
+        if job.on_failed is not None:
+            try:
+                await job.on_failed(job)
+            except Exception as exc:
+                self._logger.warning("Scenario save_failed notice not delivered [%s]: %s", job.session_id, exc)
+
+    async def _record(self, step: str, session_id: str, call: Callable[[], Awaitable[None]]) -> None:
+        if self._outbox is None:
+            return
+        try:
+            await call()
+        except Exception as exc:
+            # A stale record is only replayed; persist and title backfill are idempotent.
+            self._logger.warning("Scenario outbox %s failed [%s]: %s", step, session_id, exc)
+
+    async def _retry(
+        self, step: str, job: CompletionJob, call: Callable[[], Awaitable[None]]
+    ) -> Optional[Exception]:
+        """None on success, otherwise the last error after `max_attempts`."""
+        for attempt in range(1, self._max_attempts + 1):
+            try:
+                await call()
+                return None
+            except Exception as exc:
+                if attempt == self._max_attempts:
+                    self._logger.error(
+                        "Scenario %s failed [%s] after %d attempts: %s", step, job.session_id, attempt, exc
+                    )
+                    return exc
+                self.metrics.retries += 1
+                self._logger.warning("Scenario %s retry [%s] (%d): %s", step, job.session_id, attempt, exc)
+                await asyncio.sleep(self._retry_delay_sec * 2 ** (attempt - 1))
+        return None
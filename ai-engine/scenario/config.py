@@ -13,6 +13,16 @@ class AppConfig:
     llm_model: str = "gpt-4o-mini"
     max_attempts: int = 3
     max_retries: int = 1
+    realtime_pool_size: int = 0
+    realtime_pool_ttl_sec: float = 300.0
+    audio_chunk_ms: int = 100
+    audio_initial_burst_ms: int = 300
+    input_frame_ms: int = 100
+    input_vad_gate: bool = False
+    adaptive_audio: bool = False
+    transcript_window_ms: int = 100
+    transcript_max_chars: int = 80
+    openai_max_concurrency: int = 32
 
     @staticmethod
     def from_env() -> "AppConfig":
@@ -32,4 +42,41 @@ class AppConfig:
             api_key=api_key,
             realtime_model=realtime_model or AppConfig.realtime_model,
             llm_model=llm_model or AppConfig.llm_model,
+            realtime_pool_size=_env_int("OPENAI_REALTIME_POOL_SIZE", AppConfig.realtime_pool_size),
+            realtime_pool_ttl_sec=_env_float("OPENAI_REALTIME_POOL_TTL_SEC", AppConfig.realtime_pool_ttl_sec),
+            audio_chunk_ms=_env_int("MALANGEE_AUDIO_CHUNK_MS", AppConfig.audio_chunk_ms),
+            audio_initial_burst_ms=_env_int("MALANGEE_AUDIO_BURST_MS", AppConfig.audio_initial_burst_ms),
+            input_frame_ms=_env_int("MALANGEE_INPUT_FRAME_MS", AppConfig.input_frame_ms),
+            input_vad_gate=_env_bool("MALANGEE_INPUT_VAD_GATE", AppConfig.input_vad_gate),
+            adaptive_audio=_env_bool("MALANGEE_ADAPTIVE_AUDIO", AppConfig.adaptive_audio),
+            transcript_window_ms=_env_int("MALANGEE_TRANSCRIPT_WINDOW_MS", AppConfig.transcript_window_ms),
+            transcript_max_chars=_env_int("MALANGEE_TRANSCRIPT_MAX_CHARS", AppConfig.transcript_max_chars),
+            openai_max_concurrency=_env_int("OPENAI_MAX_CONCURRENCY", AppConfig.openai_max_concurrency),
         )
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name, "").strip()
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name, "").strip().lower()
+    if not value:
+        return default
+    return value in ("1", "true", "yes", "on")
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.getenv(name, "").strip()
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        return default
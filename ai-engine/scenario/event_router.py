@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import re
+from dataclasses import asdict, dataclass
+from typing import Any, Iterable, Optional, Union
+
+from .json_codec import JsonCodec, get_json_codec
+from .realtime_handlers import EventHandler
+
+RawMessage = Union[str, bytes, bytearray]
+
+# Only the head of a message is scanned for its type. OpenAI serializes `type`
+# (next to `event_id`) ahead of the payload, so peeking a 50 KB audio delta
+# costs the same as peeking a 100 byte control event.
+PEEK_WINDOW = 256
+
+_TYPE_PATTERN = re.compile(r'"type"\s*:\s*"([^"\\]+)"')
+_FIELD_PATTERNS: dict[str, re.Pattern] = {}
+
+
+def peek_event_type(message: str) -> Optional[str]:
+    """Top-level `type` of a JSON event read from its head; None when a full parse is needed."""
+    if not message.startswith("{"):
+        return None
+    match = _TYPE_PATTERN.search(message, 1, PEEK_WINDOW)
+    # A `{` ahead of the key means it may belong to a nested object.
+    if match is None or message.find("{", 1, match.start()) != -1:
+        return None
+    return match.group(1)
+
+
+def extract_string_field(message: str, name: str) -> Optional[str]:
+    """String value of `name` sliced out of the raw JSON text; None when it needs a real parse.
+
+    Meant for flat events such as `response.audio.delta`: a nested object with
+    the same key would match as well. Values with escapes are left to json.loads.
+    """
+    pattern = _FIELD_PATTERNS.get(name)
+    if pattern is None:
+        pattern = _FIELD_PATTERNS[name] = re.compile(r'"%s"\s*:\s*"' % re.escape(name))
+    match = pattern.search(message)
+    if match is None:
+        return None
+    begin = match.end()
+    end = message.find('"', begin)
+    if end == -1 or message.find("\\", begin, end) != -1:
+        return None
+    return message[begin:end]
+
+
+@dataclass
+class RouterStats:
+    messages: int = 0
+    peeked: int = 0
+    parsed: int = 0
+    sliced: int = 0
+    skipped: int = 0
+    invalid: int = 0
+
+
+@dataclass(frozen=True)
+class _Subscription:
+    event_types: tuple[str, ...]
+    handler: EventHandler
+    fields: Optional[tuple[str, ...]]
+
+    def matches(self, event_type: str) -> bool:
+        if not self.event_types:
+            return True
+        for pattern in self.event_types:
+            if pattern == event_type or (pattern.endswith(".*") and event_type.startswith(pattern[:-1])):
+                return True
+        return False
+
+
+class EventRouter:
+    """Routes raw Realtime messages to the handlers subscribed to their type.
+
+    The type is peeked from the message head, so events nobody subscribed to are
+    dropped without a parse. Handlers subscribed with `fields` receive a small
+    `{"type": ..., field: value}` dict sliced from the raw text: base64 audio
+    deltas pass through as a slice instead of going through a JSON parse. All
+    other handlers share one parse of the message (JsonCodec.loads). A type ending in `.*`
+    subscribes by prefix and no type subscribes to everything; handlers run in
+    subscription order.
+    """
+
+    def __init__(self, *, logger: Optional[logging.Logger] = None, json_codec: Optional[JsonCodec] = None) -> None:
+        self._json = json_codec or get_json_codec()
+        self._subscriptions: list[_Subscription] = []
+        self._routes: dict[str, tuple[_Subscription, ...]] = {}
+        self._logger = logger or logging.getLogger(__name__)
+        self.stats = RouterStats()
+
+    def subscribe(self, handler: EventHandler, *event_types: str, fields: Optional[Iterable[str]] = None) -> None:
+        self._subscriptions.append(
+            _Subscription(tuple(event_types), handler, tuple(fields) if fields is not None else None)
+        )
+        self._routes.clear()
+
+    def handlers_for(self, event_type: str) -> tuple[_Subscription, ...]:
+        routes = self._routes.get(event_type)
+        if routes is None:
+            routes = tuple(sub for sub in self._subscriptions if sub.matches(event_type))
+            self._routes[event_type] = routes
+        return routes
+
+    async def dispatch(self, message: RawMessage) -> None:
+        self.stats.messages += 1
+        if not isinstance(message, str):
+            message = bytes(message).decode("utf-8", errors="replace")
+        event: Optional[dict[str, Any]] = None
+        event_type = peek_event_type(message)
+        if event_type is None:
+            event = self._parse(message)
+            if event is None:
+                return
+            event_type = str(event.get("type", ""))
+        else:
+            self.stats.peeked += 1
+
+        routes = self.handlers_for(event_type)
+        if not routes:
+            self.stats.skipped += 1
+            return
+        for sub in routes:
+            payload = None
+            if sub.fields is not None and event is None:
+                payload = _slice_event(message, event_type, sub.fields)
+                if payload is not None:
+                    self.stats.sliced += 1
+            if payload is None:
+                if event is None:
+                    event = self._parse(message)
+                    if event is None:
+                        return
+                payload = event
+            result = sub.handler(payload)
+            if asyncio.iscoroutine(result):
+                await result
+
+    def snapshot(self) -> dict[str, Any]:
+        data = asdict(self.stats)
+        messages = self.stats.messages
+        data["parsed_ratio"] = self.stats.parsed / messages if messages else 0.0
+        return data
+
+    def _parse(self, message: str) -> Optional[dict[str, Any]]:
+        try:
+            event = self._json.loads(message)
+        except json.JSONDecodeError:
+            self.stats.invalid += 1
+            self._logger.warning("Skipping non-JSON message from Realtime")
+            return None
+        if not isinstance(event, dict):
+            self.stats.invalid += 1
+            return None
+        self.stats.parsed += 1
+        return event
+
+
+def _slice_event(message: str, event_type: str, fields: tuple[str, ...]) -> Optional[dict[str, Any]]:
+    event: dict[str, Any] = {"type": event_type}
+    for name in fields:
+        value = extract_string_field(message, name)
+        if value is None:
+            return None
+        event[name] = value
+    return event
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Optional
 
 from .llm_client import OpenAIScenarioLLM
+from .openai_clients import OpenAIClientRegistry
 from .prompts import KOREAN_FALLBACK_MESSAGE
 from .scenario_builder import ScenarioBuilder
 from .scenario_state import ScenarioState
@@ -13,8 +14,9 @@ def build_scenario_builder(
     model: str,
     max_attempts: int = 3,
     logger: Optional[object] = None,
+    clients: Optional[OpenAIClientRegistry] = None,
 ) -> ScenarioBuilder:
-    llm = OpenAIScenarioLLM(api_key=api_key, model=model, logger=logger)
+    llm = OpenAIScenarioLLM(api_key=api_key, model=model, logger=logger, clients=clients)
     return ScenarioBuilder(
         state=ScenarioState(),
         extractor=llm.extract_fields,
@@ -5,6 +5,7 @@ from typing import Any, Awaitable, Callable, Union
 from .prompts import KOREAN_FALLBACK_MESSAGE
 
 SendResponse = Callable[[str], Union[Awaitable[Any], Any]]
+SendEvent = Callable[[dict[str, Any]], Union[Awaitable[Any], Any]]
 
 
 def build_realtime_error_handler(
@@ -17,3 +18,10 @@ def build_realtime_error_handler(
         return result
 
     return _handler
+
+
+def build_client_error_handler(
+    send_event: SendEvent,
+) -> Callable[[Exception], Union[Awaitable[Any], Any]]:
+    """Same fallback, delivered to the client socket as an `error` event."""
+    return build_realtime_error_handler(lambda message: send_event({"type": "error", "message": message}))
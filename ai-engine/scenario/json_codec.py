@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+JSON_CODEC_STDLIB = "stdlib"
+JSON_CODEC_ORJSON = "orjson"
+JSON_CODEC_MSGSPEC = "msgspec"
+JSON_CODECS = (JSON_CODEC_STDLIB, JSON_CODEC_ORJSON, JSON_CODEC_MSGSPEC)
+
+JSONDecodeError = json.JSONDecodeError
+
+# Audio events whose only string field is base64: encoded around a cached prefix.
+_AUDIO_FIELDS = {
+    "audio.delta": "delta",
+    "response.audio.delta": "delta",
+    "input_audio_buffer.append": "audio",
+}
+_MAX_FIXED_EVENTS = 64
+
+logger = logging.getLogger(__name__)
+
+
+class JsonCodec:
+    """Compact JSON text for realtime events (stdlib; subclasses swap the backend).
+
+    `dumps_event()` bypasses the encoder for the hot fixed shapes: type-only
+    events (`{"type":"audio.done"}`) come pre-encoded from a cache, and base64
+    audio events are the cached prefix + value + suffix once the value is known
+    to need no escaping. The result is the same text `dumps()` would produce.
+    `loads()` raises json.JSONDecodeError on bad input for every backend.
+    """
+
+    name = JSON_CODEC_STDLIB
+
+    def __init__(self) -> None:
+        self._fixed: dict[str, str] = {}
+        self._prefixes: dict[str, str] = {}
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        return json.loads(data)
+
+    def dumps_event(self, payload: dict[str, Any]) -> str:
+        event_type = payload.get("type")
+        if len(payload) == 1 and isinstance(event_type, str):
+            text = self._fixed.get(event_type)
+            if text is None:
+                text = self.dumps(payload)
+                if len(self._fixed) < _MAX_FIXED_EVENTS:
+                    self._fixed[event_type] = text
+            return text
+        field = _AUDIO_FIELDS.get(event_type)
+        if field is not None:
+            text = self._dumps_audio(payload, event_type, field)
+            if text is not None:
+                return text
+        return self.dumps(payload)
+
+    def _dumps_audio(self, payload: dict[str, Any], event_type: str, field: str) -> Optional[str]:
+        value = payload.get(field)
+        if not isinstance(value, str) or not _needs_no_escape(value):
+            return None
+        keys = tuple(payload)
+        if keys == ("type", field):
+            suffix = '"}'
+        elif keys == ("type", field, "sample_rate") and type(payload["sample_rate"]) is int:
+            suffix = f'","sample_rate":{payload["sample_rate"]}}}'
+        else:
+            return None
+        prefix = self._prefixes.get(event_type)
+        if prefix is None:
+            # `{"type":"...","delta":""}` minus the closing `"}`.
+            prefix = self._prefixes[event_type] = self.dumps({"type": event_type, field: ""})[:-2]
+        return prefix + value + suffix
+
+
+class OrjsonCodec(JsonCodec):
+    name = JSON_CODEC_ORJSON
+
+    def dumps(self, obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError.
+        return orjson.loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    name = JSON_CODEC_MSGSPEC
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> str:
+        return self._encoder.encode(obj).decode("utf-8")
+
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError as exc:
+            raise JSONDecodeError(str(exc), data if isinstance(data, str) else "", 0) from exc
+
+
+def build_json_codec(name: Optional[str] = None) -> JsonCodec:
+    """`stdlib` / `orjson` / `msgspec`; a backend that is not installed falls back to stdlib."""
+    name = (name or JSON_CODEC_STDLIB).strip().lower()
+    if name == JSON_CODEC_ORJSON and orjson is not None:
+        return OrjsonCodec()
+    if name == JSON_CODEC_MSGSPEC and msgspec is not None:
+        return MsgspecCodec()
+    if name != JSON_CODEC_STDLIB:
+        logger.warning("JSON codec %r is not available, using stdlib", name)
+    return JsonCodec()
+
+
+_codec: Optional[JsonCodec] = None
+
+
+def get_json_codec() -> JsonCodec:
+    """Process-wide codec, chosen by `MALANGEE_JSON_CODEC` (default stdlib) on first use."""
+    global _codec
+    if _codec is None:
+        _codec = build_json_codec(os.getenv("MALANGEE_JSON_CODEC", ""))
+    return _codec
+
+
+def set_json_codec(name: Optional[str]) -> JsonCodec:
+    global _codec
+    _codec = build_json_codec(name)
+    return _codec
+
+
+def _needs_no_escape(value: str) -> bool:
+    return value.isascii() and value.isprintable() and '"' not in value and "\\" not in value
@@ -3,38 +3,56 @@ from __future__ import annotations
 import json
 from typing import Any, Optional
 
-from openai import OpenAI
-
+from .openai_clients import OpenAIClientRegistry, get_openai_clients
 from .prompts import build_extraction_prompt, build_fallback_prompt, build_final_prompt, build_followup_prompt
 from .scenario_state import ScenarioState
 
 
 class OpenAIScenarioLLM:
-    def __init__(self, api_key: str, model: str, logger: Optional[Any] = None) -> None:
-        self._client = OpenAI(api_key=api_key)
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        logger: Optional[Any] = None,
+        *,
+        base_url: Optional[str] = None,
+        clients: Optional[OpenAIClientRegistry] = None,
+    ) -> None:
+        # Shared per-worker client (keep-alive pool) and concurrency limit.
+        self._clients = clients or get_openai_clients()
+        self._client = self._clients.client(api_key, base_url)
         self._model = model
         self._logger = logger
 
-    def extract_fields(self, user_text: str) -> dict[str, str | None]:
+    async def extract_fields(self, user_text: str) -> dict[str, str | None]:
         prompt = build_extraction_prompt(user_text)
-        text = self._create_text_response(prompt, response_format={"type": "json_object"})
+        text = await self._create_text_response(prompt, response_format={"type": "json_object"})
         return _safe_json_loads(text)
 
-    def generate_followup(self, state: ScenarioState, missing_fields: list[str]) -> str:
+    async def generate_followup(self, state: ScenarioState, missing_fields: list[str]) -> str:
         prompt = build_followup_prompt(state.place, state.partner, state.goal, missing_fields)
-        return self._create_text_response(prompt)
+        return await self._create_text_response(prompt)
 
-    def generate_final(self, state: ScenarioState) -> str:
+    async def generate_final(self, state: ScenarioState) -> str:
         if not (state.place and state.partner and state.goal):
             raise ValueError("ScenarioState is incomplete for final response generation")
         prompt = build_final_prompt(state.place, state.partner, state.goal)
-        return self._create_text_response(prompt)
+        return await self._create_text_response(prompt)
 
-    def generate_fallback(self, state: ScenarioState) -> str:
+    async def generate_fallback(self, state: ScenarioState) -> str:
         prompt = build_fallback_prompt(state.place, state.partner, state.goal)
-        return self._create_text_response(prompt)
+        return await self._create_text_response(prompt)
+
+    async def _create_text_response(
+        self,
+        prompt: str,
+        *,
+        response_format: Optional[dict[str, Any]] = None,
+    ) -> str:
+        async with self._clients.slot():
+            return await self._request_text_response(prompt, response_format=response_format)
 
-    def _create_text_response(
+    async def _request_text_response(
         self,
         prompt: str,
         *,
@@ -42,13 +60,13 @@ class OpenAIScenarioLLM:
     ) -> str:
         if hasattr(self._client, "responses"):
             try:
-                response = self._client.responses.create(
+                response = await self._client.responses.create(
                     model=self._model,
                     input=prompt,
                     response_format=response_format,
                 )
             except TypeError:
-                response = self._client.responses.create(
+                response = await self._client.responses.create(
                     model=self._model,
                     input=prompt,
                 )
@@ -58,7 +76,7 @@ class OpenAIScenarioLLM:
             return _extract_text_from_response(response)
 
         if hasattr(self._client, "chat"):
-            response = self._client.chat.completions.create(
+            response = await self._client.chat.completions.create(
                 model=self._model,
                 messages=[{"role": "user", "content": prompt}],
             )
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, AsyncIterator, Optional
+
+from openai import AsyncOpenAI
+
+from .config import AppConfig, _env_int
+
+
+@dataclass
+class OpenAIClientMetrics:
+    clients: int = 0
+    requests: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+    saturated: int = 0
+    errors: int = 0
+    wait_ms_total: float = 0.0
+    wait_ms_max: float = 0.0
+
+
+class OpenAIClientRegistry:
+    """Per-worker shared AsyncOpenAI clients plus a cap on concurrent requests.
+
+    One client per (api_key, base_url): its HTTP pool keeps connections alive,
+    so requests after the first skip the TCP/TLS handshake. Callers wrap each
+    request in `slot()` (a streamed response only until its headers arrive, so
+    a slow consumer does not hold the slot); at most
+    `max_concurrency` run at once and the rest wait. A request that had to wait
+    counts as `saturated` with its wait time in the metrics.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = AppConfig.openai_max_concurrency,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        self.max_concurrency = max(1, max_concurrency)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._clients: dict[tuple[str, Optional[str]], AsyncOpenAI] = {}
+        self._logger = logger or logging.getLogger(__name__)
+        self.metrics = OpenAIClientMetrics()
+
+    def client(self, api_key: str, base_url: Optional[str] = None) -> AsyncOpenAI:
+        key = (api_key, base_url)
+        client = self._clients.get(key)
+        if client is None:
+            client = AsyncOpenAI(api_key=api_key, base_url=base_url)
+            self._clients[key] = client
+            self.metrics.clients += 1
+        return client
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        metrics = self.metrics
+        metrics.requests += 1
+        if self._semaphore.locked():
+            metrics.saturated += 1
+            started = time.perf_counter()
+            await self._semaphore.acquire()
+            wait_ms = (time.perf_counter() - started) * 1000.0
+            metrics.wait_ms_total += wait_ms
+            metrics.wait_ms_max = max(metrics.wait_ms_max, wait_ms)
+        else:
+            await self._semaphore.acquire()
+        metrics.in_flight += 1
+        metrics.max_in_flight = max(metrics.max_in_flight, metrics.in_flight)
+        try:
+            yield
+        except Exception:
+            metrics.errors += 1
+            raise
+        finally:
+            metrics.in_flight -= 1
+            self._semaphore.release()
+
+    async def aclose(self) -> None:
+        clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            try:
+                await client.close()
+            except Exception as exc:
+                self._logger.warning("OpenAI client close failed: %s", exc)
+
+    def snapshot(self) -> dict[str, Any]:
+        data = asdict(self.metrics)
+        saturated = self.metrics.saturated
+        data["max_concurrency"] = self.max_concurrency
+        data["saturation_ratio"] = round(saturated / self.metrics.requests, 3) if self.metrics.requests else 0.0
+        data["wait_ms_mean"] = round(data.pop("wait_ms_total") / saturated, 2) if saturated else 0.0
+        data["wait_ms_max"] = round(data["wait_ms_max"], 2)
+        return data
+
+
+_registry: Optional[OpenAIClientRegistry] = None
+
+
+def start_openai_clients(config: Optional[AppConfig] = None) -> OpenAIClientRegistry:
+    """Create the worker's registry (app lifespan startup); returns the existing one if already started."""
+    global _registry
+    if _registry is None:
+        if config is not None:
+            max_concurrency = config.openai_max_concurrency
+        else:
+            # Lifespan startup may run without an API key configured; read the limit alone.
+            max_concurrency = _env_int("OPENAI_MAX_CONCURRENCY", AppConfig.openai_max_concurrency)
+        _registry = OpenAIClientRegistry(max_concurrency=max_concurrency)
+    return _registry
+
+
+def get_openai_clients() -> OpenAIClientRegistry:
+    """The worker's registry; created with defaults on first use when no lifespan started it."""
+    return _registry if _registry is not None else start_openai_clients()
+
+
+async def stop_openai_clients() -> None:
+    global _registry
+    registry, _registry = _registry, None
+    if registry is not None:
+        registry._logger.info("OpenAI clients: %s", registry.snapshot())
+        await registry.aclose()
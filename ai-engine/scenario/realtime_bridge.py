@@ -4,91 +4,264 @@ import asyncio
 import base64
 import binascii
 import json
-from io import BytesIO
-import wave
 import uuid
-from typing import Any, Awaitable, Callable, Optional
+from dataclasses import replace
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, Union
 from datetime import datetime, timezone
 import sys
 from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
 
 import websockets
-from openai import OpenAI
 
 from .config import AppConfig
-from .realtime_handlers import fanout_event_handler
-from .realtime_pipeline import RealtimeScenarioPipeline
+from .event_router import EventRouter
+from .realtime_handlers import ConcurrentFanout
+from .realtime_pipeline import USER_TEXT_EVENT_TYPES, RealtimeScenarioPipeline
 from .realtime_session import RealtimeConfig, RealtimeSessionManager, RealtimeWebSocketClient
-from .audio_relay import RealtimeAudioRelay
-from .fallbacks import build_realtime_error_handler
+from .resampler import REALTIME_SAMPLE_RATE, StreamingResampler
+from .adaptive_audio import AdaptiveDownstream, AppPingProbe, quality_event, run_link_monitor, websocket_ping
+from .audio_codecs import AUDIO_CODEC_PCM16
+from .audio_egress import OutputAudioCoalescer
+from .audio_frames import FRAME_INPUT_AUDIO, ClientAudioWire, decode_audio_frame
+from .audio_ingress import InputAudioAggregator, base64_decoded_length
+from .audio_pacing import AudioPacer, AudioPacingConfig
+from .audio_relay import RELAY_EVENT_TYPES, RealtimeAudioRelay
+from .client_outbound import ClientOutboundQueue
+from .completion_queue import COMPLETION_PERSISTED, CompletionJob, ScenarioCompletionQueue
+from .fallbacks import build_client_error_handler
+from .json_codec import get_json_codec
 from .factory import build_scenario_builder
+from .openai_clients import get_openai_clients, start_openai_clients, stop_openai_clients
 from .logging_utils import get_logger
 from .scenario_builder import ScenarioBuilder
+from .session_pool import RealtimeSessionPool
+from .transcript_coalescer import TranscriptDeltaCoalescer
+from .tts_stream import OpenAITTSProvider, TTSProvider, stream_tts_pcm16
+from realtime_conversation.audio_controller import AudioController
 
 ClientSender = Callable[[dict[str, Any]], Awaitable[None]]
 
+TRANSCRIPTION_EVENT_TYPES = (
+    "input_audio_buffer.transcription.completed",
+    "conversation.item.input_audio_transcription.completed",
+)
+
 BACKEND_ROOT = Path(__file__).resolve().parents[2] / "backend"
 if str(BACKEND_ROOT) not in sys.path:
     sys.path.append(str(BACKEND_ROOT))
 
 from app.db.database import AsyncSessionLocal
 from app.repositories.chat_repository import ChatRepository
+from app.repositories.scenario_outbox_repository import ScenarioOutboxRepository
 from app.schemas.chat import SessionCreate
 
+SCENARIO_SESSION_CONFIG: dict[str, Any] = {
+    "input_audio_format": "pcm16",
+    "output_audio_format": "pcm16",
+    "turn_detection": {"type": "server_vad", "create_response": False},
+    "input_audio_transcription": {"model": "whisper-1"},
+}
+
+_session_pool: Optional[RealtimeSessionPool] = None
+_completion_queue: Optional[ScenarioCompletionQueue] = None
+
+
+async def start_realtime_session_pool(config: Optional[AppConfig] = None) -> Optional[RealtimeSessionPool]:
+    global _session_pool
+    if _session_pool is not None:
+        return _session_pool
+    config = config or AppConfig.from_env()
+    if config.realtime_pool_size <= 0:
+        return None
+    pool = RealtimeSessionPool(
+        RealtimeConfig(api_key=config.api_key, model=config.realtime_model, max_retries=config.max_retries),
+        SCENARIO_SESSION_CONFIG,
+        target_size=config.realtime_pool_size,
+        ttl_sec=config.realtime_pool_ttl_sec,
+        clients=start_openai_clients(config),
+        logger=get_logger("realtime_pool"),
+    )
+    _session_pool = pool
+    await pool.start()
+    return pool
+
+
+async def stop_realtime_session_pool() -> None:
+    global _session_pool
+    pool, _session_pool = _session_pool, None
+    if pool is not None:
+        await pool.close()
+
+
+def get_realtime_session_pool() -> Optional[RealtimeSessionPool]:
+    return _session_pool
+
+
+def start_scenario_completion_queue() -> ScenarioCompletionQueue:
+    global _completion_queue
+    if _completion_queue is None:
+        _completion_queue = ScenarioCompletionQueue(
+            persist=_persist_completion,
+            generate_title=_generate_completion_title,
+            backfill_title=_backfill_session_title,
+            outbox=DatabaseCompletionOutbox(),
+            logger=get_logger("scenario_completion"),
+        )
+        _completion_queue.start()
+    return _completion_queue
+
+
+async def stop_scenario_completion_queue() -> None:
+    global _completion_queue
+    queue, _completion_queue = _completion_queue, None
+    if queue is not None:
+        await queue.close()
+        get_logger("scenario_completion").info("Scenario completion queue: %s", queue.snapshot())
+
+
+async def wait_for_scenario_session(session_id: str, timeout: float = 5.0) -> Optional[str]:
+    """Wait until a just-completed scenario session is stored.
+
+    Returns the completion status (see `ScenarioCompletionQueue.wait_persisted`), None when none is queued.
+    """
+    queue = _completion_queue
+    if queue is None:
+        return None
+    return await queue.wait_persisted(session_id, timeout)
+
 
 async def relay_server(host: str, port: int, stop_event: Optional[asyncio.Event] = None) -> None:
     async def handler(client_ws):
-        await handle_client(client_ws)
+        query = _request_query(client_ws)
+        await handle_client(
+            client_ws,
+            audio_transport=query.get("audio_transport"),
+            vad_gate=query.get("vad_gate", "").lower() in ("1", "true", "yes") or None,
+            audio_codec=query.get("audio_codec"),
+            adaptive_audio=query.get("adaptive_audio", "").lower() in ("1", "true", "yes") or None,
+        )
 
-    async with websockets.serve(handler, host, port):
-        logger = get_logger("realtime_bridge")
-        logger.info("Realtime relay listening on ws://%s:%s", host, port)
-        if stop_event is None:
-            await asyncio.Future()
-        else:
-            await stop_event.wait()
+    start_openai_clients()
+    start_scenario_completion_queue()
+    await start_realtime_session_pool()
+    try:
+        async with websockets.serve(handler, host, port):
+            logger = get_logger("realtime_bridge")
+            logger.info("Realtime relay listening on ws://%s:%s", host, port)
+            if stop_event is None:
+                await asyncio.Future()
+            else:
+                await stop_event.wait()
+    finally:
+        await stop_realtime_session_pool()
+        await stop_scenario_completion_queue()
+        await stop_openai_clients()
 
 
-async def handle_client(client_ws, user_id: Optional[int] = None) -> None:
+async def handle_client(
+    client_ws,
+    user_id: Optional[int] = None,
+    *,
+    chunk_ms: Optional[int] = None,
+    burst_ms: Optional[int] = None,
+    audio_transport: Optional[str] = None,
+    vad_gate: Optional[bool] = None,
+    audio_codec: Optional[str] = None,
+    adaptive_audio: Optional[bool] = None,
+) -> None:
     logger = get_logger("realtime_bridge")
     client_peer = getattr(client_ws, "remote_address", None)
     client_id = _new_client_id()
     logger.info("Client connected [%s]: %s", client_id, client_peer)
 
+    connected_at = asyncio.get_running_loop().time()
     config = AppConfig.from_env()
-    session_info = RealtimeSessionManager(
-        RealtimeConfig(api_key=config.api_key, model=config.realtime_model, max_retries=config.max_retries)
-    ).create_session()
+    pacing = AudioPacingConfig(
+        chunk_ms=chunk_ms if chunk_ms is not None else config.audio_chunk_ms,
+        initial_burst_ms=burst_ms if burst_ms is not None else config.audio_initial_burst_ms,
+    )
+    clients = start_openai_clients(config)
+    pool = await start_realtime_session_pool(config)
+    pooled = await pool.acquire() if pool is not None else None
 
     use_server_vad = True
-    session_config = {
-        "input_audio_format": "pcm16",
-        "output_audio_format": "pcm16",
-        "turn_detection": {"type": "server_vad", "create_response": False},
-        "input_audio_transcription": {"model": "whisper-1"},
-    }
+    if pooled is not None:
+        openai_client = pooled.client
+    else:
+        session_info = await RealtimeSessionManager(
+            RealtimeConfig(api_key=config.api_key, model=config.realtime_model, max_retries=config.max_retries),
+            clients,
+        ).create_session_async()
+        openai_client = RealtimeWebSocketClient(
+            session=session_info,
+            api_key=config.api_key,
+            event_handler=lambda _: None,
+            session_config=SCENARIO_SESSION_CONFIG,
+            max_retries=config.max_retries,
+        )
 
-    openai_client = RealtimeWebSocketClient(
-        session=session_info,
-        api_key=config.api_key,
-        event_handler=lambda _: None,
-        session_config=session_config,
-        max_retries=config.max_retries,
-    )
+    # Client-link codec only: input is decoded to PCM16 here, output encoded just before the socket.
+    wire = ClientAudioWire(audio_transport, audio_codec)
+
+    async def write_to_client(payload: dict[str, Any]) -> None:
+        await client_ws.send(wire.encode(payload))
+
+    # Control events (ready, error, scenario.completed) jump ahead of queued audio.
+    outbound = ClientOutboundQueue(write_to_client, logger=logger)
+    outbound.start()
 
     async def send_to_client(payload: dict[str, Any]) -> None:
-        await client_ws.send(json.dumps(payload))
+        outbound.put(payload)
+
+    # Opt-in adaptive downstream: RTT pings + queue growth step 24 -> 16 -> 8 kHz.
+    downstream: Optional[AdaptiveDownstream] = None
+    ping_probe: Optional[AppPingProbe] = None
+    if adaptive_audio if adaptive_audio is not None else config.adaptive_audio:
+        downstream = AdaptiveDownstream()
+        link_ping = websocket_ping(client_ws)
+        if link_ping is None:
+            # ASGI sockets cannot send protocol pings; fall back to ping/pong events.
+            ping_probe = AppPingProbe(send_to_client)
+            link_ping = ping_probe.ping
+
+    def observe_outbound() -> tuple[int, int]:
+        return outbound.depth, outbound.stats.dropped_audio
+
+    async def send_audio_frame(pcm: bytes, sample_rate: int) -> None:
+        if downstream is not None and downstream.observe_queue(*observe_outbound()):
+            logger.info("Downstream audio level [%s]: %s", client_id, downstream.snapshot())
+            await send_to_client(quality_event(downstream.level))
+        await send_to_client({"type": "response.audio.delta", "delta": pcm, "sample_rate": sample_rate})
+
+    # Realtime deltas arrive in irregular sizes; the client gets fixed chunk_ms frames.
+    output_coalescer = OutputAudioCoalescer(pacing.chunk_ms, downstream=downstream)
+
+    async def append_input_audio(audio: str) -> None:
+        await openai_client.send_event({"type": "input_audio_buffer.append", "audio": audio})
+
+    # Browsers send 10-20 ms chunks; upstream appends go out as input_frame_ms frames.
+    input_aggregator = InputAudioAggregator(append_input_audio, frame_ms=config.input_frame_ms)
+    # Opt-in server-side VAD gate: long pauses never leave the server.
+    input_vad: Optional[AudioController] = None
+    if vad_gate if vad_gate is not None else config.input_vad_gate:
+        input_vad = AudioController()
+        input_vad.start_listening()
 
     state = {
         "has_audio": False,
         "total_bytes": 0,
-        "sample_rate": 24000,
+        "sample_rate": REALTIME_SAMPLE_RATE,
         "speaking": False,
         "completed_sent": False,
         "user_transcripts": [],
+        "input_codec": None if wire.pcm16 else wire.codec,
+        "ping_probe": ping_probe,
     }
 
     async def on_transcript(text: str, is_final: bool) -> None:
+        if is_final and transcript_coalescer.last_response:
+            logger.info("Transcript coalescing [%s]: %s", client_id, transcript_coalescer.last_response)
         payload = {
             "type": "response.audio_transcript.done" if is_final else "response.audio_transcript.delta",
             "transcript": text if is_final else None,
@@ -96,9 +269,18 @@ async def handle_client(client_ws, user_id: Optional[int] = None) -> None:
         }
         await send_to_client(payload)
 
+    # One client event per transcript_window_ms (or transcript_max_chars) instead of per token.
+    transcript_coalescer = TranscriptDeltaCoalescer(
+        lambda text: on_transcript(text, False),
+        window_ms=config.transcript_window_ms,
+        max_chars=config.transcript_max_chars,
+    )
+
     audio_relay = RealtimeAudioRelay(
-        on_audio_chunk_base64=lambda chunk: send_to_client({"type": "response.audio.delta", "delta": chunk}),
         on_transcript=on_transcript,
+        transcript_coalescer=transcript_coalescer,
+        on_audio_frame=send_audio_frame,
+        coalescer=output_coalescer,
     )
 
     builder = build_scenario_builder(
@@ -106,13 +288,21 @@ async def handle_client(client_ws, user_id: Optional[int] = None) -> None:
         model=config.llm_model,
         max_attempts=config.max_attempts,
         logger=logger,
+        clients=clients,
     )
 
-    tts_client = OpenAI(api_key=config.api_key)
+    tts_provider = OpenAITTSProvider(clients.client(config.api_key), clients=clients)
 
     async def send_response(text: str) -> None:
-        audio_bytes, sample_rate = await asyncio.to_thread(_tts_pcm16_from_text, tts_client, text)
-        await _send_pcm16_audio(send_to_client, audio_bytes, sample_rate=sample_rate)
+        started = asyncio.get_running_loop().time()
+        first_audio_at = await _stream_tts_to_client(send_to_client, tts_provider, text, pacing, downstream)
+        if first_audio_at is not None:
+            logger.info(
+                "TTS first audio [%s]: %.0f ms (%s chars)",
+                client_id,
+                (first_audio_at - started) * 1000.0,
+                len(text),
+            )
         if not state.get("completed_sent"):
             await send_to_client(
                 {
@@ -122,6 +312,7 @@ async def handle_client(client_ws, user_id: Optional[int] = None) -> None:
             )
 
     async def on_complete(scenario_builder: ScenarioBuilder) -> None:
+        completed_at = asyncio.get_running_loop().time()
         session_id = state.get("session_id")
         if not session_id:
             session_id = str(uuid.uuid4())
@@ -136,27 +327,28 @@ async def handle_client(client_ws, user_id: Optional[int] = None) -> None:
             "asked_fields": sorted(list(state_snapshot.asked_fields)),
             "completed": state_snapshot.completed,
         }
-        try:
-            title = await _generate_session_title(
-                config,
-                scenario_state=scenario_state_payload,
-                transcripts=state.get("user_transcripts", []),
-            )
-            await _persist_scenario_state(
-                session_id=session_id,
-                scenario_state=scenario_state_payload,
-                title=title,
-                user_id=user_id,
-            )
-        except Exception as exc:
-            logger.error("Scenario save failed [%s]: %s", client_id, exc)
+        async def on_save_failed(job: CompletionJob) -> None:
             await send_to_client(
                 {
-                    "type": "error",
+                    "type": "scenario.save_failed",
+                    "sessionId": job.session_id,
                     "message": "Scenario save failed",
                 }
             )
-        logger.info("Scenario completed [%s]", client_id)
+
+        # Title (LLM) and persistence run in the completion queue; the client only waits for
+        # the outbox record and the send below.
+        queue_len = await start_scenario_completion_queue().submit(
+            CompletionJob(
+                session_id=session_id,
+                scenario_state=scenario_state_payload,
+                transcripts=list(state.get("user_transcripts", [])),
+                fallback_title=_build_session_title(scenario_state_payload),
+                user_id=user_id,
+                config=config,
+                on_failed=on_save_failed,
+            )
+        )
         await send_to_client(
             {
                 "type": "scenario.completed",
@@ -170,6 +362,12 @@ async def handle_client(client_ws, user_id: Optional[int] = None) -> None:
             }
         )
         state["completed_sent"] = True
+        logger.info(
+            "Scenario completed [%s]: %.0f ms (completion queue=%d)",
+            client_id,
+            (asyncio.get_running_loop().time() - completed_at) * 1000.0,
+            queue_len,
+        )
         await openai_client.close()
 
     pipeline = RealtimeScenarioPipeline(
@@ -178,12 +376,10 @@ async def handle_client(client_ws, user_id: Optional[int] = None) -> None:
         on_complete=on_complete,
         send_final_response=False,
     )
+    realtime_error_handler = build_client_error_handler(send_to_client)
+
     async def forward_user_transcript(event: dict[str, Any]) -> None:
-        event_type = event.get("type", "")
-        if event_type in (
-            "input_audio_buffer.transcription.completed",
-            "conversation.item.input_audio_transcription.completed",
-        ):
+        if event.get("type", "") in TRANSCRIPTION_EVENT_TYPES:
             transcript = event.get("transcript")
             if isinstance(transcript, str) and transcript.strip():
                 if builder.state.completed:
@@ -191,8 +387,17 @@ async def handle_client(client_ws, user_id: Optional[int] = None) -> None:
                 await send_to_client({"type": "input_audio.transcript", "transcript": transcript})
                 state["user_transcripts"].append(transcript)
 
+    async def handle_user_text(event: dict[str, Any]) -> None:
+        # One lane: the transcript is forwarded and recorded before the pipeline can complete on it.
+        await forward_user_transcript(event)
+        await pipeline.handle_event(event)
+
     ready_event = asyncio.Event()
     session_ready = {"updated": False, "cleared": False}
+    if pooled is not None:
+        # Pooled clients already finished session.update + buffer clear.
+        session_ready.update(updated=True, cleared=True)
+        ready_event.set()
 
     async def log_event_type(event: dict[str, Any]) -> None:
         event_type = event.get("type", "unknown")
@@ -205,70 +410,156 @@ async def handle_client(client_ws, user_id: Optional[int] = None) -> None:
             ready_event.set()
         if event_type == "error":
             logger.error("OpenAI error [%s]: %s", client_id, event)
+        if event_type in ("input_audio_buffer.speech_started", "input_audio_buffer.speech_stopped"):
+            await input_aggregator.flush()
         if event_type == "response.audio.delta":
             state["speaking"] = True
         if event_type == "response.audio.done":
             state["speaking"] = False
 
-    openai_client.set_event_handler(
-        fanout_event_handler(
-            [log_event_type, audio_relay.handle_event, forward_user_transcript, pipeline.handle_event]
-        )
+    # Ready-state logic runs inline; the relay and the user-text lane (transcript
+    # forwarding, then LLM extraction) each drain their own ordered queue, so a
+    # slow pipeline no longer holds up audio for the next upstream event.
+    # Pipeline failures still reach the learner as the fallback message.
+    fanout = ConcurrentFanout(logger=logger)
+    log_event_type = fanout.add(log_event_type, name="ready_state", synchronous=True)
+    relay_handler = fanout.add(audio_relay.handle_event, name="audio_relay")
+    user_text_handler = fanout.add(handle_user_text, name="user_text", error_handler=realtime_error_handler)
+
+    # Audio deltas reach the relay as a sliced `delta`; events nobody below subscribes to are never parsed.
+    router = EventRouter(logger=logger)
+    router.subscribe(log_event_type, "response.audio.delta", fields=())
+    router.subscribe(
+        log_event_type,
+        "session.updated",
+        "input_audio_buffer.cleared",
+        "error",
+        "input_audio_buffer.speech_started",
+        "input_audio_buffer.speech_stopped",
+        "response.audio.done",
     )
-    openai_client.set_error_handler(build_realtime_error_handler(send_to_client))
-
-    openai_task = asyncio.create_task(openai_client.connect_and_run())
+    router.subscribe(relay_handler, "response.audio.delta", fields=("delta",))
+    router.subscribe(relay_handler, *RELAY_EVENT_TYPES)
+    router.subscribe(user_text_handler, *TRANSCRIPTION_EVENT_TYPES, *USER_TEXT_EVENT_TYPES)
+    openai_client.set_event_router(router)
+    openai_client.set_error_handler(realtime_error_handler)
+
+    if pooled is not None:
+        openai_task = pooled.task
+    else:
+        openai_task = asyncio.create_task(openai_client.connect_and_run())
     connected = await openai_client.wait_until_connected(timeout=10.0)
     if not connected:
-        await client_ws.send(json.dumps({"type": "error", "message": "Realtime connection timeout"}))
+        await send_to_client({"type": "error", "message": "Realtime connection timeout"})
         await openai_client.close()
         openai_task.cancel()
+        await fanout.close()
+        await outbound.close()
         return
     ready = await _wait_ready(ready_event, timeout=10.0)
     if not ready:
-        await client_ws.send(json.dumps({"type": "error", "message": "Realtime session not ready"}))
+        await send_to_client({"type": "error", "message": "Realtime session not ready"})
         await openai_client.close()
         openai_task.cancel()
+        await fanout.close()
+        await outbound.close()
         return
-    await client_ws.send(json.dumps({"type": "ready"}))
+    await send_to_client({"type": "ready", "audio_transport": wire.transport, "audio_codec": wire.codec.name})
+    time_to_ready = asyncio.get_running_loop().time() - connected_at
+    if pool is not None:
+        pool.metrics.record_time_to_ready(time_to_ready)
+    logger.info(
+        "Client ready [%s]: %.0f ms (pool %s)",
+        client_id,
+        time_to_ready * 1000.0,
+        "hit" if pooled is not None else "miss",
+    )
+    monitor_task: Optional[asyncio.Task] = None
+    if downstream is not None:
+        monitor_task = asyncio.create_task(
+            run_link_monitor(
+                downstream,
+                link_ping,
+                observe_outbound,
+                lambda level: send_to_client(quality_event(level)),
+                logger=logger,
+            )
+        )
     try:
         async for message in client_ws:
             # logger.info("Client event: %s", _safe_event_type(message))
-            await handle_client_message(message, openai_client, state, use_server_vad)
+            await handle_client_message(
+                message, openai_client, state, use_server_vad, input_aggregator, input_vad
+            )
     finally:
+        if monitor_task is not None:
+            monitor_task.cancel()
+        input_aggregator.close()
         await openai_client.close()
         openai_task.cancel()
+        await fanout.close()
+        await outbound.close()
+        logger.info("Client outbound [%s]: %s", client_id, outbound.snapshot())
+        logger.info("Client ingress [%s]: %s", client_id, input_aggregator.snapshot())
+        if input_vad is not None:
+            logger.info("Client VAD gate [%s]: %s", client_id, input_vad.snapshot())
+        if downstream is not None:
+            logger.info("Client downstream [%s]: %s", client_id, downstream.snapshot())
+        transcript_coalescer.close()
+        logger.info("Client egress [%s]: %s", client_id, output_coalescer.snapshot())
+        logger.info("Client transcripts [%s]: %s", client_id, transcript_coalescer.snapshot())
+        logger.info("Realtime routing [%s]: %s", client_id, router.snapshot())
+        logger.info("Realtime handlers [%s]: %s", client_id, fanout.snapshot())
 
 
 async def handle_client_message(
-    message: str,
+    message: Union[str, bytes],
     openai_client: RealtimeWebSocketClient,
     state: dict[str, bool],
     use_server_vad: bool,
+    aggregator: Optional[InputAudioAggregator] = None,
+    vad: Optional[AudioController] = None,
 ) -> None:
+    if isinstance(message, (bytes, bytearray, memoryview)):
+        await _handle_binary_audio_frame(message, openai_client, state, aggregator, vad)
+        return
     try:
-        payload = json.loads(message)
+        payload = get_json_codec().loads(message)
     except json.JSONDecodeError:
         return
 
     msg_type = payload.get("type")
+    if msg_type == "pong":
+        probe = state.get("ping_probe")
+        if probe is not None:
+            probe.pong(payload.get("id"))
+        return
     if msg_type == "input_audio_chunk":
         if state.get("speaking"):
             return
         audio = payload.get("audio")
-        sample_rate = payload.get("sample_rate")
-        if isinstance(sample_rate, int) and sample_rate > 0:
-            state["sample_rate"] = sample_rate
+        _update_input_sample_rate(state, payload.get("sample_rate"))
         if isinstance(audio, str) and audio:
-            try:
-                audio_bytes = base64.b64decode(audio)
-            except (ValueError, binascii.Error):
+            # Forward the client's base64 as-is; only its decoded size is needed here.
+            audio_len = base64_decoded_length(audio)
+            if audio_len <= 0:
                 return
-            if not audio_bytes:
+            codec = state.get("input_codec")
+            if vad is not None or codec is not None or state["sample_rate"] != REALTIME_SAMPLE_RATE:
+                try:
+                    pcm = binascii.a2b_base64(audio)
+                except binascii.Error:
+                    return
+                if codec is not None:
+                    pcm = codec.decode(pcm)
+                await _forward_input_pcm(pcm, openai_client, state, aggregator, vad)
                 return
-            await openai_client.send_event({"type": "input_audio_buffer.append", "audio": audio})
+            if aggregator is not None:
+                await aggregator.add_base64(audio, audio_len)
+            else:
+                await openai_client.send_event({"type": "input_audio_buffer.append", "audio": audio})
             state["has_audio"] = True
-            state["total_bytes"] += len(audio_bytes)
+            state["total_bytes"] += audio_len
         return
     if msg_type == "input_audio_commit":
         if state.get("speaking"):
@@ -276,9 +567,11 @@ async def handle_client_message(
         if use_server_vad:
             return
         if state.get("has_audio"):
-            sample_rate = state.get("sample_rate", 24000)
-            min_bytes = int(sample_rate * 0.1 * 2)
+            # total_bytes counts upstream (24 kHz) bytes, whatever the client rate.
+            min_bytes = int(REALTIME_SAMPLE_RATE * 0.1 * 2)
             if state.get("total_bytes", 0) >= min_bytes:
+                if aggregator is not None:
+                    await aggregator.flush()
                 await openai_client.send_event({"type": "input_audio_buffer.commit"})
             state["has_audio"] = False
             state["total_bytes"] = 0
@@ -305,39 +598,139 @@ async def handle_client_message(
         return
 
 
-def _tts_pcm16_from_text(client: OpenAI, text: str) -> tuple[bytes, int]:
-    response = client.audio.speech.create(
-        model="gpt-4o-mini-tts",
-        voice="alloy",
-        input=text,
-        response_format="wav",
-    )
-    wav_bytes = response.read()
-    if not wav_bytes:
-        return b"", 24000
-    with wave.open(BytesIO(wav_bytes), "rb") as wav:
-        if wav.getsampwidth() != 2 or wav.getnchannels() != 1:
-            return b"", wav.getframerate()
-        return wav.readframes(wav.getnframes()), wav.getframerate()
+async def _handle_binary_audio_frame(
+    message: Union[bytes, bytearray, memoryview],
+    openai_client: RealtimeWebSocketClient,
+    state: dict[str, bool],
+    aggregator: Optional[InputAudioAggregator] = None,
+    vad: Optional[AudioController] = None,
+) -> None:
+    codec = state.get("input_codec")
+    try:
+        frame = decode_audio_frame(message, codec.name if codec is not None else AUDIO_CODEC_PCM16)
+    except ValueError:
+        return
+    if frame.frame_type != FRAME_INPUT_AUDIO or state.get("speaking"):
+        return
+    _update_input_sample_rate(state, frame.sample_rate)
+    pcm = codec.decode(frame.payload) if codec is not None else frame.payload
+    await _forward_input_pcm(pcm, openai_client, state, aggregator, vad)
+
+
+async def _forward_input_pcm(
+    pcm: Union[bytes, memoryview],
+    openai_client: RealtimeWebSocketClient,
+    state: dict[str, bool],
+    aggregator: Optional[InputAudioAggregator] = None,
+    vad: Optional[AudioController] = None,
+) -> None:
+    resampler = state.get("resampler")
+    if resampler is not None:
+        pcm = resampler.process(pcm)
+    if vad is not None:
+        pcm = vad.process_audio_stream(pcm)
+    if not pcm:
+        return
+    if aggregator is not None:
+        await aggregator.add_pcm(pcm)
+    else:
+        audio = base64.b64encode(pcm).decode("ascii")
+        await openai_client.send_event({"type": "input_audio_buffer.append", "audio": audio})
+    state["has_audio"] = True
+    state["total_bytes"] += len(pcm)
+
+
+def _update_input_sample_rate(state: dict[str, Any], sample_rate: Any) -> None:
+    """Track the client's native rate; anything but 24 kHz goes through a streaming resampler."""
+    if not isinstance(sample_rate, int) or not 8000 <= sample_rate <= 96000:
+        return
+    if sample_rate == state.get("sample_rate"):
+        return
+    state["sample_rate"] = sample_rate
+    state["resampler"] = StreamingResampler(sample_rate) if sample_rate != REALTIME_SAMPLE_RATE else None
+
+
+def _request_query(client_ws) -> dict[str, str]:
+    request = getattr(client_ws, "request", None)
+    path = getattr(request, "path", None) or getattr(client_ws, "path", None) or ""
+    return {key: values[-1] for key, values in parse_qs(urlsplit(path).query).items()}
+
+
+async def _stream_tts_to_client(
+    send_to_client: ClientSender,
+    provider: TTSProvider,
+    text: str,
+    pacing: AudioPacingConfig,
+    downstream: Optional[AdaptiveDownstream] = None,
+) -> Optional[float]:
+    """Forward TTS audio as it streams in; returns the loop time of the first delta."""
+    return await _stream_pcm16_audio(send_to_client, stream_tts_pcm16(provider, text), pacing, downstream)
 
 
-async def _send_pcm16_audio(send_to_client, audio_bytes: bytes, sample_rate: int) -> None:
+async def _send_pcm16_audio(
+    send_to_client,
+    audio_bytes: bytes,
+    sample_rate: int,
+    pacing: Optional[AudioPacingConfig] = None,
+) -> None:
     if not audio_bytes:
         return
-    chunk_ms = 100
-    chunk_size = int(sample_rate * (chunk_ms / 1000.0) * 2)
-    for offset in range(0, len(audio_bytes), chunk_size):
-        chunk = audio_bytes[offset : offset + chunk_size]
+
+    async def _whole() -> AsyncIterator[tuple[bytes, int]]:
+        yield audio_bytes, sample_rate
+
+    await _stream_pcm16_audio(send_to_client, _whole(), pacing)
+
+
+async def _stream_pcm16_audio(
+    send_to_client: ClientSender,
+    pcm_stream: AsyncIterator[tuple[bytes, int]],
+    pacing: Optional[AudioPacingConfig] = None,
+    downstream: Optional[AdaptiveDownstream] = None,
+) -> Optional[float]:
+    pacing = pacing or AudioPacingConfig()
+    pacer = AudioPacer(pacing.initial_burst_ms)
+    buffer = bytearray()
+    sample_rate = 24000
+    first_audio_at: Optional[float] = None
+
+    async def _send_chunk(chunk: bytes) -> None:
+        nonlocal first_audio_at
+        await pacer.wait_turn()
+        # Raw PCM; the client wire base64-encodes it only for JSON transports.
         payload = {
             "type": "response.audio.delta",
-            "delta": base64.b64encode(chunk).decode("ascii"),
+            "delta": chunk,
             "sample_rate": sample_rate,
         }
         await send_to_client(payload)
-        await asyncio.sleep(chunk_ms / 1000.0)
-    await send_to_client({"type": "response.audio.done"})
-
-
+        if first_audio_at is None:
+            first_audio_at = pacer.now()
+        pacer.advance(len(chunk) / (2 * sample_rate))
+
+    async for pcm, rate in pcm_stream:
+        if downstream is not None:
+            pcm, rate = downstream.convert(pcm, rate, "tts")
+        if rate != sample_rate and buffer:
+            # Level changed mid-utterance: finish the old-rate audio first.
+            await _send_chunk(bytes(buffer))
+            buffer.clear()
+        sample_rate = rate
+        buffer.extend(pcm)
+        chunk_size = pacing.chunk_bytes(sample_rate)
+        if downstream is not None and downstream.level.chunk_ms > pacing.chunk_ms:
+            chunk_size = replace(pacing, chunk_ms=downstream.level.chunk_ms).chunk_bytes(sample_rate)
+        while len(buffer) >= chunk_size:
+            chunk = bytes(buffer[:chunk_size])
+            del buffer[:chunk_size]
+            await _send_chunk(chunk)
+    if buffer:
+        await _send_chunk(bytes(buffer))
+    if downstream is not None:
+        downstream.end_stream("tts")
+    if first_audio_at is not None:
+        await send_to_client({"type": "response.audio.done"})
+    return first_audio_at
 
 
 async def _wait_ready(event: asyncio.Event, timeout: float) -> bool:
@@ -378,23 +771,52 @@ async def _persist_scenario_state(
         repo = ChatRepository(db)
         await repo.create_session_log(session_data, user_id=user_id)
 
-async def _generate_session_title(
-    config: AppConfig,
-    *,
-    scenario_state: dict[str, Any],
-    transcripts: list[str],
-) -> str:
-    prompt = _build_title_prompt(scenario_state, transcripts)
-    try:
-        title = await asyncio.to_thread(
-            _request_title,
-            config.api_key,
-            config.llm_model,
-            prompt,
-        )
-    except Exception:
-        return _build_session_title(scenario_state)
-    return _normalize_title(title, fallback=_build_session_title(scenario_state))
+
+async def _persist_completion(job: CompletionJob) -> None:
+    await _persist_scenario_state(
+        session_id=job.session_id,
+        scenario_state=job.scenario_state,
+        title=job.fallback_title,
+        user_id=job.user_id,
+    )
+
+
+class DatabaseCompletionOutbox:
+    """CompletionOutbox stored in the backend DB (scenario_completion_outbox)."""
+
+    async def add(self, job: CompletionJob) -> None:
+        async with AsyncSessionLocal() as db:
+            await ScenarioOutboxRepository(db).add(job.session_id, job.to_payload())
+
+    async def mark(self, session_id: str, status: str, error: Optional[str] = None) -> None:
+        async with AsyncSessionLocal() as db:
+            await ScenarioOutboxRepository(db).mark(session_id, status, error)
+
+    async def remove(self, session_id: str) -> None:
+        async with AsyncSessionLocal() as db:
+            await ScenarioOutboxRepository(db).remove(session_id)
+
+    async def unfinished(self) -> list[CompletionJob]:
+        async with AsyncSessionLocal() as db:
+            rows = await ScenarioOutboxRepository(db).list_unfinished()
+        return [
+            CompletionJob.from_payload(json.loads(row.payload_json), persisted=row.status == COMPLETION_PERSISTED)
+            for row in rows
+        ]
+
+
+async def _generate_completion_title(job: CompletionJob) -> str:
+    config = job.config or AppConfig.from_env()
+    prompt = _build_title_prompt(job.scenario_state, job.transcripts)
+    clients = get_openai_clients()
+    async with clients.slot():
+        title = await _request_title(clients.client(config.api_key), config.llm_model, prompt)
+    return _normalize_title(title, fallback=job.fallback_title)
+
+
+async def _backfill_session_title(session_id: str, title: str) -> None:
+    async with AsyncSessionLocal() as db:
+        await ChatRepository(db).update_session_title(session_id, title)
 
 
 def _build_title_prompt(scenario_state: dict[str, Any], transcripts: list[str]) -> str:
@@ -411,17 +833,16 @@ def _build_title_prompt(scenario_state: dict[str, Any], transcripts: list[str])
     )
 
 
-def _request_title(api_key: str, model: str, prompt: str) -> str:
-    client = OpenAI(api_key=api_key)
+async def _request_title(client: Any, model: str, prompt: str) -> str:
     if hasattr(client, "responses"):
         try:
-            response = client.responses.create(
+            response = await client.responses.create(
                 model=model,
                 input=prompt,
                 temperature=0.7,
             )
         except TypeError:
-            response = client.responses.create(
+            response = await client.responses.create(
                 model=model,
                 input=prompt,
             )
@@ -430,7 +851,7 @@ def _request_title(api_key: str, model: str, prompt: str) -> str:
             return text.strip()
         return _extract_text_from_response(response)
     if hasattr(client, "chat"):
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model=model,
             messages=[{"role": "user", "content": prompt}],
             temperature=0.7,
@@ -1,18 +1,236 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Awaitable, Callable, Iterable, Union
+import logging
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Iterable, Optional, Union
 
 EventHandler = Callable[[dict[str, Any]], Union[Awaitable[None], None]]
+ErrorHandler = Callable[[Exception], Union[Awaitable[Any], Any]]
 
+# What a handler failure does to that handler; the other handlers never see it.
+ON_ERROR_CONTINUE = "continue"  # log it and deliver the next event as usual
+ON_ERROR_DISABLE = "disable"  # log it and stop delivering to this handler only
+ON_ERROR_RAISE = "raise"  # fail the next dispatch (HandlerFailedError): the whole stream ends, as before
+ON_ERROR_POLICIES = (ON_ERROR_CONTINUE, ON_ERROR_DISABLE, ON_ERROR_RAISE)
 
-def fanout_event_handler(handlers: Iterable[EventHandler]) -> EventHandler:
-    handler_list = [handler for handler in handlers if handler is not None]
+DEFAULT_HANDLER_QUEUE = 256
 
-    async def _handler(event: dict[str, Any]) -> None:
-        for handler in handler_list:
-            result = handler(event)
+
+class HandlerFailedError(RuntimeError):
+    """A queued handler with on_error="raise" failed; `__cause__` is its exception."""
+
+
+@dataclass
+class HandlerStats:
+    events: int = 0
+    handled: int = 0
+    failures: int = 0
+    skipped: int = 0
+    blocked: int = 0
+    max_depth: int = 0
+    lag_ms_total: float = 0.0
+    lag_ms_max: float = 0.0
+
+
+class _HandlerLane:
+    def __init__(
+        self,
+        handler: EventHandler,
+        name: str,
+        *,
+        synchronous: bool,
+        on_error: str,
+        error_handler: Optional[ErrorHandler],
+        max_queue: int,
+        logger: logging.Logger,
+    ) -> None:
+        if on_error not in ON_ERROR_POLICIES:
+            raise ValueError(f"on_error must be one of {ON_ERROR_POLICIES}")
+        self.handler = handler
+        self.name = name
+        self.synchronous = synchronous
+        self.on_error = on_error
+        self.error_handler = error_handler
+        self.max_queue = max(1, max_queue)
+        self.stats = HandlerStats()
+        self.disabled = False
+        self._logger = logger
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._error: Optional[BaseException] = None
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def put(self, event: dict[str, Any]) -> None:
+        if self._error is not None:
+            raise HandlerFailedError(f"event handler {self.name} failed") from self._error
+        self.stats.events += 1
+        if self.disabled:
+            self.stats.skipped += 1
+            return
+        if self.synchronous:
+            await self._run(event)
+            return
+        if self._queue is None:
+            self._queue = asyncio.Queue(self.max_queue)
+            self._worker = asyncio.create_task(self._drain())
+        if self._queue.full():
+            # Backpressure: the upstream reader waits instead of dropping events.
+            self.stats.blocked += 1
+        await self._queue.put((time.perf_counter(), event))
+        self.stats.max_depth = max(self.stats.max_depth, self._queue.qsize())
+
+    async def join(self) -> None:
+        if self._queue is not None and self._worker is not None and not self._worker.done():
+            await self._queue.join()
+
+    async def close(self) -> None:
+        worker, self._worker = self._worker, None
+        if worker is None:
+            return
+        worker.cancel()
+        try:
+            await worker
+        except asyncio.CancelledError:
+            pass
+
+    def snapshot(self) -> dict[str, Any]:
+        data = asdict(self.stats)
+        lag_total = data.pop("lag_ms_total")
+        handled = self.stats.handled + self.stats.failures
+        data["lag_ms_mean"] = round(lag_total / handled, 2) if handled and not self.synchronous else 0.0
+        data["lag_ms_max"] = round(data["lag_ms_max"], 2)
+        data["depth"] = self.depth
+        data["disabled"] = self.disabled
+        return data
+
+    async def _drain(self) -> None:
+        queue = self._queue
+        while True:
+            enqueued_at, event = await queue.get()
+            try:
+                if self.disabled:
+                    self.stats.skipped += 1
+                    continue
+                lag_ms = (time.perf_counter() - enqueued_at) * 1000.0
+                self.stats.lag_ms_total += lag_ms
+                self.stats.lag_ms_max = max(self.stats.lag_ms_max, lag_ms)
+                try:
+                    await self._run(event)
+                except Exception:
+                    # ON_ERROR_RAISE: _run kept the error for the next put(); stop this lane.
+                    self.disabled = True
+            finally:
+                queue.task_done()
+
+    async def _run(self, event: dict[str, Any]) -> None:
+        try:
+            result = self.handler(event)
+            if asyncio.iscoroutine(result):
+                await result
+        except Exception as exc:
+            self.stats.failures += 1
+            if self.on_error == ON_ERROR_RAISE:
+                if not self.synchronous:
+                    self._error = exc
+                raise
+            self._logger.exception("Event handler %s failed on %s", self.name, event.get("type"))
+            if self.on_error == ON_ERROR_DISABLE:
+                self.disabled = True
+            await self._report(exc)
+            return
+        self.stats.handled += 1
+
+    async def _report(self, exc: Exception) -> None:
+        if self.error_handler is None:
+            return
+        try:
+            result = self.error_handler(exc)
             if asyncio.iscoroutine(result):
                 await result
+        except Exception:
+            self._logger.exception("Error handler of %s failed", self.name)
+
+
+class ConcurrentFanout:
+    """Delivers events to each handler through its own bounded, ordered queue.
+
+    Every handler added with `add()` gets a worker task that runs its events
+    one at a time in arrival order, so a slow handler (LLM extraction in the
+    pipeline) only delays itself. Handlers marked `synchronous` run inline in
+    the caller, before it moves on; use them for state that later events rely
+    on (session ready flags). A full queue makes the caller wait: no event is
+    dropped, the upstream reader slows down instead.
+
+    Failure isolation is per handler and set with `on_error`: `continue` logs
+    the exception and keeps delivering, `disable` logs it and stops delivering
+    to that handler only, `raise` fails the next dispatch with HandlerFailedError
+    so the whole stream ends as it used to (a synchronous handler re-raises
+    right away). With `continue`/`disable`, an `error_handler` also receives
+    the exception (e.g. to send the learner a fallback). `snapshot()` reports
+    per-handler queue lag.
+    """
+
+    def __init__(self, *, max_queue: int = DEFAULT_HANDLER_QUEUE, logger: Optional[logging.Logger] = None) -> None:
+        self._max_queue = max_queue
+        self._logger = logger or logging.getLogger(__name__)
+        self._lanes: list[_HandlerLane] = []
+
+    def add(
+        self,
+        handler: EventHandler,
+        *,
+        name: Optional[str] = None,
+        synchronous: bool = False,
+        on_error: str = ON_ERROR_CONTINUE,
+        error_handler: Optional[ErrorHandler] = None,
+        max_queue: Optional[int] = None,
+    ) -> EventHandler:
+        """Register `handler`; returns the callable that queues an event for it (one lane per call)."""
+        lane = _HandlerLane(
+            handler,
+            name or getattr(handler, "__qualname__", None) or repr(handler),
+            synchronous=synchronous,
+            on_error=on_error,
+            error_handler=error_handler,
+            max_queue=max_queue or self._max_queue,
+            logger=self._logger,
+        )
+        self._lanes.append(lane)
+        return lane.put
+
+    async def __call__(self, event: dict[str, Any]) -> None:
+        for lane in self._lanes:
+            await lane.put(event)
+
+    async def join(self) -> None:
+        """Wait until every queued event has been handled."""
+        for lane in self._lanes:
+            await lane.join()
+
+    async def close(self) -> None:
+        for lane in self._lanes:
+            await lane.close()
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        return {lane.name: lane.snapshot() for lane in self._lanes}
+
 
-    return _handler
+def fanout_event_handler(
+    handlers: Iterable[EventHandler],
+    *,
+    synchronous: Iterable[EventHandler] = (),
+    max_queue: int = DEFAULT_HANDLER_QUEUE,
+    logger: Optional[logging.Logger] = None,
+) -> ConcurrentFanout:
+    """ConcurrentFanout over `handlers`; those also listed in `synchronous` run inline."""
+    inline = list(synchronous)
+    fanout = ConcurrentFanout(max_queue=max_queue, logger=logger)
+    for handler in handlers:
+        if handler is not None:
+            fanout.add(handler, synchronous=handler in inline)
+    return fanout
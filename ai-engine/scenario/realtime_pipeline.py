@@ -7,6 +7,9 @@ from .scenario_builder import ScenarioBuilder
 SendResponse = Callable[[str], Any]
 OnComplete = Callable[[ScenarioBuilder], Any]
 
+# Events that can carry user text (EventRouter patterns).
+USER_TEXT_EVENT_TYPES = ("input_audio_buffer.transcription.completed", "conversation.item.*")
+
 
 class RealtimeScenarioPipeline:
     def __init__(
@@ -31,22 +34,22 @@ class RealtimeScenarioPipeline:
         if not user_text:
             return
 
-        self._builder.ingest_user_text(user_text)
+        await self._builder.ingest_user_text(user_text)
         if self._builder.state.is_complete():
             if self._send_final_response:
-                await self._maybe_await(self._send_response(self._builder.finalize_scenario()))
+                await self._maybe_await(self._send_response(await self._builder.finalize_scenario()))
             if self._on_complete:
                 await self._maybe_await(self._on_complete(self._builder))
             return
 
-        question = self._builder.build_follow_up_question()
+        question = await self._builder.build_follow_up_question()
         if question is None:
             if self._builder.state.attempts >= self._max_attempts:
                 if self._send_final_response:
-                    await self._maybe_await(self._send_response(self._builder.finalize_with_fallback()))
+                    await self._maybe_await(self._send_response(await self._builder.finalize_with_fallback()))
             else:
                 if self._send_final_response:
-                    await self._maybe_await(self._send_response(self._builder.finalize_scenario()))
+                    await self._maybe_await(self._send_response(await self._builder.finalize_scenario()))
             if self._on_complete:
                 await self._maybe_await(self._on_complete(self._builder))
             return
@@ -17,6 +17,10 @@ except ImportError:  # pragma: no cover - optional dependency
     websockets = None
     WebSocketClientProtocol = Any
 
+from .event_router import EventRouter
+from .json_codec import get_json_codec
+from .openai_clients import OpenAIClientRegistry, get_openai_clients
+
 EventHandler = Callable[[dict[str, Any]], Union[Awaitable[None], None]]
 ErrorHandler = Callable[[Exception], Union[Awaitable[None], None]]
 
@@ -37,20 +41,40 @@ class RealtimeSessionInfo:
 
 
 class RealtimeSessionManager:
-    def __init__(self, config: RealtimeConfig) -> None:
+    def __init__(self, config: RealtimeConfig, clients: Optional[OpenAIClientRegistry] = None) -> None:
         self._config = config
+        self._clients = clients
+        self._sync_client: Optional[OpenAI] = None
 
     def create_session(self) -> RealtimeSessionInfo:
-        client = OpenAI(api_key=self._config.api_key)
-        bearer_token: Optional[str] = None
+        # Sync callers cannot use the async registry; keep one client per manager instead of one per call.
+        if self._sync_client is None:
+            self._sync_client = OpenAI(api_key=self._config.api_key)
+        client = self._sync_client
+        session = None
+        if self._supports_ephemeral_sessions(client):
+            session = client.realtime.sessions.create(model=self._config.model)
+        return self._session_info(session)
 
+    async def create_session_async(self) -> RealtimeSessionInfo:
+        clients = self._clients or get_openai_clients()
+        client = clients.client(self._config.api_key)
+        session = None
+        if self._supports_ephemeral_sessions(client):
+            async with clients.slot():
+                session = await client.realtime.sessions.create(model=self._config.model)
+        return self._session_info(session)
+
+    @staticmethod
+    def _supports_ephemeral_sessions(client: Any) -> bool:
         # Prefer ephemeral session creation when supported by SDK.
-        if hasattr(client, "realtime") and hasattr(client.realtime, "sessions"):
-            session = client.realtime.sessions.create(model=self._config.model)
-            client_secret = getattr(session, "client_secret", None)
-            if client_secret is not None:
-                bearer_token = getattr(client_secret, "value", None)
+        return hasattr(client, "realtime") and hasattr(client.realtime, "sessions")
 
+    def _session_info(self, session: Any) -> RealtimeSessionInfo:
+        bearer_token: Optional[str] = None
+        client_secret = getattr(session, "client_secret", None)
+        if client_secret is not None:
+            bearer_token = getattr(client_secret, "value", None)
         wss_url = self._build_wss_url(self._config.base_url, self._config.model)
         return RealtimeSessionInfo(wss_url=wss_url, bearer_token=bearer_token, model=self._config.model)
 
@@ -79,6 +103,8 @@ class RealtimeWebSocketClient:
         self._session = session
         self._api_key = api_key
         self._event_handler = event_handler
+        self._event_router: Optional[EventRouter] = None
+        self._json = get_json_codec()
         self._session_config = session_config
         self._max_retries = max_retries
         self._error_handler = error_handler
@@ -128,8 +154,12 @@ class RealtimeWebSocketClient:
             raise RuntimeError("WebSocket is not connected")
 
         async for message in self._ws:
+            router = self._event_router
+            if router is not None:
+                await router.dispatch(message)
+                continue
             try:
-                payload = json.loads(message)
+                payload = self._json.loads(message)
             except json.JSONDecodeError:
                 self._logger.warning("Skipping non-JSON message from Realtime")
                 continue
@@ -140,7 +170,7 @@ class RealtimeWebSocketClient:
     async def send_event(self, event: dict[str, Any]) -> None:
         if self._ws is None:
             raise RuntimeError("WebSocket is not connected")
-        await self._ws.send(json.dumps(event))
+        await self._ws.send(self._json.dumps_event(event))
 
     async def send_audio_chunk(self, audio_bytes: bytes) -> None:
         encoded = base64.b64encode(audio_bytes).decode("ascii")
@@ -151,6 +181,11 @@ class RealtimeWebSocketClient:
 
     def set_event_handler(self, event_handler: EventHandler) -> None:
         self._event_handler = event_handler
+        self._event_router = None
+
+    def set_event_router(self, router: EventRouter) -> None:
+        """Hand raw messages to `router`, which parses only what its subscribers need."""
+        self._event_router = router
 
     def set_error_handler(self, error_handler: Optional[ErrorHandler]) -> None:
         self._error_handler = error_handler
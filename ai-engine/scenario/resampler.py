@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from math import ceil, gcd
+from typing import Optional, Union
+
+import numpy as np
+
+REALTIME_SAMPLE_RATE = 24000
+
+
+def _design_polyphase_bank(up: int, down: int, taps_per_phase: int, beta: float) -> np.ndarray:
+    """Kaiser-windowed sinc low-pass split into `up` phases of `taps_per_phase` taps."""
+    length = up * taps_per_phase
+    cutoff = 0.5 / max(up, down) * 0.92
+    n = np.arange(length) - (length - 1) / 2.0
+    prototype = 2.0 * cutoff * np.sinc(2.0 * cutoff * n) * np.kaiser(length, beta)
+    prototype *= up / prototype.sum()
+    # bank[p, k] = h[p + k * up]: the taps applied to x[base - k] for phase p.
+    return prototype.reshape(taps_per_phase, up).T.astype(np.float32).copy()
+
+
+class StreamingResampler:
+    """Streaming rational-ratio polyphase resampler for mono PCM16.
+
+    Filter history and the fractional output position carry across
+    `process()` calls, so chunk boundaries are seamless. Each chunk is one
+    vectorized gather + multiply-accumulate over all of its output samples;
+    the input staging buffer is preallocated and only grows.
+    """
+
+    def __init__(
+        self,
+        in_rate: int,
+        out_rate: int = REALTIME_SAMPLE_RATE,
+        *,
+        taps_per_phase: Optional[int] = None,
+        zero_crossings: int = 12,
+        beta: float = 8.0,
+        initial_capacity: int = 4096,
+    ) -> None:
+        if in_rate <= 0 or out_rate <= 0:
+            raise ValueError("sample rates must be positive")
+        common = gcd(in_rate, out_rate)
+        self.in_rate = in_rate
+        self.out_rate = out_rate
+        self.up = out_rate // common
+        self.down = in_rate // common
+        self.passthrough = self.up == self.down
+        if taps_per_phase is None:
+            # Wide enough for `zero_crossings` lobes of the sinc at the lower of the two rates.
+            taps_per_phase = ceil(2 * zero_crossings * max(self.up, self.down) / self.up)
+        self._taps = taps_per_phase
+        self._bank = _design_polyphase_bank(self.up, self.down, taps_per_phase, beta)
+        self._tap_offsets = np.arange(taps_per_phase - 1, -1, -1)
+        self._history = taps_per_phase - 1
+        self._buffer = np.zeros(self._history + initial_capacity, dtype=np.float32)
+        self._position = 0  # next output position, in 1/up input samples from the chunk start
+        self._odd_byte = b""
+
+    def process(self, pcm: Union[bytes, bytearray, memoryview]) -> bytes:
+        if self.passthrough:
+            return bytes(pcm)
+        data = self._odd_byte + bytes(pcm) if self._odd_byte else pcm
+        usable = len(data) & ~1
+        self._odd_byte = bytes(data[usable:])
+        samples = np.frombuffer(data, dtype="<i2", count=usable // 2)
+        count = samples.size
+        if count == 0:
+            return b""
+
+        history = self._history
+        if self._buffer.size < history + count:
+            grown = np.zeros(history + count * 2, dtype=np.float32)
+            grown[:history] = self._buffer[:history]
+            self._buffer = grown
+        buffer = self._buffer
+        buffer[history : history + count] = samples
+
+        limit = count * self.up
+        if self._position < limit:
+            positions = np.arange(self._position, limit, self.down)
+            base = positions // self.up
+            phase = positions - base * self.up
+            # x[base - k] lives at buffer[history + base - k].
+            windows = buffer[base[:, None] + self._tap_offsets[None, :]]
+            out = np.einsum("ij,ij->i", windows, self._bank[phase])
+            self._position = int(positions[-1]) + self.down - limit
+        else:
+            out = np.zeros(0, dtype=np.float32)
+            self._position -= limit
+
+        # Keep the last `history` input samples for the next chunk.
+        buffer[:history] = buffer[count : count + history]
+        return np.clip(np.rint(out), -32768, 32767).astype("<i2").tobytes()
+
+    def reset(self) -> None:
+        self._buffer[: self._history] = 0.0
+        self._position = 0
+        self._odd_byte = b""
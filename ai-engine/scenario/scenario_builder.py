@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 import json
-from typing import Callable, Optional
+from typing import Any, Awaitable, Callable, Optional, Union
 
 from .scenario_state import ScenarioState
 
-Extractor = Callable[[str], dict[str, Optional[str]]]
-QuestionGenerator = Callable[[ScenarioState, list[str]], str]
-FinalGenerator = Callable[[ScenarioState], str]
+Extractor = Callable[[str], Union[Awaitable[dict[str, Optional[str]]], dict[str, Optional[str]]]]
+QuestionGenerator = Callable[[ScenarioState, list[str]], Union[Awaitable[str], str]]
+FinalGenerator = Callable[[ScenarioState], Union[Awaitable[str], str]]
 
 
 class ScenarioBuilder:
@@ -41,20 +41,20 @@ class ScenarioBuilder:
     def state(self) -> ScenarioState:
         return self._state
 
-    def ingest_user_text(self, text: str) -> None:
+    async def ingest_user_text(self, text: str) -> None:
         if not text.strip():
             return
         if self._state.completed:
             return
         if self._extractor is None:
             return
-        extracted = self._extractor(text)
+        extracted = await _resolve(self._extractor(text))
         self._state.update_from_extraction(extracted)
 
     def get_missing_fields(self) -> list[str]:
         return self._state.missing_fields()
 
-    def build_follow_up_question(self) -> str | None:
+    async def build_follow_up_question(self) -> str | None:
         if self._state.completed:
             return None
         missing = self.get_missing_fields()
@@ -68,13 +68,13 @@ class ScenarioBuilder:
         self._state.asked_fields.add(target)
         self._state.attempts += 1
         if self._question_generator:
-            response = self._question_generator(self._state, [target])
+            response = await _resolve(self._question_generator(self._state, [target]))
         else:
             response = self._default_questions.get(target, self._default_questions["goal"])
         response = self._sanitize_question(response)
         return response
 
-    def finalize_scenario(self) -> str:
+    async def finalize_scenario(self) -> str:
         if self._state.completed:
             place = self._state.place or ""
             partner = self._state.partner or ""
@@ -84,7 +84,7 @@ class ScenarioBuilder:
             )
         self._state.completed = True
         if self._final_generator:
-            response = self._final_generator(self._state)
+            response = await _resolve(self._final_generator(self._state))
             return response
         place = self._state.place or ""
         partner = self._state.partner or ""
@@ -94,19 +94,19 @@ class ScenarioBuilder:
         )
         return response
 
-    def finalize_with_fallback(self) -> str:
+    async def finalize_with_fallback(self) -> str:
         if self._state.completed:
-            return self.finalize_scenario()
+            return await self.finalize_scenario()
         if self._fallback_generator:
             for attempt in range(2):
-                response = self._fallback_generator(self._state)
+                response = await _resolve(self._fallback_generator(self._state))
                 extracted = self._extract_json_object(response)
                 if extracted:
                     self._state.update_from_extraction(extracted)
-                    return self.finalize_scenario()
+                    return await self.finalize_scenario()
                 if self._logger:
                     self._logger.warning("Fallback JSON parse failed (attempt %s)", attempt + 1)
-        return self.finalize_scenario()
+        return await self.finalize_scenario()
 
     def ensure_defaults(self) -> None:
         self._fill_defaults_if_missing()
@@ -150,3 +150,9 @@ class ScenarioBuilder:
         if len(words) > 15:
             return self._default_questions["goal"]
         return first_sentence
+
+
+async def _resolve(result: Any) -> Any:
+    if hasattr(result, "__await__"):
+        return await result
+    return result
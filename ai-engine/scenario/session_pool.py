@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from .openai_clients import OpenAIClientRegistry
+from .realtime_session import RealtimeConfig, RealtimeSessionManager, RealtimeWebSocketClient
+
+
+@dataclass
+class PooledRealtimeSession:
+    client: RealtimeWebSocketClient
+    task: asyncio.Task
+    created_at: float
+    warm_sec: float
+
+    def is_alive(self) -> bool:
+        return not self.task.done()
+
+
+@dataclass
+class RealtimePoolMetrics:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    warm_failures: int = 0
+    consecutive_failures: int = 0
+    time_to_ready_ms: deque = field(default_factory=lambda: deque(maxlen=256))
+
+    def record_time_to_ready(self, seconds: float) -> None:
+        self.time_to_ready_ms.append(seconds * 1000.0)
+
+    def snapshot(self) -> dict[str, Any]:
+        samples = sorted(self.time_to_ready_ms)
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 3) if total else 0.0,
+            "evictions": self.evictions,
+            "warm_failures": self.warm_failures,
+            "consecutive_failures": self.consecutive_failures,
+            "time_to_ready_ms_p50": _percentile(samples, 0.5),
+            "time_to_ready_ms_p95": _percentile(samples, 0.95),
+        }
+
+
+class RealtimeSessionPool:
+    """Per-worker pool of connected, configured and cleared Realtime clients.
+
+    Idle entries are evicted after `ttl_sec` or when their upstream socket
+    drops; the maintenance loop keeps `target_size` entries warm. After a
+    failed warm-up no new one starts for `backoff_base_sec`, doubling per
+    consecutive failure up to `backoff_max_sec`, so an outage or a bad key
+    does not hammer the sessions endpoint; a success resets the backoff.
+    Sessions are created through `clients`, the worker's shared registry.
+    """
+
+    def __init__(
+        self,
+        config: RealtimeConfig,
+        session_config: dict[str, Any],
+        *,
+        target_size: int = 2,
+        ttl_sec: float = 300.0,
+        ready_timeout: float = 10.0,
+        maintain_interval: float = 5.0,
+        backoff_base_sec: float = 5.0,
+        backoff_max_sec: float = 300.0,
+        clients: Optional[OpenAIClientRegistry] = None,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        self._config = config
+        self._session_config = session_config
+        self._target_size = max(0, target_size)
+        self._ttl_sec = ttl_sec
+        self._ready_timeout = ready_timeout
+        self._maintain_interval = maintain_interval
+        self._backoff_base_sec = backoff_base_sec
+        self._backoff_max_sec = backoff_max_sec
+        self._retry_at = 0.0
+        self._logger = logger or logging.getLogger(__name__)
+        self._manager = RealtimeSessionManager(config, clients)
+        self._idle: deque[PooledRealtimeSession] = deque()
+        self._warming = 0
+        self._refill_tasks: set[asyncio.Task] = set()
+        self._maintain_task: Optional[asyncio.Task] = None
+        self._closed = False
+        self.metrics = RealtimePoolMetrics()
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle)
+
+    async def start(self) -> None:
+        if self._maintain_task is not None or self._target_size == 0:
+            return
+        self._closed = False
+        self._refill()
+        self._maintain_task = asyncio.create_task(self._maintain_loop())
+
+    async def acquire(self) -> Optional[PooledRealtimeSession]:
+        now = asyncio.get_running_loop().time()
+        while self._idle:
+            pooled = self._idle.popleft()
+            if pooled.is_alive() and now - pooled.created_at < self._ttl_sec:
+                self.metrics.hits += 1
+                self._refill()
+                return pooled
+            await self._evict(pooled)
+        self.metrics.misses += 1
+        self._refill()
+        return None
+
+    async def close(self) -> None:
+        self._closed = True
+        if self._maintain_task is not None:
+            self._maintain_task.cancel()
+            self._maintain_task = None
+        for task in list(self._refill_tasks):
+            task.cancel()
+        while self._idle:
+            await self._discard(self._idle.popleft())
+
+    def _refill(self) -> None:
+        if self._closed or asyncio.get_running_loop().time() < self._retry_at:
+            return
+        missing = self._target_size - len(self._idle) - self._warming
+        for _ in range(max(0, missing)):
+            self._warming += 1
+            task = asyncio.create_task(self._warm_one())
+            self._refill_tasks.add(task)
+            task.add_done_callback(self._refill_tasks.discard)
+
+    async def _warm_one(self) -> None:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        client: Optional[RealtimeWebSocketClient] = None
+        task: Optional[asyncio.Task] = None
+        try:
+            session_info = await self._manager.create_session_async()
+            ready = asyncio.Event()
+            handshake = {"updated": False}
+
+            async def on_event(event: dict[str, Any]) -> None:
+                event_type = event.get("type")
+                if event_type == "session.updated" and not handshake["updated"]:
+                    handshake["updated"] = True
+                    await client.send_event({"type": "input_audio_buffer.clear"})
+                elif event_type == "input_audio_buffer.cleared" and handshake["updated"]:
+                    ready.set()
+
+            client = RealtimeWebSocketClient(
+                session=session_info,
+                api_key=self._config.api_key,
+                event_handler=on_event,
+                session_config=self._session_config,
+                max_retries=self._config.max_retries,
+                error_handler=self._on_idle_error,
+                logger=self._logger,
+            )
+            task = asyncio.create_task(client.connect_and_run())
+            await asyncio.wait_for(ready.wait(), timeout=self._ready_timeout)
+        except asyncio.CancelledError:
+            if client is not None:
+                await self._close_client(client, task)
+            raise
+        except Exception as exc:
+            self.metrics.warm_failures += 1
+            self.metrics.consecutive_failures += 1
+            delay = min(
+                self._backoff_max_sec,
+                self._backoff_base_sec * 2 ** (self.metrics.consecutive_failures - 1),
+            )
+            self._retry_at = max(self._retry_at, loop.time() + delay)
+            self._logger.warning("Realtime pool warm-up failed (retry in %.1fs): %s", delay, exc)
+            if client is not None:
+                await self._close_client(client, task)
+            return
+        finally:
+            self._warming -= 1
+
+        self.metrics.consecutive_failures = 0
+        self._retry_at = 0.0
+        client.set_event_handler(_discard_event)
+        if self._closed:
+            await self._close_client(client, task)
+            return
+        now = loop.time()
+        self._idle.append(
+            PooledRealtimeSession(client=client, task=task, created_at=now, warm_sec=now - started)
+        )
+
+    async def _maintain_loop(self) -> None:
+        while not self._closed:
+            await asyncio.sleep(self._maintain_interval)
+            now = asyncio.get_running_loop().time()
+            expired = [
+                pooled
+                for pooled in self._idle
+                if not pooled.is_alive() or now - pooled.created_at >= self._ttl_sec
+            ]
+            for pooled in expired:
+                self._idle.remove(pooled)
+            self._refill()
+            for pooled in expired:
+                await self._evict(pooled)
+
+    async def _evict(self, pooled: PooledRealtimeSession) -> None:
+        self.metrics.evictions += 1
+        await self._discard(pooled)
+
+    async def _discard(self, pooled: PooledRealtimeSession) -> None:
+        await self._close_client(pooled.client, pooled.task)
+
+    @staticmethod
+    async def _close_client(client: RealtimeWebSocketClient, task: Optional[asyncio.Task]) -> None:
+        try:
+            await client.close()
+        except Exception:
+            pass
+        if task is not None and not task.done():
+            task.cancel()
+
+    def _on_idle_error(self, exc: Exception) -> None:
+        self._logger.warning("Pooled Realtime session dropped: %s", exc)
+
+
+def _discard_event(_: dict[str, Any]) -> None:
+    return None
+
+
+def _percentile(samples: list[float], quantile: float) -> Optional[float]:
+    if not samples:
+        return None
+    index = min(len(samples) - 1, int(len(samples) * quantile))
+    return round(samples[index], 1)
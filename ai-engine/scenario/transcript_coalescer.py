@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Optional, Union
+
+TranscriptSender = Callable[[str], Union[Awaitable[None], None]]
+
+
+@dataclass
+class TranscriptCoalescingStats:
+    responses: int = 0
+    deltas_in: int = 0
+    events_out: int = 0
+    chars: int = 0
+
+
+class TranscriptDeltaCoalescer:
+    """Merges assistant transcript deltas into one event per `window_ms` or `max_chars`.
+
+    The first delta of a batch starts the window; the batch goes out when the
+    window ends or it reaches `max_chars`, whichever comes first. Callers
+    `end_response()` before sending `transcript.done` / `audio.done` (or when a
+    response is cancelled) so the merged text never trails them.
+    `window_ms=0` forwards every delta as-is.
+    """
+
+    def __init__(
+        self,
+        send: TranscriptSender,
+        *,
+        window_ms: int = 100,
+        max_chars: int = 80,
+    ) -> None:
+        self._send = send
+        self.window_ms = max(0, window_ms)
+        self.max_chars = max(1, max_chars)
+        self._parts: list[str] = []
+        self._pending_chars = 0
+        self._timer: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+        self._response = TranscriptCoalescingStats()
+        self.last_response: dict[str, Any] = {}
+        self.stats = TranscriptCoalescingStats()
+
+    @property
+    def pending_chars(self) -> int:
+        return self._pending_chars
+
+    async def add(self, delta: str) -> None:
+        if not delta:
+            return
+        self._response.deltas_in += 1
+        self._parts.append(delta)
+        self._pending_chars += len(delta)
+        if self._pending_chars >= self.max_chars or self.window_ms == 0:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_after(self.window_ms / 1000.0))
+
+    async def flush(self) -> None:
+        self._cancel_timer()
+        async with self._lock:
+            if not self._parts:
+                return
+            text = "".join(self._parts)
+            self._parts = []
+            self._pending_chars = 0
+            self._response.events_out += 1
+            self._response.chars += len(text)
+            result = self._send(text)
+            if hasattr(result, "__await__"):
+                await result
+
+    async def end_response(self) -> dict[str, Any]:
+        """Flush and close the per-response counters; returns them (deltas in -> events out)."""
+        await self.flush()
+        response = self._response
+        self._response = TranscriptCoalescingStats()
+        if response.deltas_in:
+            response.responses = 1
+            self.stats.responses += 1
+            self.stats.deltas_in += response.deltas_in
+            self.stats.events_out += response.events_out
+            self.stats.chars += response.chars
+        self.last_response = _with_reduction(asdict(response))
+        return self.last_response
+
+    def close(self) -> None:
+        self._cancel_timer()
+        self._parts = []
+        self._pending_chars = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        return _with_reduction(asdict(self.stats))
+
+    async def _flush_after(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        self._timer = None
+        await self.flush()
+
+    def _cancel_timer(self) -> None:
+        timer, self._timer = self._timer, None
+        if timer is not None and timer is not asyncio.current_task():
+            timer.cancel()
+
+
+def _with_reduction(data: dict[str, Any]) -> dict[str, Any]:
+    events = data["events_out"]
+    data["deltas_per_event"] = data["deltas_in"] / events if events else 0.0
+    return data
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import struct
+from contextlib import AsyncExitStack, nullcontext
+from typing import AsyncIterator, Optional, Protocol
+
+from .openai_clients import OpenAIClientRegistry
+
+DEFAULT_SAMPLE_RATE = 24000
+
+
+class TTSProvider(Protocol):
+    def stream(self, text: str) -> AsyncIterator[bytes]:
+        """Yield the raw response body (WAV or headerless PCM16) as it arrives."""
+        ...
+
+
+class OpenAITTSProvider:
+    def __init__(
+        self,
+        client,
+        *,
+        model: str = "gpt-4o-mini-tts",
+        voice: str = "alloy",
+        response_format: str = "wav",
+        read_chunk_size: int = 4800,
+        clients: Optional[OpenAIClientRegistry] = None,
+    ) -> None:
+        self._client = client
+        # Holds a registry slot only while the request is opened (until the headers
+        # arrive); paced playback of the body must not starve LLM/title requests.
+        self._clients = clients
+        self._model = model
+        self._voice = voice
+        self._response_format = response_format
+        self._read_chunk_size = read_chunk_size
+
+    async def stream(self, text: str) -> AsyncIterator[bytes]:
+        async with AsyncExitStack() as stack:
+            async with self._clients.slot() if self._clients is not None else nullcontext():
+                response = await stack.enter_async_context(
+                    self._client.audio.speech.with_streaming_response.create(
+                        model=self._model,
+                        voice=self._voice,
+                        input=text,
+                        response_format=self._response_format,
+                    )
+                )
+            async for chunk in response.iter_bytes(self._read_chunk_size):
+                if chunk:
+                    yield chunk
+
+
+class WavStreamParser:
+    """Incremental RIFF/WAVE header parser that passes PCM16 payload through.
+
+    Input that does not start with `RIFF` is treated as headerless PCM16 at
+    `default_sample_rate`. Streamed WAVs often carry a placeholder data size
+    (0 or 0xFFFFFFFF); in that case the payload runs until end of stream.
+    """
+
+    def __init__(self, default_sample_rate: int = DEFAULT_SAMPLE_RATE) -> None:
+        self.sample_rate = default_sample_rate
+        self.channels = 1
+        self.sample_width = 2
+        self._header = bytearray()
+        self._in_payload = False
+        self._remaining: Optional[int] = None
+        self._carry = b""
+
+    @property
+    def header_done(self) -> bool:
+        return self._in_payload
+
+    @property
+    def is_supported(self) -> bool:
+        return self.sample_width == 2 and self.channels == 1
+
+    def feed(self, data: bytes) -> bytes:
+        if not self._in_payload:
+            self._header.extend(data)
+            data = self._parse_header()
+            if not self._in_payload:
+                return b""
+        if self._remaining is not None:
+            data = data[: self._remaining]
+            self._remaining -= len(data)
+        if self._carry:
+            data = self._carry + data
+            self._carry = b""
+        if len(data) % 2:
+            self._carry = data[-1:]
+            data = data[:-1]
+        return data
+
+    def _parse_header(self) -> bytes:
+        buf = self._header
+        if len(buf) < 12:
+            if not b"RIFF".startswith(bytes(buf[:4])):
+                return self._enter_raw_pcm()
+            return b""
+        if buf[:4] != b"RIFF" or buf[8:12] != b"WAVE":
+            return self._enter_raw_pcm()
+        offset = 12
+        while len(buf) >= offset + 8:
+            chunk_id = bytes(buf[offset : offset + 4])
+            (chunk_size,) = struct.unpack_from("<I", buf, offset + 4)
+            body = offset + 8
+            if chunk_id == b"data":
+                self._in_payload = True
+                if chunk_size not in (0, 0xFFFFFFFF):
+                    self._remaining = chunk_size
+                payload = bytes(buf[body:])
+                self._header = bytearray()
+                return payload
+            if len(buf) < body + chunk_size:
+                return b""
+            if chunk_id == b"fmt " and chunk_size >= 16:
+                _, channels, sample_rate, _, _, bits = struct.unpack_from("<HHIIHH", buf, body)
+                self.channels = channels
+                self.sample_rate = sample_rate
+                self.sample_width = bits // 8
+            offset = body + chunk_size + (chunk_size & 1)
+        return b""
+
+    def _enter_raw_pcm(self) -> bytes:
+        self._in_payload = True
+        payload = bytes(self._header)
+        self._header = bytearray()
+        return payload
+
+
+async def stream_tts_pcm16(
+    provider: TTSProvider,
+    text: str,
+    *,
+    default_sample_rate: int = DEFAULT_SAMPLE_RATE,
+) -> AsyncIterator[tuple[bytes, int]]:
+    parser = WavStreamParser(default_sample_rate)
+    async for chunk in provider.stream(text):
+        pcm = parser.feed(chunk)
+        if not parser.header_done:
+            continue
+        if not parser.is_supported:
+            return
+        if pcm:
+            yield pcm, parser.sample_rate
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Underruns with fixed 24 kHz vs adaptive downstream audio on a link that degrades.
+
+The client link is a fixed-bandwidth pipe (each send takes len(message) /
+bandwidth) whose bandwidth follows `--schedule` (kbps per equal time slice;
+default good -> congested -> good). AI audio is produced in real time as
+`--chunk-ms` deltas and goes through ClientOutboundQueue and the JSON wire,
+as in the bridge. The client starts playback `--jitter-ms` after the first
+delta; an underrun is any moment the playout buffer runs dry, and dropped
+frames are counted separately. Pings ride the control lane and wait for the
+frame currently on the wire, plus `--base-rtt-ms`.
+"""
+import argparse
+import asyncio
+import base64
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+import numpy as np
+
+from scenario.adaptive_audio import AdaptiveAudioConfig, AdaptiveDownstream, AppPingProbe, run_link_monitor
+from scenario.audio_frames import ClientAudioWire
+from scenario.client_outbound import ClientOutboundQueue
+
+SAMPLE_RATE = 24000
+
+
+class SimulatedClient:
+    def __init__(self, schedule_kbps: list[float], seconds: float, jitter_ms: float, base_rtt_ms: float) -> None:
+        self.schedule = schedule_kbps
+        self.slice_sec = seconds / len(schedule_kbps)
+        self.jitter_sec = jitter_ms / 1000.0
+        self.base_rtt_sec = base_rtt_ms / 1000.0
+        self.wire = ClientAudioWire("json")
+        self.started = time.perf_counter()
+        self.probe: AppPingProbe | None = None
+        self.playout_end: float | None = None
+        self.underruns = 0
+        self.stall_sec = 0.0
+        self.audio_sec = 0.0
+        self.rates: dict[int, float] = {}
+
+    def bandwidth(self) -> float:
+        index = min(int((time.perf_counter() - self.started) / self.slice_sec), len(self.schedule) - 1)
+        return self.schedule[index] * 1000 / 8
+
+    async def send(self, payload: dict) -> None:
+        await asyncio.sleep(len(self.wire.encode(payload)) / self.bandwidth())
+        if payload.get("type") == "ping" and self.probe is not None:
+            asyncio.get_running_loop().call_later(self.base_rtt_sec, self.probe.pong, payload["id"])
+        if payload.get("type") != "response.audio.delta":
+            return
+        rate = payload.get("sample_rate", SAMPLE_RATE)
+        delta = payload["delta"]
+        size = len(base64.b64decode(delta)) if isinstance(delta, str) else len(delta)
+        duration = size / 2 / rate
+        now = time.perf_counter()
+        if self.playout_end is None:
+            self.playout_end = now + self.jitter_sec
+        elif now > self.playout_end:
+            self.underruns += 1
+            self.stall_sec += now - self.playout_end
+            self.playout_end = now
+        self.playout_end += duration
+        self.audio_sec += duration
+        self.rates[rate] = self.rates.get(rate, 0.0) + duration
+
+
+async def run(mode: str, args) -> dict:
+    client = SimulatedClient(args.schedule, args.seconds, args.jitter_ms, args.base_rtt_ms)
+    outbound = ClientOutboundQueue(client.send, max_depth=args.max_depth)
+    outbound.start()
+    downstream = None
+    monitor = None
+    if mode == "adaptive":
+        downstream = AdaptiveDownstream(AdaptiveAudioConfig(ping_interval_sec=1.0))
+        client.probe = AppPingProbe(outbound.put)
+        monitor = asyncio.create_task(
+            run_link_monitor(
+                downstream,
+                client.probe.ping,
+                lambda: (outbound.depth, outbound.stats.dropped_audio),
+                lambda level: None,
+            )
+        )
+
+    rng = np.random.default_rng(3)
+    chunk_samples = SAMPLE_RATE * args.chunk_ms // 1000
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    produced = 0
+    while produced * args.chunk_ms / 1000 < args.seconds:
+        pcm = (rng.normal(0, 3000, chunk_samples)).astype("<i2").tobytes()
+        delta = base64.b64encode(pcm).decode("ascii")
+        if downstream is None:
+            outbound.put({"type": "response.audio.delta", "delta": delta})
+        else:
+            downstream.observe_queue(outbound.depth, outbound.stats.dropped_audio)
+            audio, rate = downstream.convert(base64.b64decode(delta))
+            outbound.put({"type": "response.audio.delta", "delta": audio, "sample_rate": rate})
+        produced += 1
+        await asyncio.sleep(max(0.0, started + produced * args.chunk_ms / 1000 - loop.time()))
+
+    await asyncio.sleep(1.0)
+    if monitor is not None:
+        monitor.cancel()
+    await outbound.close(drain_timeout=0.1)
+    return {
+        "underruns": client.underruns,
+        "stall_sec": client.stall_sec,
+        "dropped": outbound.stats.dropped_audio,
+        "delivered_sec": client.audio_sec,
+        "rates": {rate: round(sec, 1) for rate, sec in sorted(client.rates.items(), reverse=True)},
+        "transitions": downstream.transitions if downstream else 0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Adaptive downstream audio benchmark.")
+    parser.add_argument("--seconds", type=float, default=15.0)
+    parser.add_argument("--schedule", type=float, nargs="+", default=[2000.0, 300.0, 300.0, 2000.0, 2000.0])
+    parser.add_argument("--chunk-ms", type=int, default=100)
+    parser.add_argument("--jitter-ms", type=float, default=300.0)
+    parser.add_argument("--base-rtt-ms", type=float, default=60.0)
+    parser.add_argument("--max-depth", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"link schedule (kbps per {args.seconds / len(args.schedule):.1f} s slice): {args.schedule}")
+    for mode in ("fixed", "adaptive"):
+        result = asyncio.run(run(mode, args))
+        print(
+            f"{mode:>9}: underruns {result['underruns']}, stalled {result['stall_sec']:.2f} s, "
+            f"dropped {result['dropped']}, audio delivered {result['delivered_sec']:.1f} s "
+            f"by rate {result['rates']}, level changes {result['transitions']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Client-link audio codec throughput and bytes on the wire per minute.
+
+Throughput: encode/decode of `--chunk-ms` chunks of 24 kHz speech-like PCM16
+(a few harmonics plus noise), reported as CPU ms per second of audio and as
+x realtime on one core.
+
+Wire size: one minute of audio in each direction (client mic up, AI voice
+down) through `ClientAudioWire` for every transport/codec pair, so base64
+and frame headers are included.
+"""
+import argparse
+import base64
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from scenario.audio_codecs import AUDIO_CODECS, ImaAdpcmCodec, build_audio_codec
+from scenario.audio_frames import AUDIO_TRANSPORTS, FRAME_INPUT_AUDIO, ClientAudioWire, encode_audio_frame
+
+SAMPLE_RATE = 24000
+
+
+def speech_like(seconds: float, seed: int = 7) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(SAMPLE_RATE * seconds)) / SAMPLE_RATE
+    pitch = 140 + 30 * np.sin(2 * np.pi * 0.7 * t)
+    phase = 2 * np.pi * np.cumsum(pitch) / SAMPLE_RATE
+    voice = sum(np.sin(k * phase) / k for k in range(1, 8))
+    envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 2.5 * t)
+    signal = 6000 * voice * envelope + rng.normal(0, 300, t.size)
+    return np.clip(signal, -32768, 32767).astype("<i2")
+
+
+def snr_db(reference: np.ndarray, decoded: bytes) -> float:
+    out = np.frombuffer(decoded, dtype="<i2").astype(np.float64)
+    ref = reference.astype(np.float64)[: out.size]
+    return 10 * np.log10(np.mean(ref**2) / max(np.mean((out - ref) ** 2), 1e-9))
+
+
+def throughput(codec, chunks: list[bytes], seconds: float) -> tuple[float, float, float]:
+    encoded = [codec.encode(chunk) for chunk in chunks]
+    t0 = time.process_time()
+    for chunk in chunks:
+        codec.encode(chunk)
+    t1 = time.process_time()
+    decoded = [codec.decode(data) for data in encoded]
+    t2 = time.process_time()
+    ratio = sum(map(len, chunks)) / max(1, sum(map(len, encoded)))
+    return (t1 - t0) / seconds * 1000, (t2 - t1) / seconds * 1000, ratio
+
+
+def wire_bytes_per_minute(transport: str, codec: str, chunks: list[bytes]) -> int:
+    wire = ClientAudioWire(transport, codec)
+    client_codec = build_audio_codec(codec)
+    total = 0
+    for seq, chunk in enumerate(chunks):
+        # Downstream: the OpenAI delta arrives as base64 text.
+        total += len(wire.encode({"type": "response.audio.delta", "delta": base64.b64encode(chunk).decode("ascii")}))
+        # Upstream: the client sends its mic chunk in the negotiated codec.
+        data = client_codec.encode(chunk)
+        if transport == "binary":
+            total += len(encode_audio_frame(FRAME_INPUT_AUDIO, seq, SAMPLE_RATE, data))
+        else:
+            total += len('{"type":"input_audio_buffer.append","audio":""}') + len(base64.b64encode(data))
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Client audio codec benchmark.")
+    parser.add_argument("--seconds", type=float, default=60.0)
+    parser.add_argument("--chunk-ms", type=int, default=100)
+    args = parser.parse_args()
+
+    audio = speech_like(args.seconds)
+    step = SAMPLE_RATE * args.chunk_ms // 1000
+    chunks = [audio[i : i + step].tobytes() for i in range(0, audio.size, step)]
+
+    print(f"throughput ({args.chunk_ms} ms chunks, {args.seconds:.0f} s of audio)")
+    codecs = [build_audio_codec(name) for name in AUDIO_CODECS] + [ImaAdpcmCodec(block_samples=128)]
+    for codec in codecs:
+        label = codec.name if not isinstance(codec, ImaAdpcmCodec) else f"adpcm/{codec.block_samples}"
+        enc_ms, dec_ms, ratio = throughput(codec, chunks, args.seconds)
+        quality = snr_db(audio, b"".join(codec.decode(codec.encode(c)) for c in chunks))
+        realtime = 1000 / max(enc_ms + dec_ms, 1e-6)
+        print(
+            f"  {label:>10}: encode {enc_ms:6.2f} ms/s, decode {dec_ms:6.2f} ms/s "
+            f"({realtime:,.0f}x realtime), ratio {ratio:.2f}x, snr {quality:.1f} dB"
+        )
+
+    minute = chunks[: int(60_000 / args.chunk_ms)]
+    print("wire bytes per minute (both directions)")
+    baseline = wire_bytes_per_minute("json", "pcm16", minute)
+    for transport in AUDIO_TRANSPORTS:
+        for codec in AUDIO_CODECS:
+            total = wire_bytes_per_minute(transport, codec, minute)
+            print(f"  {transport:>6}/{codec:<5}: {total / 1024 / 1024:6.2f} MiB ({total / baseline:5.1%} of json/pcm16)")
+
+
+if __name__ == "__main__":
+    main()
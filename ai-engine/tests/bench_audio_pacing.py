@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Cumulative drift of audio pacing with many sessions on one event loop.
+
+Each session streams an utterance of `--seconds` audio in `--chunk-ms` chunks
+(base64 + JSON encode per chunk, like the bridge). `sleep` is the legacy
+send-then-sleep(chunk) loop; `pacer` uses AudioPacer's monotonic deadlines.
+Drift = how much later than real time the last chunk went out.
+"""
+import argparse
+import asyncio
+import base64
+import json
+import statistics
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from scenario.audio_pacing import AudioPacer, AudioPacingConfig
+
+SAMPLE_RATE = 24000
+
+
+def _encode(chunk: bytes) -> str:
+    return json.dumps({"type": "response.audio.delta", "delta": base64.b64encode(chunk).decode("ascii")})
+
+
+async def session_sleep(seconds: float, config: AudioPacingConfig) -> float:
+    loop = asyncio.get_running_loop()
+    chunk = b"\x00" * config.chunk_bytes(SAMPLE_RATE)
+    chunk_sec = config.chunk_ms / 1000.0
+    count = int(seconds / chunk_sec)
+    started = loop.time()
+    for _ in range(count):
+        _encode(chunk)
+        await asyncio.sleep(chunk_sec)
+    ideal = count * chunk_sec
+    return loop.time() - started - ideal
+
+
+async def session_pacer(seconds: float, config: AudioPacingConfig) -> float:
+    chunk = b"\x00" * config.chunk_bytes(SAMPLE_RATE)
+    chunk_sec = config.chunk_ms / 1000.0
+    count = int(seconds / chunk_sec)
+    pacer = AudioPacer(config.initial_burst_ms)
+    pacer.start()
+    for _ in range(count):
+        await pacer.wait_turn()
+        _encode(chunk)
+        pacer.advance(chunk_sec)
+    await pacer.wait_turn()
+    return pacer.lag()
+
+
+async def main_async(args) -> None:
+    config = AudioPacingConfig(chunk_ms=args.chunk_ms, initial_burst_ms=args.burst_ms)
+    runner = session_pacer if args.mode == "pacer" else session_sleep
+    drifts = await asyncio.gather(*(runner(args.seconds, config) for _ in range(args.sessions)))
+    drifts_ms = sorted(drift * 1000.0 for drift in drifts)
+    print(
+        f"mode={args.mode} sessions={args.sessions} utterance={args.seconds:.0f}s "
+        f"chunk={args.chunk_ms}ms burst={args.burst_ms if args.mode == 'pacer' else 0}ms"
+    )
+    print(
+        f"cumulative drift ms: mean={statistics.mean(drifts_ms):.1f} "
+        f"p95={drifts_ms[int(len(drifts_ms) * 0.95) - 1]:.1f} max={drifts_ms[-1]:.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Audio pacing drift benchmark.")
+    parser.add_argument("--mode", choices=["pacer", "sleep"], default="pacer")
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--seconds", type=float, default=60.0)
+    parser.add_argument("--chunk-ms", type=int, default=100)
+    parser.add_argument("--burst-ms", type=int, default=0)
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
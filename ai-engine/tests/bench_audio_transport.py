@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""CPU and bytes per session for JSON/base64 vs binary client audio frames.
+
+One session exchanges `--seconds` of 24 kHz PCM16 in each direction in
+`--chunk-ms` frames. Per frame the work covers both ends of the client link:
+
+- downstream: server serializes the OpenAI delta (base64 text) for the client,
+  client turns it back into PCM.
+- upstream: client serializes mic PCM, server turns it into the
+  `input_audio_buffer.append` event it forwards to OpenAI.
+
+The OpenAI leg is base64 JSON in both modes, so it is included on the server.
+"""
+import argparse
+import base64
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from scenario.audio_frames import FRAME_INPUT_AUDIO, ClientAudioWire, decode_audio_frame, encode_audio_frame
+
+SAMPLE_RATE = 24000
+
+
+def run_session(transport: str, frames: int, pcm: bytes) -> tuple[float, float, int]:
+    wire = ClientAudioWire(transport)
+    openai_delta = base64.b64encode(pcm).decode("ascii")
+    server_cpu = client_cpu = 0.0
+    wire_bytes = 0
+    for seq in range(frames):
+        # Downstream.
+        t0 = time.process_time()
+        data = wire.encode({"type": "audio.delta", "delta": openai_delta})
+        t1 = time.process_time()
+        if isinstance(data, bytes):
+            decode_audio_frame(data).payload.tobytes()
+        else:
+            base64.b64decode(json.loads(data)["delta"])
+        t2 = time.process_time()
+        wire_bytes += len(data)
+
+        # Upstream.
+        if transport == "binary":
+            message = encode_audio_frame(FRAME_INPUT_AUDIO, seq, SAMPLE_RATE, pcm)
+        else:
+            message = json.dumps({"type": "input_audio_buffer.append", "audio": base64.b64encode(pcm).decode("ascii")})
+        t3 = time.process_time()
+        if isinstance(message, bytes):
+            audio = base64.b64encode(decode_audio_frame(message).payload).decode("ascii")
+        else:
+            audio = json.loads(message)["audio"]
+        json.dumps({"type": "input_audio_buffer.append", "audio": audio})
+        t4 = time.process_time()
+        wire_bytes += len(message)
+
+        server_cpu += (t1 - t0) + (t4 - t3)
+        client_cpu += (t2 - t1) + (t3 - t2)
+    return server_cpu, client_cpu, wire_bytes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Client audio transport benchmark.")
+    parser.add_argument("--seconds", type=float, default=60.0)
+    parser.add_argument("--chunk-ms", type=int, default=100)
+    parser.add_argument("--sessions", type=int, default=20)
+    args = parser.parse_args()
+
+    pcm = bytes(range(256)) * (int(SAMPLE_RATE * args.chunk_ms / 1000) * 2 // 256 + 1)
+    pcm = pcm[: int(SAMPLE_RATE * args.chunk_ms / 1000) * 2]
+    frames = int(args.seconds * 1000 / args.chunk_ms)
+    for transport in ("json", "binary"):
+        totals = [run_session(transport, frames, pcm) for _ in range(args.sessions)]
+        server = sum(t[0] for t in totals) / args.sessions
+        client = sum(t[1] for t in totals) / args.sessions
+        wire_bytes = totals[0][2]
+        print(
+            f"{transport:>6}: server cpu {server / args.seconds * 1000:.2f} ms/s, "
+            f"client cpu {client / args.seconds * 1000:.2f} ms/s, "
+            f"wire {wire_bytes / args.seconds / 1024:.1f} KiB/s per session"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Control-event latency while audio saturates the client link.
+
+The client link is simulated as a fixed-bandwidth pipe: each send takes
+len(json) / bandwidth seconds. Audio deltas are produced faster than the link
+drains them and a control event (`speech.started`) is emitted every
+`--control-every-ms`. `fifo` is a single serial stream (one queue, one writer);
+`lanes` is ClientOutboundQueue with its control lane. Latency = time from
+enqueue until the control frame is fully written.
+"""
+import argparse
+import asyncio
+import base64
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from scenario.client_outbound import ClientOutboundQueue
+
+SAMPLE_RATE = 24000
+
+
+class SimulatedLink:
+    def __init__(self, bytes_per_sec: float) -> None:
+        self.bytes_per_sec = bytes_per_sec
+        self.latencies_ms: list[float] = []
+
+    async def send(self, payload: dict) -> None:
+        await asyncio.sleep(len(json.dumps(payload)) / self.bytes_per_sec)
+        if payload.get("type") == "speech.started":
+            self.latencies_ms.append((time.perf_counter() - payload["queued_at"]) * 1000.0)
+
+
+class FifoWriter:
+    """Single serial stream: every event waits behind everything queued before it."""
+
+    def __init__(self, send) -> None:
+        self._send = send
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    def put(self, payload: dict) -> bool:
+        self._queue.put_nowait(payload)
+        return True
+
+    async def close(self) -> None:
+        self._task.cancel()
+
+    async def _run(self) -> None:
+        while True:
+            await self._send(await self._queue.get())
+
+
+async def run(args) -> list[float]:
+    link = SimulatedLink(args.link_kbps * 1000 / 8)
+    if args.mode == "lanes":
+        writer = ClientOutboundQueue(link.send, max_depth=args.max_depth)
+    else:
+        writer = FifoWriter(link.send)
+    writer.start()
+
+    chunk = base64.b64encode(b"\x00" * int(SAMPLE_RATE * args.chunk_ms / 1000) * 2).decode("ascii")
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    next_control = started
+    sent_audio_sec = 0.0
+    while loop.time() - started < args.seconds:
+        now = loop.time()
+        if now >= next_control:
+            writer.put({"type": "speech.started", "queued_at": time.perf_counter()})
+            next_control += args.control_every_ms / 1000.0
+        # Upstream produces audio `--burst` times faster than real time.
+        while sent_audio_sec < (now - started) * args.burst:
+            writer.put({"type": "audio.delta", "delta": chunk})
+            sent_audio_sec += args.chunk_ms / 1000.0
+        await asyncio.sleep(0.005)
+    await writer.close()
+    return link.latencies_ms
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Control-event latency under audio saturation.")
+    parser.add_argument("--mode", choices=["lanes", "fifo"], default="lanes")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--link-kbps", type=float, default=512.0)
+    parser.add_argument("--chunk-ms", type=int, default=100)
+    parser.add_argument("--burst", type=float, default=2.0)
+    parser.add_argument("--control-every-ms", type=float, default=500.0)
+    parser.add_argument("--max-depth", type=int, default=200)
+    args = parser.parse_args()
+
+    latencies = sorted(asyncio.run(run(args)))
+    if not latencies:
+        print(f"mode={args.mode}: no control events delivered")
+        return
+    print(
+        f"mode={args.mode} link={args.link_kbps:.0f}kbps audio={args.burst:.1f}x realtime "
+        f"control events={len(latencies)}"
+    )
+    print(
+        f"control latency ms: p50={statistics.median(latencies):.1f} "
+        f"p95={latencies[int(len(latencies) * 0.95) - 1]:.1f} max={latencies[-1]:.1f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Per-event CPU of routing Realtime messages: full json.loads + sequential fanout vs EventRouter.
+
+Builds a synthetic upstream stream shaped like a Realtime response: lifecycle
+events (response.created, output_item.added, content_part.added, ...), audio
+deltas of `--delta-ms` of 24 kHz PCM16 as base64, transcript deltas, done
+events and rate_limits.updated. Both paths feed the same handlers as
+realtime_bridge (ready-state logger, RealtimeAudioRelay, user transcript
+forwarder, a pipeline-shaped filter). The baseline parses every message and
+calls every handler; the router peeks the type, slices audio deltas and skips
+unsubscribed events. Reports CPU per event overall and per event class.
+"""
+import argparse
+import asyncio
+import base64
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from scenario.audio_relay import RELAY_EVENT_TYPES, RealtimeAudioRelay
+from scenario.event_router import EventRouter
+from scenario.realtime_pipeline import USER_TEXT_EVENT_TYPES
+
+TRANSCRIPTION_TYPES = ("conversation.item.input_audio_transcription.completed",)
+
+
+def _event(event_type: str, index: int, **fields) -> str:
+    return json.dumps({"type": event_type, "event_id": f"event_{index}", **fields}, separators=(",", ":"))
+
+
+def build_stream(args) -> list[str]:
+    rng = np.random.default_rng(3)
+    delta_bytes = 24000 * args.delta_ms // 1000 * 2
+    messages: list[str] = []
+    index = 0
+    for response in range(args.responses):
+        ids = {"response_id": f"resp_{response}", "item_id": f"item_{response}"}
+        for event_type in ("input_audio_buffer.speech_started", "input_audio_buffer.speech_stopped"):
+            messages.append(_event(event_type, index, audio_start_ms=1000, item_id=ids["item_id"]))
+            index += 1
+        messages.append(
+            _event(
+                "conversation.item.input_audio_transcription.completed",
+                index,
+                item_id=ids["item_id"],
+                content_index=0,
+                transcript="I would like a large iced latte, please.",
+            )
+        )
+        item = {"id": ids["item_id"], "type": "message"}
+        messages.append(_event("response.created", index + 1, response={"id": ids["response_id"]}))
+        messages.append(_event("response.output_item.added", index + 2, output_index=0, item=item))
+        messages.append(_event("response.content_part.added", index + 3, **ids, part={"type": "audio"}))
+        index += 4
+        for _ in range(args.deltas):
+            pcm = rng.integers(-2000, 2000, delta_bytes // 2, dtype=np.int16).tobytes()
+            messages.append(
+                _event(
+                    "response.audio.delta",
+                    index,
+                    **ids,
+                    output_index=0,
+                    content_index=0,
+                    delta=base64.b64encode(pcm).decode("ascii"),
+                )
+            )
+            messages.append(_event("response.audio_transcript.delta", index + 1, **ids, delta="word "))
+            index += 2
+        for event_type in ("response.audio.done", "response.audio_transcript.done", "response.content_part.done"):
+            messages.append(_event(event_type, index, **ids, transcript="Sure, a large iced latte."))
+            index += 1
+        messages.append(_event("response.output_item.done", index, item=item))
+        messages.append(_event("response.done", index + 1, response={"id": ids["response_id"], "status": "completed"}))
+        messages.append(_event("rate_limits.updated", index + 2, rate_limits=[{"name": "tokens", "remaining": 1000}]))
+        index += 3
+    return messages
+
+
+def build_handlers() -> tuple:
+    state = {"speaking": False, "chunks": 0}
+    relay = RealtimeAudioRelay(on_audio_chunk_base64=lambda chunk: state.__setitem__("chunks", state["chunks"] + 1))
+
+    def log_event_type(event: dict) -> None:
+        event_type = event.get("type", "unknown")
+        if event_type == "response.audio.delta":
+            state["speaking"] = True
+        if event_type == "response.audio.done":
+            state["speaking"] = False
+
+    def forward_user_transcript(event: dict) -> None:
+        if event.get("type", "") in TRANSCRIPTION_TYPES:
+            state["transcript"] = event.get("transcript")
+
+    def pipeline(event: dict) -> None:
+        event_type = event.get("type", "")
+        if "conversation.item" in event_type and event.get("transcript"):
+            state["user_text"] = event["transcript"]
+
+    return state, relay, log_event_type, forward_user_transcript, pipeline
+
+
+def baseline_dispatch():
+    _, relay, log_event_type, forward, pipeline = build_handlers()
+    handlers = [log_event_type, relay.handle_event, forward, pipeline]
+
+    async def dispatch(message: str) -> None:
+        event = json.loads(message)
+        for handler in handlers:
+            result = handler(event)
+            if asyncio.iscoroutine(result):
+                await result
+
+    return dispatch
+
+
+def router_dispatch():
+    _, relay, log_event_type, forward, pipeline = build_handlers()
+    router = EventRouter()
+    router.subscribe(log_event_type, "response.audio.delta", fields=())
+    router.subscribe(log_event_type, "response.audio.done")
+    router.subscribe(relay.handle_event, "response.audio.delta", fields=("delta",))
+    router.subscribe(relay.handle_event, *RELAY_EVENT_TYPES)
+    router.subscribe(forward, *TRANSCRIPTION_TYPES)
+    router.subscribe(pipeline, *USER_TEXT_EVENT_TYPES)
+    return router.dispatch
+
+
+async def measure(dispatch, messages: list[str], repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.process_time()
+        for message in messages:
+            await dispatch(message)
+        best = min(best, time.process_time() - started)
+    return best
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--responses", type=int, default=20)
+    parser.add_argument("--deltas", type=int, default=40, help="audio deltas per response")
+    parser.add_argument("--delta-ms", type=int, default=100)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    messages = build_stream(args)
+    classes = {
+        "audio delta": [m for m in messages if '"type":"response.audio.delta"' in m],
+        "other": [m for m in messages if '"type":"response.audio.delta"' not in m],
+        "all": messages,
+    }
+    print(f"{len(messages)} events, {sum(map(len, messages)) / 2**20:.1f} MiB")
+    print(f"{'events':<12} {'count':>6} {'json+fanout us':>15} {'router us':>10} {'saved us':>9}")
+    for name, subset in classes.items():
+        base = await measure(baseline_dispatch(), subset, args.repeats)
+        routed = await measure(router_dispatch(), subset, args.repeats)
+        count = len(subset)
+        base_us = base / count * 1e6
+        routed_us = routed / count * 1e6
+        print(f"{name:<12} {count:>6} {base_us:>15.2f} {routed_us:>10.2f} {base_us - routed_us:>9.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Audio relay delay behind a slow pipeline handler: sequential fanout vs ConcurrentFanout.
+
+Replays `--turns` turns in real time. Each turn starts with a user
+transcription event, which the pipeline-shaped handler answers after
+`--llm-ms` (a stand-in for LLM extraction), followed by `--deltas` audio
+deltas every `--interval-ms`. Delay is measured from a delta's arrival to
+the moment RealtimeAudioRelay hands it on. The sequential path awaits every
+handler in turn, like the old fanout; the concurrent one gives each handler
+its own ordered queue with the ready-state handler inline.
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from scenario.audio_relay import RealtimeAudioRelay
+from scenario.realtime_handlers import ConcurrentFanout
+
+DELTA = "AAAA" * 800
+
+
+def sequential(handlers):
+    async def dispatch(event: dict) -> None:
+        for handler in handlers:
+            result = handler(event)
+            if asyncio.iscoroutine(result):
+                await result
+
+    return dispatch
+
+
+def concurrent(handlers):
+    fanout = ConcurrentFanout()
+    ready, *queued = handlers
+    lanes = [fanout.add(ready, name="ready_state", synchronous=True)]
+    lanes += [fanout.add(handler) for handler in queued]
+
+    async def dispatch(event: dict) -> None:
+        for lane in lanes:
+            await lane(event)
+
+    return dispatch, fanout
+
+
+async def run(mode: str, args) -> list[float]:
+    delays: list[float] = []
+    arrivals: list[float] = []
+    state = {"speaking": False}
+
+    def on_chunk(_chunk: str) -> None:
+        delays.append((time.perf_counter() - arrivals.pop(0)) * 1000.0)
+
+    relay = RealtimeAudioRelay(on_audio_chunk_base64=on_chunk)
+
+    def ready_state(event: dict) -> None:
+        state["speaking"] = event["type"] == "response.audio.delta"
+
+    async def pipeline(event: dict) -> None:
+        if event["type"] == "conversation.item.input_audio_transcription.completed":
+            await asyncio.sleep(args.llm_ms / 1000.0)
+
+    handlers = [ready_state, relay.handle_event, pipeline]
+    fanout = None
+    if mode == "sequential":
+        dispatch = sequential(handlers)
+    else:
+        dispatch, fanout = concurrent(handlers)
+
+    started = time.perf_counter()
+    due = 0.0
+    for _ in range(args.turns):
+        events = [{"type": "conversation.item.input_audio_transcription.completed", "transcript": "hi"}]
+        events += [{"type": "response.audio.delta", "delta": DELTA} for _ in range(args.deltas)]
+        for event in events:
+            # The socket buffers upstream events; a busy reader picks them up late.
+            await asyncio.sleep(max(0.0, started + due - time.perf_counter()))
+            if event["type"] == "response.audio.delta":
+                arrivals.append(started + due)
+            await dispatch(event)
+            due += args.interval_ms / 1000.0
+    if fanout is not None:
+        await fanout.join()
+        for name, lane in fanout.snapshot().items():
+            print(f"  {name}: lag mean {lane['lag_ms_mean']} ms, max {lane['lag_ms_max']} ms, depth {lane['max_depth']}")
+        await fanout.close()
+    return delays
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--turns", type=int, default=4)
+    parser.add_argument("--deltas", type=int, default=25)
+    parser.add_argument("--interval-ms", type=float, default=20.0)
+    parser.add_argument("--llm-ms", type=float, default=600.0)
+    args = parser.parse_args()
+
+    print(f"{'mode':<11} {'mean ms':>8} {'p95 ms':>8} {'max ms':>8}")
+    for mode in ("sequential", "concurrent"):
+        delays = sorted(await run(mode, args))
+        p95 = delays[int(len(delays) * 0.95) - 1]
+        print(f"{mode:<11} {statistics.fmean(delays):>8.1f} {p95:>8.1f} {delays[-1]:>8.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
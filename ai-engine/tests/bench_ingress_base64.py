@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Per-frame cost of validating inbound base64 audio in handle_client_message.
+
+`decode` is the old path (full b64decode to learn the byte count); `length`
+derives the size from the base64 length and padding with a sampled alphabet
+check. Reported as cost per frame and the CPU share of one core at
+`--frames-per-sec` x `--sessions` (default 50 x 500 = 25k frames/s).
+"""
+import argparse
+import base64
+import binascii
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from scenario.audio_ingress import base64_decoded_length
+
+
+def decode_length(audio: str) -> int:
+    try:
+        return len(base64.b64decode(audio))
+    except (ValueError, binascii.Error):
+        return -1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Inbound base64 validation micro-benchmark.")
+    parser.add_argument("--frame-ms", type=int, default=20)
+    parser.add_argument("--sample-rate", type=int, default=24000)
+    parser.add_argument("--frames-per-sec", type=int, default=50)
+    parser.add_argument("--sessions", type=int, default=500)
+    parser.add_argument("--iterations", type=int, default=200000)
+    args = parser.parse_args()
+
+    pcm = bytes(index % 256 for index in range(args.sample_rate * args.frame_ms // 1000 * 2))
+    frame = base64.b64encode(pcm).decode("ascii")
+    rate = args.frames_per_sec * args.sessions
+    print(f"frame={len(pcm)} B pcm / {len(frame)} chars base64, load={rate} frames/s")
+    for name, check in (("decode", decode_length), ("length", base64_decoded_length)):
+        assert check(frame) == len(pcm)
+        started = time.perf_counter()
+        for _ in range(args.iterations):
+            check(frame)
+        per_frame = (time.perf_counter() - started) / args.iterations
+        print(f"{name:>6}: {per_frame * 1e6:.2f} us/frame, {per_frame * rate * 100:.1f}% of a core")
+
+
+if __name__ == "__main__":
+    main()
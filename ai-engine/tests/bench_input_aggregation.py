@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Upstream append count and added latency with input audio aggregation.
+
+Each session sends `--seconds` of 24 kHz audio in `--chunk-ms` chunks at real
+time (as a browser AudioWorklet would), with a commit every `--utterance-sec`.
+Every upstream append is one JSON encode + one websocket send, so the message
+count is also the syscall count on the OpenAI socket.
+"""
+import argparse
+import asyncio
+import base64
+import json
+import statistics
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from scenario.audio_ingress import InputAudioAggregator
+
+SAMPLE_RATE = 24000
+
+
+async def run_session(args) -> dict:
+    sent = 0
+
+    async def send(audio: str) -> None:
+        nonlocal sent
+        json.dumps({"type": "input_audio_buffer.append", "audio": audio})
+        sent += 1
+
+    aggregator = InputAudioAggregator(send, frame_ms=args.frame_ms, sample_rate=SAMPLE_RATE)
+    chunk = base64.b64encode(b"\x00" * (SAMPLE_RATE * args.chunk_ms // 1000 * 2)).decode("ascii")
+    chunks = int(args.seconds * 1000 / args.chunk_ms)
+    per_utterance = int(args.utterance_sec * 1000 / args.chunk_ms)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    for index in range(chunks):
+        await aggregator.add_base64(chunk)
+        if (index + 1) % per_utterance == 0:
+            await aggregator.flush()  # commit boundary
+        delay = started + (index + 1) * args.chunk_ms / 1000 - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+    await aggregator.flush()
+    stats = aggregator.snapshot()
+    stats["sent"] = sent
+    stats["chunks"] = chunks
+    return stats
+
+
+async def main_async(args) -> None:
+    results = await asyncio.gather(*(run_session(args) for _ in range(args.sessions)))
+    chunks = sum(r["chunks"] for r in results)
+    sent = sum(r["sent"] for r in results)
+    print(
+        f"chunk={args.chunk_ms}ms frame={args.frame_ms}ms sessions={args.sessions}: "
+        f"{chunks} client chunks -> {sent} upstream appends ({chunks / sent:.1f}x fewer)"
+    )
+    print(
+        "added latency ms: "
+        f"mean={statistics.mean(r['added_latency_mean_ms'] for r in results):.1f} "
+        f"max={max(r['added_latency_max_ms'] for r in results):.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Input audio aggregation benchmark.")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--chunk-ms", type=int, default=20)
+    parser.add_argument("--frame-ms", type=int, default=100)
+    parser.add_argument("--utterance-sec", type=float, default=3.0)
+    parser.add_argument("--sessions", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Relay events/s per core for each JSON codec over a session replay.
+
+Replays a recorded session (`--replay`, JSON lines of
+`{"direction": "client"|"upstream", "message": "<raw text frame>"}`) or, by
+default, a synthetic one: per turn, `--appends` client input appends of 20 ms
+followed by an upstream response (lifecycle events, `--deltas` audio deltas
+of 100 ms with transcript deltas, done events). Client frames are parsed and
+re-sent as `input_audio_buffer.append`; upstream frames go through
+EventRouter -> RealtimeAudioRelay -> ClientAudioWire, as in the bridge.
+"baseline" is stdlib json.dumps/json.loads with no pre-encoded templates.
+Reports CPU time per pass (best of `--repeats`) as events/s on one core.
+"""
+import argparse
+import asyncio
+import base64
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from scenario.audio_frames import ClientAudioWire
+from scenario.audio_relay import RELAY_EVENT_TYPES, RealtimeAudioRelay
+from scenario.event_router import EventRouter
+from scenario.json_codec import JSON_CODECS, JsonCodec, build_json_codec, msgspec, orjson
+
+
+class BaselineCodec(JsonCodec):
+    name = "baseline"
+
+    def dumps_event(self, payload):
+        return self.dumps(payload)
+
+
+def _frame(payload: dict) -> str:
+    return json.dumps(payload, separators=(",", ":"))
+
+
+def synthetic_session(args) -> list[tuple[str, str]]:
+    rng = np.random.default_rng(11)
+    frames: list[tuple[str, str]] = []
+
+    def audio(ms: int) -> str:
+        return base64.b64encode(rng.integers(-3000, 3000, 24 * ms, dtype=np.int16).tobytes()).decode("ascii")
+
+    for turn in range(args.turns):
+        ids = {"event_id": f"e{turn}", "response_id": f"resp_{turn}", "item_id": f"item_{turn}"}
+
+        def upstream(event_type: str, **fields) -> None:
+            frames.append(("upstream", _frame({"type": event_type, **ids, **fields})))
+
+        for _ in range(args.appends):
+            frames.append(("client", _frame({"type": "input_audio_buffer.append", "audio": audio(20)})))
+        frames.append(("client", _frame({"type": "input_audio_buffer.commit"})))
+        for event_type in ("input_audio_buffer.committed", "response.created", "response.output_item.added"):
+            upstream(event_type)
+        for _ in range(args.deltas):
+            upstream("response.audio.delta", delta=audio(100))
+            upstream("response.audio_transcript.delta", delta="so ")
+        upstream("response.audio.done")
+        upstream("response.audio_transcript.done", transcript="Sure, one latte.")
+        upstream("response.done", response={"id": ids["response_id"]})
+    return frames
+
+
+def load_replay(path: str) -> list[tuple[str, str]]:
+    frames = []
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                record = json.loads(line)
+                frames.append((record["direction"], record["message"]))
+    return frames
+
+
+def build_session(codec: JsonCodec):
+    sent: list = []
+
+    def to_client(payload: dict) -> None:
+        sent.append(wire.encode(payload))
+
+    wire = ClientAudioWire(json_codec=codec)
+    relay = RealtimeAudioRelay(
+        on_audio_chunk_base64=lambda chunk: to_client({"type": "response.audio.delta", "delta": chunk}),
+        on_transcript=lambda text, final: to_client({"type": "response.audio_transcript.delta", "transcript": text}),
+    )
+    router = EventRouter(json_codec=codec)
+    router.subscribe(relay.handle_event, "response.audio.delta", fields=("delta",))
+    router.subscribe(relay.handle_event, *RELAY_EVENT_TYPES)
+    router.subscribe(lambda event: to_client({"type": "response.audio.done"}), "response.audio.done")
+
+    async def handle(direction: str, message: str) -> None:
+        if direction == "upstream":
+            await router.dispatch(message)
+            return
+        payload = codec.loads(message)
+        if payload.get("type") == "input_audio_buffer.append":
+            sent.append(codec.dumps_event({"type": "input_audio_buffer.append", "audio": payload["audio"]}))
+        else:
+            sent.append(codec.dumps_event({"type": payload.get("type")}))
+
+    return handle, sent
+
+
+async def measure(codec: JsonCodec, frames, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        handle, sent = build_session(codec)
+        started = time.process_time()
+        for direction, message in frames:
+            await handle(direction, message)
+        best = min(best, time.process_time() - started)
+    return best
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--replay", help="recorded session (JSON lines)")
+    parser.add_argument("--turns", type=int, default=20)
+    parser.add_argument("--appends", type=int, default=100, help="20 ms client appends per turn")
+    parser.add_argument("--deltas", type=int, default=40, help="100 ms audio deltas per turn")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    frames = load_replay(args.replay) if args.replay else synthetic_session(args)
+    print(f"{len(frames)} frames, {sum(len(m) for _, m in frames) / 2**20:.1f} MiB")
+    installed = {"stdlib": True, "orjson": orjson is not None, "msgspec": msgspec is not None}
+    print(f"{'codec':<10} {'events/s/core':>14} {'us/event':>9}")
+    for name in ("baseline", *JSON_CODECS):
+        if not installed.get(name, True):
+            print(f"{name:<10} {'not installed':>14}")
+            continue
+        codec = BaselineCodec() if name == "baseline" else build_json_codec(name)
+        cpu = await measure(codec, frames, args.repeats)
+        print(f"{codec.name:<10} {len(frames) / cpu:>14,.0f} {cpu / len(frames) * 1e6:>9.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
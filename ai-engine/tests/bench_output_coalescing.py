@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Client messages and server CPU per second of assistant speech, per-delta vs coalesced.
+
+Replays a synthetic Realtime response: `--seconds` of 24 kHz PCM16 split into
+irregular deltas (uniform `--min-ms`..`--max-ms`, OpenAI-like), each arriving
+as a base64 `response.audio.delta`. `passthrough` wraps every delta in a
+client dict and serializes it through ClientAudioWire (today's path);
+`coalesced/N` runs OutputAudioCoalescer with N ms frames first. Every
+message is framed by the `websockets` frame serializer and written to a local
+socketpair (drained by a thread), so the CPU figure includes the per-message
+framing and send syscall a real server pays.
+"""
+import argparse
+import base64
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from websockets.frames import Frame, Opcode
+
+from scenario.audio_egress import OUTPUT_FRAME_MS_CHOICES, OutputAudioCoalescer
+from scenario.audio_frames import ClientAudioWire
+
+SAMPLE_RATE = 24000
+
+
+def make_deltas(seconds: float, min_ms: int, max_ms: int, seed: int = 11) -> list[str]:
+    rng = np.random.default_rng(seed)
+    total = int(SAMPLE_RATE * seconds)
+    pcm = rng.normal(0, 3000, total).astype("<i2").tobytes()
+    deltas = []
+    offset = 0
+    while offset < len(pcm):
+        size = int(rng.integers(min_ms, max_ms + 1)) * SAMPLE_RATE // 1000 * 2
+        deltas.append(base64.b64encode(pcm[offset : offset + size]).decode("ascii"))
+        offset += size
+    return deltas
+
+
+def _drain(sock: socket.socket) -> None:
+    while sock.recv(1 << 16):
+        pass
+
+
+def run(deltas: list[str], frame_ms: int, transport: str) -> tuple[int, float]:
+    wire = ClientAudioWire(transport)
+    server, client = socket.socketpair()
+    reader = threading.Thread(target=_drain, args=(client,), daemon=True)
+    reader.start()
+    messages = 0
+
+    def send(payload: dict) -> None:
+        nonlocal messages
+        data = wire.encode(payload)
+        if isinstance(data, bytes):
+            frame = Frame(Opcode.BINARY, data)
+        else:
+            frame = Frame(Opcode.TEXT, data.encode("utf-8"))
+        server.sendall(frame.serialize(mask=False, extensions=[]))
+        messages += 1
+
+    started = time.thread_time()
+    if frame_ms == 0:
+        for delta in deltas:
+            send({"type": "audio.delta", "delta": delta})
+    else:
+        coalescer = OutputAudioCoalescer(frame_ms)
+        for delta in deltas:
+            for pcm, _ in coalescer.push_base64(delta):
+                send({"type": "audio.delta", "delta": pcm})
+        for pcm, _ in coalescer.flush():
+            send({"type": "audio.delta", "delta": pcm})
+    elapsed = time.thread_time() - started
+    server.close()
+    reader.join()
+    client.close()
+    return messages, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Output audio coalescing benchmark.")
+    parser.add_argument("--seconds", type=float, default=60.0)
+    parser.add_argument("--min-ms", type=int, default=10)
+    parser.add_argument("--max-ms", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    deltas = make_deltas(args.seconds, args.min_ms, args.max_ms)
+    print(f"{len(deltas)} deltas for {args.seconds:.0f} s of speech ({len(deltas) / args.seconds:.1f}/s)")
+    for transport in ("json", "binary"):
+        for frame_ms in (0,) + OUTPUT_FRAME_MS_CHOICES:
+            runs = [run(deltas, frame_ms, transport) for _ in range(args.repeat)]
+            messages = runs[0][0]
+            cpu = min(r[1] for r in runs)
+            label = "passthrough" if frame_ms == 0 else f"coalesced/{frame_ms}"
+            print(
+                f"  {transport:>6} {label:>13}: {messages / args.seconds:6.1f} msgs/s, "
+                f"cpu {cpu / args.seconds * 1000:.3f} ms per s of speech"
+            )
+
+
+if __name__ == "__main__":
+    main()
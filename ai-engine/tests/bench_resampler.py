@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Throughput of the streaming polyphase resampler in frames per core-second.
+
+Feeds `--seconds` of a mono tone per input rate through one StreamingResampler
+in `--frame-ms` chunks (the browser's native capture cadence) and reports how
+many such frames one core resamples per second of CPU time.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from scenario.resampler import StreamingResampler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Streaming resampler throughput benchmark.")
+    parser.add_argument("--rates", type=int, nargs="+", default=[16000, 44100, 48000])
+    parser.add_argument("--frame-ms", type=int, default=20)
+    parser.add_argument("--seconds", type=float, default=60.0)
+    args = parser.parse_args()
+
+    for rate in args.rates:
+        t = np.arange(int(rate * args.seconds)) / rate
+        pcm = (8000 * np.sin(2 * np.pi * 440 * t)).astype("<i2").tobytes()
+        frame_bytes = rate * args.frame_ms // 1000 * 2
+        resampler = StreamingResampler(rate)
+        frames = 0
+        started = time.process_time()
+        for offset in range(0, len(pcm), frame_bytes):
+            resampler.process(pcm[offset : offset + frame_bytes])
+            frames += 1
+        cpu = time.process_time() - started
+        realtime_sessions = frames / cpu / (1000 / args.frame_ms)
+        print(
+            f"{rate:>5} Hz -> 24000 Hz ({resampler.up}/{resampler.down}, {resampler._taps} taps/phase): "
+            f"{frames / cpu:,.0f} frames/core-s, {cpu / frames * 1e6:.0f} us/frame, "
+            f"~{realtime_sessions:.0f} real-time sessions/core"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Event-loop lag under concurrent scenario sessions against a local LLM stub.
+
+Runs N scenario pipelines in one loop, each pushing user transcripts through
+ScenarioBuilder -> LLM, while a probe task measures how late the loop wakes up.
+`--mode sync` reproduces the old blocking client for comparison.
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from openai import OpenAI
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from scenario.llm_client import OpenAIScenarioLLM, _safe_json_loads
+from scenario.prompts import build_extraction_prompt
+from scenario.realtime_pipeline import RealtimeScenarioPipeline
+from scenario.scenario_builder import ScenarioBuilder
+
+TRANSCRIPTS = [
+    "I am at a cafe.",
+    "I'm talking to the barista.",
+    "I want to order a latte.",
+]
+
+
+def _make_stub_handler(delay_sec: float):
+    class StubHandler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:  # noqa: N802 - http.server API
+            length = int(self.headers.get("Content-Length", "0"))
+            self.rfile.read(length)
+            time.sleep(delay_sec)
+            text = json.dumps({"place": "cafe", "partner": None, "goal": None})
+            body = json.dumps(
+                {
+                    "id": "resp_stub",
+                    "object": "response",
+                    "created_at": int(time.time()),
+                    "model": "stub",
+                    "status": "completed",
+                    "output": [
+                        {
+                            "id": "msg_stub",
+                            "type": "message",
+                            "role": "assistant",
+                            "status": "completed",
+                            "content": [{"type": "output_text", "text": text, "annotations": []}],
+                        }
+                    ],
+                }
+            ).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_args) -> None:
+            return
+
+    return StubHandler
+
+
+def start_stub_server(port: int, delay_sec: float) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", port), _make_stub_handler(delay_sec))
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def build_builder(mode: str, base_url: str) -> ScenarioBuilder:
+    if mode == "async":
+        llm = OpenAIScenarioLLM(api_key="stub", model="stub", base_url=base_url)
+        return ScenarioBuilder(extractor=llm.extract_fields)
+
+    client = OpenAI(api_key="stub", base_url=base_url)
+
+    def blocking_extractor(text: str) -> dict:
+        response = client.responses.create(model="stub", input=build_extraction_prompt(text))
+        return _safe_json_loads(response.output_text)
+
+    return ScenarioBuilder(extractor=blocking_extractor)
+
+
+async def probe_loop_lag(stop: asyncio.Event, interval: float, samples: list[float]) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        samples.append(max(0.0, loop.time() - expected))
+
+
+async def run_session(pipeline: RealtimeScenarioPipeline) -> None:
+    for transcript in TRANSCRIPTS:
+        await pipeline.handle_event(
+            {"type": "conversation.item.input_audio_transcription.completed", "transcript": transcript}
+        )
+
+
+async def main_async(args) -> None:
+    base_url = f"http://127.0.0.1:{args.port}/v1"
+    # Client construction is synchronous (TLS context setup), so build every
+    # session before the probe starts and measure only the request path.
+    pipelines = [
+        RealtimeScenarioPipeline(build_builder(args.mode, base_url), lambda _text: None)
+        for _ in range(args.sessions)
+    ]
+    stop = asyncio.Event()
+    samples: list[float] = []
+    probe = asyncio.create_task(probe_loop_lag(stop, args.probe_ms / 1000.0, samples))
+    started = time.perf_counter()
+    await asyncio.gather(*(run_session(pipeline) for pipeline in pipelines))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await probe
+
+    samples_ms = sorted(sample * 1000.0 for sample in samples) or [0.0]
+    p99 = samples_ms[min(len(samples_ms) - 1, int(len(samples_ms) * 0.99))]
+    print(f"mode={args.mode} sessions={args.sessions} stub_delay={args.delay_ms}ms")
+    print(f"wall time: {elapsed:.2f}s")
+    print(
+        f"loop lag ms: mean={statistics.mean(samples_ms):.2f} "
+        f"p99={p99:.2f} max={samples_ms[-1]:.2f} (samples={len(samples)})"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Scenario engine event-loop lag benchmark.")
+    parser.add_argument("--mode", choices=["async", "sync"], default="async")
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--delay-ms", type=int, default=300)
+    parser.add_argument("--probe-ms", type=int, default=10)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    server = start_stub_server(args.port, args.delay_ms / 1000.0)
+    try:
+        asyncio.run(main_async(args))
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
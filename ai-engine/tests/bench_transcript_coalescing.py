@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Client transcript messages per response with and without delta coalescing.
+
+Replays `--responses` synthetic assistant responses. Each is a sentence split
+into word-piece tokens that arrive like Realtime `response.audio_transcript.delta`
+events: bursts with exponential gaps (mean `--gap-ms`). Each configuration runs
+the deltas through RealtimeAudioRelay + TranscriptDeltaCoalescer in real time
+and counts client events per response; added latency is measured from a
+delta's arrival to the event that carries it.
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from scenario.audio_relay import RealtimeAudioRelay
+from scenario.transcript_coalescer import TranscriptDeltaCoalescer
+
+SENTENCE = (
+    "Great, so you are ordering a coffee at a small cafe near the station. "
+    "What size would you like, and would you prefer it hot or iced today?"
+)
+
+
+def tokenize(text: str, rng: np.random.Generator) -> list[str]:
+    tokens = []
+    index = 0
+    while index < len(text):
+        size = int(rng.integers(2, 6))
+        tokens.append(text[index : index + size])
+        index += size
+    return tokens
+
+
+async def run(window_ms: int, max_chars: int, args) -> tuple[list[int], list[float], int]:
+    rng = np.random.default_rng(5)
+    pending: list[float] = []
+    latencies: list[float] = []
+    events = 0
+
+    async def on_transcript(text: str, is_final: bool) -> None:
+        nonlocal events
+        if is_final:
+            return
+        events += 1
+        now = time.perf_counter()
+        latencies.extend((now - at) * 1000.0 for at in pending)
+        pending.clear()
+
+    coalescer = TranscriptDeltaCoalescer(
+        lambda text: on_transcript(text, False), window_ms=window_ms, max_chars=max_chars
+    )
+    relay = RealtimeAudioRelay(on_transcript=on_transcript, transcript_coalescer=coalescer)
+    per_response = []
+    deltas = 0
+    for _ in range(args.responses):
+        events = 0
+        tokens = tokenize(SENTENCE, rng)
+        deltas += len(tokens)
+        for token in tokens:
+            await asyncio.sleep(float(rng.exponential(args.gap_ms / 1000.0)))
+            pending.append(time.perf_counter())
+            await relay.handle_event({"type": "response.audio_transcript.delta", "transcript_delta": token})
+        await relay.handle_event({"type": "response.audio_transcript.done", "transcript": SENTENCE})
+        per_response.append(events)
+    return per_response, latencies, deltas
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Transcript delta coalescing benchmark.")
+    parser.add_argument("--responses", type=int, default=5)
+    parser.add_argument("--gap-ms", type=float, default=15.0)
+    parser.add_argument("--max-chars", type=int, default=80)
+    args = parser.parse_args()
+
+    for window_ms in (0, 50, 100, 150):
+        per_response, latencies, deltas = asyncio.run(run(window_ms, args.max_chars, args))
+        mean_events = statistics.mean(per_response)
+        print(
+            f"window {window_ms:>3} ms: {deltas / args.responses:5.1f} deltas -> {mean_events:5.1f} events per response "
+            f"({deltas / args.responses / mean_events:4.1f}x fewer), added latency mean "
+            f"{statistics.mean(latencies):5.1f} ms, max {max(latencies):5.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
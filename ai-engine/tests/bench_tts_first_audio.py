@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Time-to-first-audio for streamed vs whole-WAV TTS against a local chunked stub.
+
+The stub emulates /v1/audio/speech: it sends a streaming WAV header followed by
+PCM16 chunks at a configurable synthesis speed, so longer sentences take longer
+to finish. Streaming should keep time-to-first-audio flat as text grows.
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import struct
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from openai import AsyncOpenAI
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from scenario.tts_stream import OpenAITTSProvider, stream_tts_pcm16
+
+SAMPLE_RATE = 24000
+CHARS_PER_SEC_AUDIO = 15.0
+
+
+def _streaming_wav_header(sample_rate: int) -> bytes:
+    fmt = struct.pack("<HHIIHH", 1, 1, sample_rate, sample_rate * 2, 2, 16)
+    return (
+        b"RIFF"
+        + struct.pack("<I", 0xFFFFFFFF)
+        + b"WAVE"
+        + b"fmt "
+        + struct.pack("<I", len(fmt))
+        + fmt
+        + b"data"
+        + struct.pack("<I", 0xFFFFFFFF)
+    )
+
+
+def _make_stub_handler(first_byte_ms: float, realtime_factor: float):
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self) -> None:  # noqa: N802 - http.server API
+            length = int(self.headers.get("Content-Length", "0"))
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            audio_sec = max(0.5, len(payload.get("input", "")) / CHARS_PER_SEC_AUDIO)
+            chunk_bytes = int(SAMPLE_RATE * 0.05) * 2
+            total_chunks = int(audio_sec / 0.05)
+
+            self.send_response(200)
+            self.send_header("Content-Type", "audio/wav")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            time.sleep(first_byte_ms / 1000.0)
+            self._write_chunk(_streaming_wav_header(SAMPLE_RATE))
+            silence = b"\x00" * chunk_bytes
+            for _ in range(total_chunks):
+                time.sleep(0.05 / realtime_factor)
+                self._write_chunk(silence)
+            self.wfile.write(b"0\r\n\r\n")
+
+        def _write_chunk(self, data: bytes) -> None:
+            self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+            self.wfile.flush()
+
+        def log_message(self, *_args) -> None:
+            return
+
+    return StubHandler
+
+
+class BufferedProvider:
+    """Old behaviour: wait for the whole body before yielding anything."""
+
+    def __init__(self, inner: OpenAITTSProvider) -> None:
+        self._inner = inner
+
+    async def stream(self, text: str):
+        body = bytearray()
+        async for chunk in self._inner.stream(text):
+            body.extend(chunk)
+        yield bytes(body)
+
+
+async def measure(provider, text: str) -> tuple[float, float]:
+    started = time.perf_counter()
+    first = None
+    async for _pcm, _rate in stream_tts_pcm16(provider, text):
+        if first is None:
+            first = time.perf_counter() - started
+    total = time.perf_counter() - started
+    return (first or total) * 1000.0, total * 1000.0
+
+
+async def main_async(args) -> None:
+    client = AsyncOpenAI(api_key="stub", base_url=f"http://127.0.0.1:{args.port}/v1")
+    streaming = OpenAITTSProvider(client)
+    buffered = BufferedProvider(streaming)
+    for words in args.words:
+        text = " ".join(["hello"] * words)
+        for name, provider in (("streaming", streaming), ("whole-wav", buffered)):
+            firsts = []
+            for _ in range(args.repeat):
+                first_ms, _total_ms = await measure(provider, text)
+                firsts.append(first_ms)
+            print(f"{name:>9} words={words:>3} time-to-first-audio ms: median={statistics.median(firsts):.1f}")
+    await client.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Streaming TTS time-to-first-audio benchmark.")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--words", type=int, nargs="+", default=[5, 20, 60])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--first-byte-ms", type=float, default=80.0)
+    parser.add_argument("--realtime-factor", type=float, default=4.0)
+    args = parser.parse_args()
+
+    handler = _make_stub_handler(args.first_byte_ms, args.realtime_factor)
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        asyncio.run(main_async(args))
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
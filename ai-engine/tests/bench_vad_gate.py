@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Bytes suppressed and CPU per frame for the AudioController VAD gate.
+
+Synthesizes a learner session: utterances of `--speech-sec` (voiced harmonics
+with syllable-rate amplitude modulation at about -24 dBFS) separated by
+thinking pauses of `--pause-sec` (room noise at about -65 dBFS). Audio is fed
+in `--chunk-ms` chunks like a browser AudioWorklet would send it.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from realtime_conversation.audio_controller import AudioController
+
+SAMPLE_RATE = 24000
+
+
+def synthesize(args, rng: np.random.Generator) -> bytes:
+    parts = []
+    for _ in range(args.turns):
+        t = np.arange(int(SAMPLE_RATE * args.speech_sec)) / SAMPLE_RATE
+        voiced = sum(np.sin(2 * np.pi * 140 * k * t) / k for k in range(1, 6))
+        envelope = 0.5 * (1 + np.sin(2 * np.pi * 4 * t))
+        parts.append(voiced * envelope * 32767 * 10 ** (-24 / 20))
+        parts.append(rng.normal(0, 32767 * 10 ** (-65 / 20), int(SAMPLE_RATE * args.pause_sec)))
+    return np.clip(np.concatenate(parts), -32768, 32767).astype("<i2").tobytes()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="VAD gate suppression and CPU benchmark.")
+    parser.add_argument("--turns", type=int, default=20)
+    parser.add_argument("--speech-sec", type=float, default=3.0)
+    parser.add_argument("--pause-sec", type=float, default=6.0)
+    parser.add_argument("--chunk-ms", type=int, default=20)
+    args = parser.parse_args()
+
+    audio = synthesize(args, np.random.default_rng(0))
+    chunk_bytes = SAMPLE_RATE * args.chunk_ms // 1000 * 2
+    controller = AudioController()
+    controller.start_listening()
+    forwarded = 0
+    started = time.perf_counter()
+    for offset in range(0, len(audio), chunk_bytes):
+        forwarded += len(controller.process_audio_stream(audio[offset : offset + chunk_bytes]))
+    wall = time.perf_counter() - started
+    stats = controller.snapshot()
+    speech_pct = 100.0 * args.speech_sec / (args.speech_sec + args.pause_sec)
+    print(
+        f"{len(audio) / (2 * SAMPLE_RATE):.0f}s audio, speech {speech_pct:.0f}%: "
+        f"forwarded {100.0 * forwarded / len(audio):.1f}%, suppressed {stats['suppressed_pct']:.1f}% of bytes"
+    )
+    print(
+        f"VAD cpu {stats['cpu_us_per_frame']:.1f} us/frame ({controller.frame_samples} samples), "
+        f"{wall * 1e6 / (len(audio) / chunk_bytes):.1f} us/chunk wall"
+    )
+
+
+if __name__ == "__main__":
+    main()
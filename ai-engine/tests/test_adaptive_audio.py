@@ -0,0 +1,114 @@
+import asyncio
+import unittest
+
+import numpy as np
+
+from scenario.adaptive_audio import (
+    QUALITY_LEVELS,
+    AdaptiveAudioConfig,
+    AdaptiveDownstream,
+    AppPingProbe,
+    quality_event,
+    run_link_monitor,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class AdaptiveDownstreamTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.controller = AdaptiveDownstream(AdaptiveAudioConfig(), clock=self.clock)
+
+    def test_steps_down_on_congestion_with_hold(self) -> None:
+        self.clock.now = 1.0
+        self.assertTrue(self.controller.observe_queue(depth=30))
+        self.assertEqual(self.controller.level.sample_rate, 16000)
+        self.clock.now = 1.2
+        self.assertFalse(self.controller.observe_rtt(900.0))
+        self.clock.now = 2.0
+        self.assertTrue(self.controller.observe_queue(depth=30))
+        self.assertEqual(self.controller.level.sample_rate, 8000)
+        self.clock.now = 5.0
+        self.assertFalse(self.controller.observe_queue(depth=30))
+
+    def test_drops_count_as_congestion(self) -> None:
+        self.clock.now = 1.0
+        self.assertFalse(self.controller.observe_queue(depth=0, dropped_total=0))
+        self.assertTrue(self.controller.observe_queue(depth=0, dropped_total=3))
+
+    def test_recovers_only_after_clean_hold(self) -> None:
+        self.clock.now = 1.0
+        self.controller.observe_queue(depth=30)
+        self.clock.now = 3.0
+        self.controller.observe_queue(depth=0)
+        self.assertEqual(self.controller.level.sample_rate, 16000)
+        self.clock.now = 6.5
+        self.assertTrue(self.controller.observe_queue(depth=0))
+        self.assertEqual(self.controller.level.sample_rate, 24000)
+        self.assertEqual(self.controller.transitions, 2)
+
+    def test_convert_downsamples_but_never_upsamples(self) -> None:
+        pcm = (np.sin(np.arange(2400) * 0.05) * 8000).astype("<i2").tobytes()
+        self.assertEqual(self.controller.convert(pcm), (pcm, 24000))
+        self.clock.now = 1.0
+        self.controller.observe_queue(depth=30)
+        converted, rate = self.controller.convert(pcm)
+        self.assertEqual(rate, 16000)
+        self.assertAlmostEqual(len(converted) / 2, 1600, delta=2)
+        low = pcm[:320]
+        self.assertEqual(self.controller.convert(low, 8000), (low, 8000))
+
+    def test_streams_keep_separate_filter_history(self) -> None:
+        tts = (np.sin(np.arange(4800) * 0.05) * 8000).astype("<i2").tobytes()
+        relay = (np.sin(np.arange(4800) * 0.3) * 8000).astype("<i2").tobytes()
+        alone = AdaptiveDownstream(levels=QUALITY_LEVELS[1:])
+        expected = [alone.convert(tts[:4800], stream="tts"), alone.convert(tts[4800:], stream="tts")]
+
+        mixed = AdaptiveDownstream(levels=QUALITY_LEVELS[1:])
+        first = mixed.convert(tts[:4800], stream="tts")
+        mixed.convert(relay, stream="relay")
+        self.assertEqual([first, mixed.convert(tts[4800:], stream="tts")], expected)
+
+        # audio.done: the next utterance starts from an empty history
+        mixed.end_stream("tts")
+        self.assertEqual(mixed.convert(tts[:4800], stream="tts"), expected[0])
+
+    def test_quality_event(self) -> None:
+        self.assertEqual(
+            quality_event(self.controller.level),
+            {"type": "audio.quality", "sample_rate": 24000, "chunk_ms": 100},
+        )
+
+
+class LinkMonitorTests(unittest.IsolatedAsyncioTestCase):
+    async def test_app_ping_round_trip_and_timeout(self) -> None:
+        sent = []
+        probe = AppPingProbe(sent.append)
+        task = asyncio.create_task(probe.ping())
+        await asyncio.sleep(0)
+        self.assertEqual(sent, [{"type": "ping", "id": 1}])
+        probe.pong(1)
+        await asyncio.wait_for(task, timeout=1.0)
+
+        changes = []
+        controller = AdaptiveDownstream(AdaptiveAudioConfig(ping_timeout_sec=0.01, ping_interval_sec=0.01))
+        controller._changed_at -= 10
+        monitor = asyncio.create_task(
+            run_link_monitor(controller, AppPingProbe(sent.append).ping, lambda: (0, 0), changes.append)
+        )
+        await asyncio.sleep(0.05)
+        monitor.cancel()
+        # Unanswered pings count as the timeout RTT; 10 ms is not congestion.
+        self.assertEqual(changes, [])
+        self.assertAlmostEqual(controller.rtt_ms, 10.0, delta=1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import base64
+import json
+import unittest
+
+import numpy as np
+
+from scenario.audio_codecs import (
+    ImaAdpcmCodec,
+    MuLawCodec,
+    Pcm16Codec,
+    build_audio_codec,
+    negotiate_audio_codec,
+)
+from scenario.audio_frames import FRAME_INPUT_AUDIO, ClientAudioWire, decode_audio_frame, encode_audio_frame
+
+
+def _tone(samples: int, rate: int = 24000) -> np.ndarray:
+    t = np.arange(samples) / rate
+    return (8000 * np.sin(2 * np.pi * 440 * t) + 2000 * np.sin(2 * np.pi * 1700 * t)).astype("<i2")
+
+
+def _snr_db(reference: np.ndarray, decoded: bytes) -> float:
+    out = np.frombuffer(decoded, dtype="<i2").astype(np.float64)
+    ref = reference.astype(np.float64)
+    return 10 * np.log10(np.mean(ref**2) / np.mean((out - ref) ** 2))
+
+
+def _mulaw_reference(sample: int) -> int:
+    sign = 0x80 if sample < 0 else 0
+    magnitude = min(abs(sample), 32635) + 0x84
+    exponent = 7
+    while exponent > 0 and not magnitude & (0x4000 >> (7 - exponent)):
+        exponent -= 1
+    mantissa = (magnitude >> (exponent + 3)) & 0x0F
+    return ~(sign | (exponent << 4) | mantissa) & 0xFF
+
+
+class AudioCodecTests(unittest.TestCase):
+    def test_mulaw_matches_g711_reference(self) -> None:
+        samples = np.array([0, 1, -1, 100, -100, 5000, -5000, 32767, -32768], dtype="<i2")
+        encoded = MuLawCodec().encode(samples.tobytes())
+        self.assertEqual(list(encoded), [_mulaw_reference(int(s)) for s in samples])
+        self.assertEqual(encoded[0], 0xFF)
+
+    def test_mulaw_round_trip(self) -> None:
+        tone = _tone(2400)
+        codec = MuLawCodec()
+        encoded = codec.encode(tone.tobytes())
+        self.assertEqual(len(encoded), tone.size)
+        self.assertGreater(_snr_db(tone, codec.decode(encoded)), 30.0)
+
+    def test_adpcm_round_trip_and_size(self) -> None:
+        tone = _tone(2400)
+        codec = ImaAdpcmCodec()
+        encoded = codec.encode(tone.tobytes())
+        self.assertLess(len(encoded), tone.nbytes / 3.5)
+        self.assertGreater(_snr_db(tone, codec.decode(encoded)), 25.0)
+
+    def test_adpcm_preserves_sample_count_for_partial_blocks(self) -> None:
+        codec = ImaAdpcmCodec(block_samples=64)
+        tone = _tone(301)
+        for count in (1, 2, 3, 63, 64, 65, 128, 301):
+            decoded = codec.decode(codec.encode(tone[:count].tobytes()))
+            self.assertEqual(len(decoded), count * 2, count)
+        self.assertEqual(codec.encode(b""), b"")
+
+    def test_negotiation_falls_back_to_pcm16(self) -> None:
+        self.assertEqual(negotiate_audio_codec("ADPCM"), "adpcm")
+        self.assertEqual(negotiate_audio_codec("opus"), "pcm16")
+        self.assertIsInstance(build_audio_codec(None), Pcm16Codec)
+
+
+class ClientAudioWireCodecTests(unittest.TestCase):
+    def test_json_wire_encodes_output_and_decodes_input(self) -> None:
+        tone = _tone(480)
+        wire = ClientAudioWire("json", "mulaw")
+        message = json.loads(
+            wire.encode({"type": "audio.delta", "delta": base64.b64encode(tone.tobytes()).decode("ascii")})
+        )
+        encoded = base64.b64decode(message["delta"])
+        self.assertEqual(len(encoded), tone.size)
+        self.assertEqual(len(wire.decode_input(encoded)), tone.nbytes)
+
+    def test_binary_wire_carries_codec_payload(self) -> None:
+        tone = _tone(480)
+        wire = ClientAudioWire("binary", "adpcm")
+        frame = decode_audio_frame(wire.encode({"type": "response.audio.delta", "delta": tone.tobytes()}), "adpcm")
+        self.assertLess(len(frame.payload), tone.nbytes / 3)
+        upstream = encode_audio_frame(FRAME_INPUT_AUDIO, 0, 24000, ImaAdpcmCodec().encode(tone.tobytes()))
+        decoded = wire.decode_input(decode_audio_frame(upstream, "adpcm").payload)
+        self.assertGreater(_snr_db(tone, decoded), 25.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
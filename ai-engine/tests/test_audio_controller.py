@@ -0,0 +1,58 @@
+import unittest
+
+import numpy as np
+
+from realtime_conversation.audio_controller import AudioController
+
+SAMPLE_RATE = 24000
+
+
+def _tone(ms: int, db: float) -> bytes:
+    t = np.arange(SAMPLE_RATE * ms // 1000) / SAMPLE_RATE
+    amplitude = 32767 * 10 ** (db / 20) * np.sqrt(2)
+    return (amplitude * np.sin(2 * np.pi * 220 * t)).astype("<i2").tobytes()
+
+
+def _noise(ms: int, db: float, seed: int = 0) -> bytes:
+    rng = np.random.default_rng(seed)
+    samples = rng.normal(0, 32767 * 10 ** (db / 20), SAMPLE_RATE * ms // 1000)
+    return np.clip(samples, -32768, 32767).astype("<i2").tobytes()
+
+
+class AudioControllerTests(unittest.TestCase):
+    def test_passthrough_until_enabled(self) -> None:
+        controller = AudioController()
+        silence = b"\x00\x00" * 480
+        self.assertEqual(controller.process_audio_stream(silence), silence)
+
+    def test_long_silence_is_suppressed_with_preroll_and_hangover(self) -> None:
+        controller = AudioController(frame_ms=20, hangover_ms=200, preroll_ms=100)
+        controller.start_listening()
+        out = controller.process_audio_stream(_noise(2000, -70))
+        self.assertEqual(out, b"")
+        out = controller.process_audio_stream(_tone(500, -20))
+        # 100 ms pre-roll + 500 ms speech
+        self.assertEqual(len(out), (100 + 500) * SAMPLE_RATE // 1000 * 2)
+        out = controller.process_audio_stream(_noise(1000, -70, seed=1))
+        self.assertEqual(len(out), 200 * SAMPLE_RATE // 1000 * 2)
+        self.assertFalse(controller.is_speaking)
+        self.assertGreater(controller.snapshot()["suppressed_pct"], 50.0)
+
+    def test_residual_bytes_carry_to_next_chunk(self) -> None:
+        controller = AudioController(frame_ms=20, preroll_ms=20)
+        controller.start_listening()
+        speech = _tone(40, -20)
+        first = controller.process_audio_stream(speech[:1001])
+        second = controller.process_audio_stream(speech[1001:])
+        self.assertEqual(first + second, speech)
+
+    def test_loud_broadband_noise_counts_as_speech_only_when_strong(self) -> None:
+        controller = AudioController(threshold_db=-45.0)
+        frames = np.frombuffer(_noise(100, -40), dtype="<i2").reshape(5, 480)
+        self.assertFalse(controller.classify_frames(frames).any())
+        frames = np.frombuffer(_noise(100, -20), dtype="<i2").reshape(5, 480)
+        self.assertTrue(controller.classify_frames(frames).all())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import base64
+import unittest
+
+import numpy as np
+
+from scenario.adaptive_audio import QUALITY_LEVELS, AdaptiveAudioConfig, AdaptiveDownstream
+from scenario.audio_egress import OutputAudioCoalescer
+
+
+class OutputAudioCoalescerTests(unittest.TestCase):
+    def test_fixed_frames_from_irregular_deltas(self) -> None:
+        coalescer = OutputAudioCoalescer(60)
+        audio = bytes(range(256)) * 60
+        frames = []
+        for start, end in ((0, 1000), (1000, 5000), (5000, 5002), (5002, len(audio))):
+            frames += coalescer.push_base64(base64.b64encode(audio[start:end]).decode("ascii"))
+        frames += coalescer.flush()
+        sizes = [len(pcm) for pcm, _ in frames]
+        self.assertEqual(sizes[:-1], [2880] * (len(sizes) - 1))
+        self.assertEqual(b"".join(pcm for pcm, _ in frames), audio)
+        self.assertEqual(coalescer.flush(), [])
+        self.assertEqual(coalescer.snapshot()["deltas_in"], 4)
+
+    def test_invalid_base64_is_ignored(self) -> None:
+        coalescer = OutputAudioCoalescer(40)
+        self.assertEqual(coalescer.push_base64("not base64!"), [])
+        self.assertEqual(coalescer.buffered_bytes, 0)
+
+    def test_discard_drops_buffered_audio(self) -> None:
+        coalescer = OutputAudioCoalescer(100)
+        coalescer.push(b"\x00" * 100)
+        coalescer.discard()
+        self.assertEqual(coalescer.flush(), [])
+        self.assertEqual(coalescer.stats.discarded_bytes, 100)
+
+    def test_level_change_flushes_old_rate_and_uses_level_chunk(self) -> None:
+        clock = [0.0]
+        downstream = AdaptiveDownstream(AdaptiveAudioConfig(), clock=lambda: clock[0])
+        coalescer = OutputAudioCoalescer(40, downstream=downstream)
+        pcm = (np.sin(np.arange(2400) * 0.05) * 8000).astype("<i2").tobytes()
+        first = coalescer.push(pcm[:1000])
+        self.assertEqual(first, [])
+        clock[0] = 1.0
+        downstream.observe_queue(depth=50)
+        frames = coalescer.push(pcm)
+        self.assertEqual(frames[0], (pcm[:1000], 24000))
+        # 16 kHz level: 160 ms frames (5120 bytes) > 40 ms requested; 100 ms of audio stays buffered.
+        self.assertEqual(len(frames), 1)
+        self.assertEqual(coalescer.sample_rate, 16000)
+        self.assertGreater(coalescer.buffered_bytes, 3000)
+
+    def test_end_response_flushes_and_resets_its_stream(self) -> None:
+        downstream = AdaptiveDownstream(AdaptiveAudioConfig(), levels=QUALITY_LEVELS[1:])
+        coalescer = OutputAudioCoalescer(40, downstream=downstream)
+        pcm = (np.sin(np.arange(1000) * 0.05) * 8000).astype("<i2").tobytes()
+        fresh = AdaptiveDownstream(AdaptiveAudioConfig(), levels=QUALITY_LEVELS[1:]).convert(pcm)[0]
+
+        coalescer.push(pcm)
+        self.assertEqual(coalescer.end_response(), [(fresh, 16000)])
+        # The next response is converted as if nothing came before it.
+        coalescer.push(pcm)
+        self.assertEqual(coalescer.end_response(), [(fresh, 16000)])
+
+
+if __name__ == "__main__":
+    unittest.main()
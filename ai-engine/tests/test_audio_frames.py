@@ -0,0 +1,60 @@
+import base64
+import json
+import unittest
+
+from scenario.audio_frames import (
+    FRAME_HEADER,
+    FRAME_INPUT_AUDIO,
+    FRAME_OUTPUT_AUDIO,
+    ClientAudioWire,
+    decode_audio_frame,
+    encode_audio_frame,
+    negotiate_audio_transport,
+)
+
+
+class AudioFrameTests(unittest.TestCase):
+    def test_round_trip(self) -> None:
+        pcm = bytes(range(64))
+        frame = decode_audio_frame(encode_audio_frame(FRAME_INPUT_AUDIO, 7, 16000, pcm))
+        self.assertEqual((frame.frame_type, frame.seq, frame.sample_rate), (FRAME_INPUT_AUDIO, 7, 16000))
+        self.assertEqual(bytes(frame.payload), pcm)
+
+    def test_rejects_malformed_frames(self) -> None:
+        with self.assertRaises(ValueError):
+            decode_audio_frame(b"\x01\x01")
+        with self.assertRaises(ValueError):
+            decode_audio_frame(encode_audio_frame(FRAME_INPUT_AUDIO, 0, 24000, b"\x00\x01\x02"))
+        with self.assertRaises(ValueError):
+            decode_audio_frame(b"\x09" + encode_audio_frame(FRAME_INPUT_AUDIO, 0, 24000, b"")[1:])
+
+    def test_negotiation_falls_back_to_json(self) -> None:
+        self.assertEqual(negotiate_audio_transport("binary"), "binary")
+        self.assertEqual(negotiate_audio_transport(None), "json")
+        self.assertEqual(negotiate_audio_transport("msgpack"), "json")
+
+
+class ClientAudioWireTests(unittest.TestCase):
+    def test_json_wire_keeps_base64_messages(self) -> None:
+        wire = ClientAudioWire("json")
+        pcm = b"\x01\x00\x02\x00"
+        raw = json.loads(wire.encode({"type": "response.audio.delta", "delta": pcm, "sample_rate": 24000}))
+        self.assertEqual(base64.b64decode(raw["delta"]), pcm)
+        b64 = base64.b64encode(pcm).decode("ascii")
+        self.assertEqual(json.loads(wire.encode({"type": "audio.delta", "delta": b64}))["delta"], b64)
+
+    def test_binary_wire_frames_audio_and_keeps_control_as_json(self) -> None:
+        wire = ClientAudioWire("binary")
+        pcm = b"\x01\x00\x02\x00"
+        first = wire.encode({"type": "audio.delta", "delta": base64.b64encode(pcm).decode("ascii")})
+        second = wire.encode({"type": "response.audio.delta", "delta": pcm, "sample_rate": 16000})
+        self.assertEqual(len(first), FRAME_HEADER.size + len(pcm))
+        frames = [decode_audio_frame(first), decode_audio_frame(second)]
+        self.assertEqual([f.seq for f in frames], [0, 1])
+        self.assertEqual([f.sample_rate for f in frames], [24000, 16000])
+        self.assertTrue(all(f.frame_type == FRAME_OUTPUT_AUDIO for f in frames))
+        self.assertEqual(json.loads(wire.encode({"type": "speech.started"})), {"type": "speech.started"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import asyncio
+import base64
+import unittest
+
+from scenario.audio_ingress import InputAudioAggregator, base64_decoded_length
+
+
+class Base64DecodedLengthTests(unittest.TestCase):
+    def test_matches_decoded_length(self) -> None:
+        for size in (0, 1, 2, 3, 4, 5, 96, 97, 98, 960, 4801):
+            encoded = base64.b64encode(bytes(index % 256 for index in range(size))).decode("ascii")
+            self.assertEqual(base64_decoded_length(encoded), size, msg=f"size={size}")
+
+    def test_rejects_malformed_input(self) -> None:
+        valid = base64.b64encode(b"\x01" * 960).decode("ascii")
+        self.assertEqual(base64_decoded_length(valid[:-1]), -1)
+        self.assertEqual(base64_decoded_length("ab=c"), -1)
+        self.assertEqual(base64_decoded_length("안녕하세"), -1)
+        self.assertEqual(base64_decoded_length("!" + valid[1:]), -1)
+        self.assertEqual(base64_decoded_length(valid[:-4] + "A==="), -1)
+        middle = len(valid) // 2
+        self.assertEqual(base64_decoded_length(valid[:middle] + "*" + valid[middle + 1 :]), -1)
+
+
+class InputAudioAggregatorTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.sent: list[bytes] = []
+
+    async def _send(self, audio: str) -> None:
+        self.sent.append(base64.b64decode(audio))
+
+    async def test_merges_chunks_into_frames(self) -> None:
+        aggregator = InputAudioAggregator(self._send, frame_ms=80, sample_rate=24000)
+        chunk = bytes(index % 256 for index in range(960))  # 20 ms, unpadded base64
+        for _ in range(8):
+            await aggregator.add_base64(base64.b64encode(chunk).decode("ascii"))
+        self.assertEqual(self.sent, [chunk * 4, chunk * 4])
+        self.assertEqual(aggregator.snapshot()["chunks_per_frame"], 4.0)
+        aggregator.close()
+
+    async def test_padded_and_raw_chunks_keep_byte_order(self) -> None:
+        aggregator = InputAudioAggregator(self._send, frame_ms=80, sample_rate=16000)
+        parts = [b"\x01\x02" * 240, b"\x03\x04" * 160, b"\x05\x06" * 7]
+        await aggregator.add_base64(base64.b64encode(parts[0]).decode("ascii"))
+        await aggregator.add_base64(base64.b64encode(parts[1]).decode("ascii"))
+        await aggregator.add_pcm(parts[2])
+        self.assertEqual(self.sent, [])
+        await aggregator.flush()
+        self.assertEqual(self.sent, [b"".join(parts)])
+
+    async def test_timeout_flushes_partial_frame(self) -> None:
+        aggregator = InputAudioAggregator(self._send, frame_ms=100, max_delay_ms=20)
+        await aggregator.add_pcm(b"\x00\x00" * 10)
+        self.assertEqual(self.sent, [])
+        await asyncio.sleep(0.05)
+        self.assertEqual(self.sent, [b"\x00\x00" * 10])
+        self.assertGreaterEqual(aggregator.stats.added_latency_max_ms, 15.0)
+
+    async def test_zero_frame_ms_passes_through(self) -> None:
+        aggregator = InputAudioAggregator(self._send, frame_ms=0)
+        await aggregator.add_pcm(b"\x01\x00")
+        await aggregator.add_pcm(b"\x02\x00")
+        self.assertEqual(self.sent, [b"\x01\x00", b"\x02\x00"])
+
+
+if __name__ == "__main__":
+    unittest.main()
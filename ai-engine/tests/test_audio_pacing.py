@@ -0,0 +1,55 @@
+import asyncio
+import unittest
+
+from scenario.audio_pacing import AudioPacer, AudioPacingConfig
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class AudioPacerTests(unittest.IsolatedAsyncioTestCase):
+    def test_chunk_bytes_per_connection(self) -> None:
+        self.assertEqual(AudioPacingConfig(chunk_ms=100).chunk_bytes(24000), 4800)
+        self.assertEqual(AudioPacingConfig(chunk_ms=40).chunk_bytes(16000), 1280)
+
+    def test_initial_burst_is_sent_without_waiting(self) -> None:
+        clock = FakeClock()
+        pacer = AudioPacer(initial_burst_ms=300, clock=clock)
+        pacer.start()
+        for _ in range(3):
+            self.assertLessEqual(pacer.next_deadline(), clock.now)
+            pacer.advance(0.1)
+        self.assertAlmostEqual(pacer.next_deadline() - clock.now, 0.0)
+        pacer.advance(0.1)
+        self.assertAlmostEqual(pacer.next_deadline() - clock.now, 0.1)
+
+    def test_late_wakeups_do_not_accumulate(self) -> None:
+        clock = FakeClock()
+        pacer = AudioPacer(initial_burst_ms=0, clock=clock)
+        pacer.start()
+        for _ in range(50):
+            clock.now = max(clock.now, pacer.next_deadline()) + 0.004  # jitter + send time
+            pacer.advance(0.1)
+        # Deadline of chunk 50 stays on the ideal grid despite 50 late sends.
+        self.assertAlmostEqual(pacer.next_deadline(), 100.0 + 5.0)
+        self.assertAlmostEqual(pacer.lag(), -0.096, places=6)
+
+    async def test_wait_turn_tracks_wall_clock(self) -> None:
+        pacer = AudioPacer(initial_burst_ms=0)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        pacer.start()
+        for _ in range(10):
+            await pacer.wait_turn()
+            pacer.advance(0.01)
+        await pacer.wait_turn()
+        self.assertAlmostEqual(loop.time() - started, 0.1, delta=0.03)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 import base64
 import unittest
 
+from scenario.audio_egress import OutputAudioCoalescer
 from scenario.audio_relay import RealtimeAudioRelay
 
 
@@ -13,6 +14,20 @@ class AudioRelayTests(unittest.IsolatedAsyncioTestCase):
         await relay.handle_event({"type": "response.audio.delta", "delta": encoded})
         self.assertEqual(chunks, [encoded])
 
+    async def test_coalesced_frames_flush_on_done(self) -> None:
+        frames: list[tuple[bytes, int]] = []
+        relay = RealtimeAudioRelay(
+            on_audio_frame=lambda pcm, rate: frames.append((pcm, rate)),
+            coalescer=OutputAudioCoalescer(40),
+        )
+        for size in (700, 1500, 900):
+            delta = base64.b64encode(b"\x01" * size).decode("ascii")
+            await relay.handle_event({"type": "response.audio.delta", "delta": delta})
+        self.assertEqual([len(pcm) for pcm, _ in frames], [1920])
+        await relay.handle_event({"type": "response.done"})
+        self.assertEqual([len(pcm) for pcm, _ in frames], [1920, 1180])
+        self.assertEqual({rate for _, rate in frames}, {24000})
+
     async def test_transcript_events(self) -> None:
         transcript_events: list[tuple[str, bool]] = []
 
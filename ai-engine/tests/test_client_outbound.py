@@ -0,0 +1,148 @@
+import asyncio
+import unittest
+
+from scenario.client_outbound import ClientOutboundQueue
+from scenario.fallbacks import build_client_error_handler
+from scenario.prompts import KOREAN_FALLBACK_MESSAGE
+
+
+class GatedSink:
+    """Client that only drains when the test opens the gate."""
+
+    def __init__(self) -> None:
+        self.sent: list[dict] = []
+        self.gate = asyncio.Event()
+
+    async def send(self, payload: dict) -> None:
+        await self.gate.wait()
+        self.sent.append(payload)
+
+
+class ClientOutboundQueueTests(unittest.IsolatedAsyncioTestCase):
+    async def test_put_never_blocks_on_slow_client(self) -> None:
+        sink = GatedSink()
+        queue = ClientOutboundQueue(sink.send, max_depth=4)
+        queue.start()
+        queue.put({"type": "audio.delta", "delta": "first"})
+        await asyncio.sleep(0)  # writer picks up the first frame and blocks on the client
+        for index in range(50):
+            queue.put({"type": "audio.delta", "delta": str(index)})
+        self.assertLessEqual(queue.depth, 4)
+        self.assertGreater(queue.stats.dropped_audio, 0)
+        sink.gate.set()
+        await queue.close()
+        # The in-flight frame goes out, then only the newest queued frames.
+        self.assertEqual([p["delta"] for p in sink.sent], ["first", "46", "47", "48", "49"])
+
+    async def test_control_events_are_never_dropped(self) -> None:
+        sink = GatedSink()
+        queue = ClientOutboundQueue(sink.send, max_depth=2)
+        for _ in range(5):
+            queue.put({"type": "audio.delta", "delta": "x"})
+        for event_type in ("speech.started", "input_audio.transcript", "error", "speech.stopped"):
+            self.assertTrue(queue.put({"type": event_type}))
+        sink.gate.set()
+        queue.start()
+        await queue.close()
+        self.assertEqual(
+            [p["type"] for p in sink.sent],
+            ["speech.started", "input_audio.transcript", "error", "speech.stopped"],
+        )
+        self.assertEqual(queue.stats.dropped_audio, 5)
+        self.assertEqual(queue.stats.max_depth_seen, 4)
+
+    async def test_transcript_deltas_coalesce_in_order(self) -> None:
+        sink = GatedSink()
+        queue = ClientOutboundQueue(sink.send)
+        queue.put({"type": "response.audio_transcript.delta", "transcript_delta": "Hel"})
+        queue.put({"type": "response.audio_transcript.delta", "transcript_delta": "lo"})
+        queue.put({"type": "audio.delta", "delta": "a"})
+        queue.put({"type": "response.audio_transcript.delta", "transcript_delta": "!"})
+        sink.gate.set()
+        queue.start()
+        await queue.close()
+        self.assertEqual(
+            [p.get("transcript_delta", p.get("delta")) for p in sink.sent],
+            ["Hello", "a", "!"],
+        )
+        self.assertEqual(queue.stats.coalesced_transcripts, 1)
+
+    async def test_control_events_jump_queued_audio(self) -> None:
+        sink = GatedSink()
+        queue = ClientOutboundQueue(sink.send)
+        for index in range(3):
+            queue.put({"type": "audio.delta", "delta": str(index)})
+        queue.put({"type": "audio.done"})
+        queue.put({"type": "speech.started"})
+        queue.put({"type": "audio.delta", "delta": "3"})
+        queue.put({"type": "error"})
+        sink.gate.set()
+        queue.start()
+        await queue.close()
+        self.assertEqual(
+            [p["type"] + p.get("delta", "") for p in sink.sent],
+            ["speech.started", "error", "audio.delta0", "audio.delta1", "audio.delta2", "audio.done", "audio.delta3"],
+        )
+        self.assertEqual(queue.stats.control_sent, 2)
+
+    async def test_done_markers_follow_their_deltas(self) -> None:
+        sink = GatedSink()
+        queue = ClientOutboundQueue(sink.send)
+        queue.put({"type": "response.audio_transcript.delta", "transcript_delta": "Hel"})
+        queue.put({"type": "response.audio.delta", "delta": "a"})
+        queue.put({"type": "response.audio_transcript.done", "transcript": "Hello"})
+        queue.put({"type": "response.audio.done"})
+        queue.put({"type": "transcript.delta", "delta": "Hi"})
+        queue.put({"type": "speech.started"})
+        queue.put({"type": "transcript.done", "transcript": "Hi"})
+        sink.gate.set()
+        queue.start()
+        await queue.close()
+        self.assertEqual(
+            [p["type"] for p in sink.sent],
+            [
+                "speech.started",
+                "response.audio_transcript.delta",
+                "response.audio.delta",
+                "response.audio_transcript.done",
+                "response.audio.done",
+                "transcript.delta",
+                "transcript.done",
+            ],
+        )
+
+    async def test_send_failure_closes_queue(self) -> None:
+        async def broken(_payload: dict) -> None:
+            raise ConnectionError("gone")
+
+        queue = ClientOutboundQueue(broken)
+        queue.start()
+        queue.put({"type": "audio.done"})
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        self.assertTrue(queue.closed)
+        self.assertFalse(queue.put({"type": "error"}))
+        await queue.close()
+
+    async def test_realtime_error_fallback_goes_out_as_error_event(self) -> None:
+        sink = GatedSink()
+        sink.gate.set()
+        queue = ClientOutboundQueue(sink.send)
+        queue.start()
+
+        async def send_to_client(payload: dict) -> None:
+            queue.put(payload)
+
+        await build_client_error_handler(send_to_client)(RuntimeError("upstream"))
+        await queue.close()
+        self.assertEqual(sink.sent, [{"type": "error", "message": KOREAN_FALLBACK_MESSAGE}])
+
+    async def test_non_dict_payload_is_rejected(self) -> None:
+        queue = ClientOutboundQueue(GatedSink().send)
+        with self.assertLogs("scenario.client_outbound", "WARNING"):
+            self.assertFalse(queue.put(KOREAN_FALLBACK_MESSAGE))
+        self.assertEqual(queue.depth, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
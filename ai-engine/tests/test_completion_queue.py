@@ -0,0 +1,189 @@
+import asyncio
+import unittest
+
+from scenario.completion_queue import (
+    COMPLETION_FAILED,
+    COMPLETION_PENDING,
+    COMPLETION_PERSISTED,
+    CompletionJob,
+    ScenarioCompletionQueue,
+)
+
+
+class FakeOutbox:
+    def __init__(self, rows=None) -> None:
+        self.rows: dict[str, tuple[str, dict]] = dict(rows or {})
+
+    async def add(self, job: CompletionJob) -> None:
+        self.rows[job.session_id] = (COMPLETION_PENDING, job.to_payload())
+
+    async def mark(self, session_id: str, status: str, error=None) -> None:
+        self.rows[session_id] = (status, self.rows[session_id][1])
+
+    async def remove(self, session_id: str) -> None:
+        self.rows.pop(session_id, None)
+
+    async def unfinished(self) -> list[CompletionJob]:
+        return [
+            CompletionJob.from_payload(payload, persisted=status == COMPLETION_PERSISTED)
+            for status, payload in self.rows.values()
+            if status != COMPLETION_FAILED
+        ]
+
+
+def _job(session_id: str = "s1") -> CompletionJob:
+    return CompletionJob(
+        session_id=session_id,
+        scenario_state={"place": "cafe"},
+        transcripts=["hello"],
+        fallback_title="cafe",
+    )
+
+
+class ScenarioCompletionQueueTests(unittest.IsolatedAsyncioTestCase):
+    def build(self, *, persist=None, generate_title=None, **kwargs) -> ScenarioCompletionQueue:
+        self.stored: dict[str, str] = {}
+        self.calls: list[str] = []
+
+        async def default_persist(job: CompletionJob) -> None:
+            self.calls.append("persist")
+            self.stored[job.session_id] = job.fallback_title
+
+        async def default_title(job: CompletionJob) -> str:
+            self.calls.append("title")
+            return "Ordering coffee"
+
+        async def backfill(session_id: str, title: str) -> None:
+            self.stored[session_id] = title
+
+        return ScenarioCompletionQueue(
+            persist=persist or default_persist,
+            generate_title=generate_title or default_title,
+            backfill_title=backfill,
+            retry_delay_sec=0.0,
+            **kwargs,
+        )
+
+    async def test_submit_returns_immediately_and_backfills_title(self) -> None:
+        release = asyncio.Event()
+
+        async def slow_title(job: CompletionJob) -> str:
+            await release.wait()
+            return "Ordering coffee"
+
+        queue = self.build(generate_title=slow_title)
+        self.assertEqual(await queue.submit(_job()), 1)
+        self.assertTrue(await queue.wait_persisted("s1", timeout=1.0))
+        self.assertEqual(self.stored["s1"], "cafe")
+
+        release.set()
+        await queue.close()
+        self.assertEqual(self.stored["s1"], "Ordering coffee")
+        snapshot = queue.snapshot()
+        self.assertEqual((snapshot["persisted"], snapshot["titled"], snapshot["queue_len"]), (1, 1, 0))
+        self.assertIsNotNone(snapshot["title_ms_p50"])
+
+    async def test_persist_is_retried(self) -> None:
+        attempts = []
+
+        async def flaky_persist(job: CompletionJob) -> None:
+            attempts.append(job.session_id)
+            if len(attempts) < 3:
+                raise RuntimeError("database is locked")
+
+        queue = self.build(persist=flaky_persist, max_attempts=3)
+        await queue.submit(_job())
+        with self.assertLogs("scenario.completion_queue", "WARNING"):
+            await queue.close()
+        self.assertEqual(len(attempts), 3)
+        self.assertEqual(queue.metrics.retries, 2)
+        self.assertEqual(queue.metrics.persisted, 1)
+
+    async def test_failed_title_keeps_fallback(self) -> None:
+        async def broken_title(job: CompletionJob) -> str:
+            raise RuntimeError("timeout")
+
+        queue = self.build(generate_title=broken_title, max_attempts=2)
+        await queue.submit(_job())
+        with self.assertLogs("scenario.completion_queue", "WARNING"):
+            await queue.close()
+        self.assertEqual(self.stored["s1"], "cafe")
+        self.assertEqual((queue.metrics.persisted, queue.metrics.titled), (1, 0))
+
+    async def test_wait_for_unknown_session(self) -> None:
+        queue = self.build()
+        self.assertIsNone(await queue.wait_persisted("missing", timeout=0.01))
+        await queue.close()
+
+    async def test_outbox_record_follows_the_job(self) -> None:
+        outbox = FakeOutbox()
+        release = asyncio.Event()
+
+        async def slow_title(job: CompletionJob) -> str:
+            await release.wait()
+            return "Ordering coffee"
+
+        queue = self.build(generate_title=slow_title, outbox=outbox)
+        await queue.submit(_job())
+        # Recorded before submit returns, i.e. before scenario.completed goes out
+        self.assertEqual(outbox.rows["s1"][0], COMPLETION_PENDING)
+        await queue.wait_persisted("s1", timeout=1.0)
+        await asyncio.sleep(0)
+        self.assertEqual(outbox.rows["s1"][0], COMPLETION_PERSISTED)
+        release.set()
+        await queue.close()
+        self.assertEqual(outbox.rows, {})
+
+    async def test_permanent_persist_failure_is_reported(self) -> None:
+        outbox = FakeOutbox()
+        notified = []
+
+        async def broken_persist(job: CompletionJob) -> None:
+            raise RuntimeError("disk full")
+
+        async def on_failed(job: CompletionJob) -> None:
+            notified.append(job.session_id)
+
+        queue = self.build(persist=broken_persist, outbox=outbox, max_attempts=2)
+        job = _job()
+        job.on_failed = on_failed
+        with self.assertLogs("scenario.completion_queue", "WARNING"):
+            await queue.submit(job)
+            self.assertEqual(await queue.wait_persisted("s1", timeout=1.0), COMPLETION_FAILED)
+            await queue.close()
+        self.assertEqual(notified, ["s1"])
+        self.assertEqual(queue.status("s1"), COMPLETION_FAILED)
+        self.assertEqual(outbox.rows["s1"][0], COMPLETION_FAILED)
+        self.assertEqual((queue.metrics.failed, queue.metrics.persisted, queue.metrics.titled), (1, 0, 0))
+
+    async def test_close_counts_interrupted_jobs_and_keeps_them_in_outbox(self) -> None:
+        outbox = FakeOutbox()
+        started = asyncio.Event()
+
+        async def stuck_persist(job: CompletionJob) -> None:
+            started.set()
+            await asyncio.Event().wait()
+
+        queue = self.build(persist=stuck_persist, outbox=outbox, workers=1, drain_timeout=0.01)
+        await queue.submit(_job("s1"))
+        await queue.submit(_job("s2"))
+        await started.wait()
+        with self.assertLogs("scenario.completion_queue", "WARNING"):
+            await queue.close()
+        self.assertEqual(queue.metrics.dropped, 2)
+        self.assertEqual(set(outbox.rows), {"s1", "s2"})
+
+        # Next start resumes both; a persisted-but-untitled record only gets its title.
+        outbox.rows["s2"] = (COMPLETION_PERSISTED, outbox.rows["s2"][1])
+        resumed = self.build(outbox=outbox)
+        resumed.start()
+        self.assertEqual(await resumed.wait_persisted("s1", timeout=1.0), COMPLETION_PERSISTED)
+        await resumed.close()
+        self.assertEqual(resumed.metrics.recovered, 2)
+        self.assertEqual(self.calls.count("persist"), 1)
+        self.assertEqual(self.stored, {"s1": "Ordering coffee", "s2": "Ordering coffee"})
+        self.assertEqual(outbox.rows, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
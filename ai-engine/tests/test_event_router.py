@@ -0,0 +1,88 @@
+import json
+import unittest
+
+from scenario.event_router import EventRouter, extract_string_field, peek_event_type
+
+
+def audio_delta(delta: str) -> str:
+    return json.dumps(
+        {
+            "type": "response.audio.delta",
+            "event_id": "event_1",
+            "response_id": "resp_1",
+            "item_id": "item_1",
+            "output_index": 0,
+            "content_index": 0,
+            "delta": delta,
+        },
+        separators=(",", ":"),
+    )
+
+
+class PeekTests(unittest.TestCase):
+    def test_peek_type(self) -> None:
+        self.assertEqual(peek_event_type(audio_delta("AAAA")), "response.audio.delta")
+        self.assertEqual(peek_event_type('{"event_id": "e", "type": "response.done"}'), "response.done")
+
+    def test_peek_needs_full_parse(self) -> None:
+        self.assertIsNone(peek_event_type('{"item": {"type": "message"}, "type": "x"}'))
+        self.assertIsNone(peek_event_type("not json"))
+        self.assertIsNone(peek_event_type('{"event_id": "' + "e" * 300 + '", "type": "x"}'))
+
+    def test_extract_string_field(self) -> None:
+        self.assertEqual(extract_string_field(audio_delta("AAA+/=="), "delta"), "AAA+/==")
+        self.assertIsNone(extract_string_field('{"delta": "a\\"b"}', "delta"))
+        self.assertIsNone(extract_string_field('{"delta": 1}', "delta"))
+
+
+class EventRouterTests(unittest.IsolatedAsyncioTestCase):
+    async def test_unsubscribed_events_are_not_parsed(self) -> None:
+        seen: list[dict] = []
+        router = EventRouter()
+        router.subscribe(seen.append, "response.done")
+        await router.dispatch('{"type":"rate_limits.updated","rate_limits":[]}')
+        await router.dispatch('{"type":"response.done","response":{"id":"r"}}')
+        self.assertEqual(seen, [{"type": "response.done", "response": {"id": "r"}}])
+        self.assertEqual(router.stats.skipped, 1)
+        self.assertEqual(router.stats.parsed, 1)
+
+    async def test_audio_delta_is_sliced(self) -> None:
+        deltas: list[dict] = []
+        router = EventRouter()
+        router.subscribe(deltas.append, "response.audio.delta", fields=("delta",))
+        await router.dispatch(audio_delta("UklGRg=="))
+        self.assertEqual(deltas, [{"type": "response.audio.delta", "delta": "UklGRg=="}])
+        self.assertEqual(router.stats.parsed, 0)
+        self.assertEqual(router.stats.sliced, 1)
+
+    async def test_order_prefix_and_fallback(self) -> None:
+        calls: list[tuple[str, dict]] = []
+
+        async def first(event: dict) -> None:
+            calls.append(("first", event))
+
+        router = EventRouter()
+        router.subscribe(first, "response.audio.delta", fields=("delta",))
+        router.subscribe(lambda event: calls.append(("second", event)), "conversation.item.*", "response.*")
+        router.subscribe(lambda event: calls.append(("all", event)))
+
+        await router.dispatch('{"type":"response.audio.delta","delta":"a\\/b"}')
+        self.assertEqual([name for name, _ in calls], ["first", "second", "all"])
+        self.assertEqual(calls[0][1]["delta"], "a/b")
+        self.assertIs(calls[1][1], calls[2][1])
+
+        calls.clear()
+        await router.dispatch('{"type":"conversation.item.created","item":{"role":"user"}}')
+        self.assertEqual([name for name, _ in calls], ["second", "all"])
+
+    async def test_invalid_messages_are_skipped(self) -> None:
+        router = EventRouter()
+        router.subscribe(lambda event: None)
+        await router.dispatch("{broken")
+        await router.dispatch(b'{"type":"response.done"}')
+        self.assertEqual(router.stats.invalid, 1)
+        self.assertEqual(router.stats.parsed, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
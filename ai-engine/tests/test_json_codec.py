@@ -0,0 +1,50 @@
+import json
+import unittest
+
+from scenario.audio_frames import ClientAudioWire
+from scenario.json_codec import JsonCodec, build_json_codec, orjson
+
+EVENTS = [
+    {"type": "audio.done"},
+    {"type": "audio.delta", "delta": "AAAA/+=="},
+    {"type": "audio.delta", "delta": "AAAA", "sample_rate": 16000},
+    {"type": "input_audio_buffer.append", "audio": "UklGRg=="},
+    {"type": "response.audio.delta", "delta": 'a"b'},
+    {"type": "audio.delta", "sample_rate": 16000, "delta": "AAAA"},
+    {"type": "audio.delta", "delta": "AAAA", "sample_rate": 16000.0},
+    {"type": "transcript.done", "transcript": "안녕, \"Malang\"\n"},
+]
+
+
+class JsonCodecTests(unittest.TestCase):
+    def assert_codec(self, codec: JsonCodec) -> None:
+        for event in EVENTS:
+            text = codec.dumps_event(event)
+            self.assertEqual(text, json.dumps(event, separators=(",", ":"), ensure_ascii=False))
+            self.assertEqual(codec.loads(text), event)
+        # Cached template is reused.
+        self.assertIs(codec.dumps_event({"type": "audio.done"}), codec.dumps_event({"type": "audio.done"}))
+        with self.assertRaises(json.JSONDecodeError):
+            codec.loads("{broken")
+
+    def test_stdlib(self) -> None:
+        self.assert_codec(build_json_codec("stdlib"))
+
+    @unittest.skipIf(orjson is None, "orjson not installed")
+    def test_orjson(self) -> None:
+        codec = build_json_codec("orjson")
+        self.assertEqual(codec.name, "orjson")
+        self.assert_codec(codec)
+
+    def test_unknown_falls_back_to_stdlib(self) -> None:
+        with self.assertLogs("scenario.json_codec", "WARNING"):
+            self.assertEqual(build_json_codec("simdjson").name, "stdlib")
+
+    def test_wire_uses_codec(self) -> None:
+        wire = ClientAudioWire(json_codec=JsonCodec())
+        text = wire.encode({"type": "audio.delta", "delta": b"\x00\x00"})
+        self.assertEqual(text, '{"type":"audio.delta","delta":"AAA="}')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import asyncio
+import unittest
+
+from realtime_conversation.conversation_tracker import ConversationTracker
+from realtime_conversation.message_checkpoint import MessageCheckpointer
+
+
+class MessageCheckpointerTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.tracker = ConversationTracker(session_id="s1", start_seq=5)
+        self.saved: dict[tuple[str, int], str] = {}
+        self.fail_next = False
+
+    async def writer(self, session_id: str, messages: list[dict]) -> None:
+        # (session_id, connection_id, seq) upsert; the fake store is single-connection
+        for message in messages:
+            self.saved.setdefault((session_id, message["seq"]), message["content"])
+        if self.fail_next:
+            # Rows written but the commit acknowledgement is lost: the batch is retried.
+            self.fail_next = False
+            raise ConnectionError("lost")
+
+    async def test_seq_continues_from_start(self) -> None:
+        self.tracker.add_transcript("user", "hello")
+        self.tracker.add_transcript("assistant", "hi")
+        self.assertEqual([m["seq"] for m in self.tracker.messages], [5, 6])
+
+    async def test_trackers_on_one_session_have_distinct_connection_ids(self) -> None:
+        other = ConversationTracker(session_id="s1", start_seq=5)
+        self.tracker.add_transcript("user", "old")
+        other.add_transcript("user", "new")
+        old_key, new_key = (
+            (m["connection_id"], m["seq"]) for m in (self.tracker.messages[0], other.messages[0])
+        )
+        self.assertEqual(old_key[1], new_key[1])
+        self.assertNotEqual(old_key, new_key)
+
+    async def test_flush_every_n_messages_and_final_delta(self) -> None:
+        checkpointer = MessageCheckpointer(self.tracker, self.writer, every_messages=2, interval_sec=0)
+        for text in ("one", "two", "three"):
+            self.tracker.add_transcript("user", text)
+            checkpointer.notify()
+            await asyncio.sleep(0)
+        await checkpointer.close()
+
+        self.assertEqual(sorted(self.saved), [("s1", 5), ("s1", 6)])
+        report = self.tracker.finalize()
+        self.assertEqual(report["checkpointed_messages"], 2)
+        self.assertEqual([m["content"] for m in report["messages"][report["checkpointed_messages"]:]], ["three"])
+
+    async def test_failed_batch_is_retried_without_duplicates(self) -> None:
+        checkpointer = MessageCheckpointer(self.tracker, self.writer, every_messages=10, interval_sec=0)
+        self.tracker.add_transcript("user", "one")
+        self.fail_next = True
+        with self.assertLogs("realtime_conversation.message_checkpoint", "WARNING"):
+            self.assertEqual(await checkpointer.flush(), 0)
+        self.tracker.add_transcript("user", "two")
+        self.assertEqual(await checkpointer.flush(), 2)
+        self.assertEqual(await checkpointer.flush(), 0)
+
+        self.assertEqual(self.saved, {("s1", 5): "one", ("s1", 6): "two"})
+        self.assertEqual(checkpointer.snapshot(), {"checkpoints": 1, "messages_saved": 2, "pending": 0, "failures": 1})
+
+    async def test_periodic_flush(self) -> None:
+        checkpointer = MessageCheckpointer(self.tracker, self.writer, every_messages=10, interval_sec=0.01)
+        checkpointer.start()
+        self.tracker.add_transcript("user", "one")
+        await asyncio.sleep(0.05)
+        await checkpointer.close()
+        self.assertIn(("s1", 5), self.saved)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import asyncio
+import unittest
+
+from scenario.llm_client import OpenAIScenarioLLM
+from scenario.openai_clients import OpenAIClientRegistry
+
+
+class OpenAIClientRegistryTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.registry = OpenAIClientRegistry(max_concurrency=2)
+
+    async def asyncTearDown(self) -> None:
+        await self.registry.aclose()
+
+    async def test_client_reused_per_key(self) -> None:
+        first = self.registry.client("sk-a")
+        self.assertIs(self.registry.client("sk-a"), first)
+        self.assertIsNot(self.registry.client("sk-b"), first)
+        self.assertIsNot(self.registry.client("sk-a", "http://127.0.0.1:1/v1"), first)
+        self.assertEqual(self.registry.snapshot()["clients"], 3)
+
+    async def test_llm_shares_registry_client(self) -> None:
+        llm_a = OpenAIScenarioLLM(api_key="sk-a", model="m", clients=self.registry)
+        llm_b = OpenAIScenarioLLM(api_key="sk-a", model="m", clients=self.registry)
+        self.assertIs(llm_a._client, llm_b._client)
+
+    async def test_slot_limits_concurrency_and_counts_saturation(self) -> None:
+        release = asyncio.Event()
+
+        async def request() -> None:
+            async with self.registry.slot():
+                await release.wait()
+
+        tasks = [asyncio.create_task(request()) for _ in range(5)]
+        await asyncio.sleep(0.01)
+        self.assertEqual(self.registry.metrics.in_flight, 2)
+        release.set()
+        await asyncio.gather(*tasks)
+
+        snapshot = self.registry.snapshot()
+        self.assertEqual(snapshot["requests"], 5)
+        self.assertEqual(snapshot["saturated"], 3)
+        self.assertEqual(snapshot["max_in_flight"], 2)
+        self.assertEqual(snapshot["in_flight"], 0)
+        self.assertEqual(snapshot["saturation_ratio"], 0.6)
+
+    async def test_slot_counts_errors_and_releases(self) -> None:
+        with self.assertRaises(ValueError):
+            async with self.registry.slot():
+                raise ValueError("boom")
+        self.assertEqual(self.registry.metrics.errors, 1)
+        self.assertEqual(self.registry.metrics.in_flight, 0)
+        async with self.registry.slot():
+            pass
+        self.assertEqual(self.registry.snapshot()["saturated"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
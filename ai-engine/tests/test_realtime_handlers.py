@@ -0,0 +1,124 @@
+import asyncio
+import unittest
+
+from scenario.realtime_handlers import (
+    ON_ERROR_DISABLE,
+    ON_ERROR_RAISE,
+    ConcurrentFanout,
+    HandlerFailedError,
+    fanout_event_handler,
+)
+
+
+class ConcurrentFanoutTests(unittest.IsolatedAsyncioTestCase):
+    async def test_slow_handler_does_not_block_others(self) -> None:
+        release = asyncio.Event()
+        fast: list[int] = []
+        slow: list[int] = []
+
+        async def slow_handler(event: dict) -> None:
+            await release.wait()
+            slow.append(event["n"])
+
+        fanout = fanout_event_handler([slow_handler, lambda event: fast.append(event["n"])])
+        for n in range(5):
+            await fanout({"type": "x", "n": n})
+        await asyncio.sleep(0)
+        self.assertEqual(fast, [0, 1, 2, 3, 4])
+        self.assertEqual(slow, [])
+
+        release.set()
+        await fanout.join()
+        self.assertEqual(slow, [0, 1, 2, 3, 4])
+        stats = fanout.snapshot()["ConcurrentFanoutTests.test_slow_handler_does_not_block_others.<locals>.slow_handler"]
+        self.assertEqual(stats["handled"], 5)
+        self.assertGreater(stats["lag_ms_max"], 0.0)
+        await fanout.close()
+
+    async def test_synchronous_handler_runs_inline(self) -> None:
+        seen: list[str] = []
+        fanout = ConcurrentFanout()
+        handler = fanout.add(lambda event: seen.append(event["type"]), name="ready", synchronous=True)
+        await handler({"type": "session.updated"})
+        self.assertEqual(seen, ["session.updated"])
+        self.assertEqual(fanout.snapshot()["ready"]["depth"], 0)
+
+    async def test_full_queue_applies_backpressure(self) -> None:
+        release = asyncio.Event()
+
+        async def blocked(event: dict) -> None:
+            await release.wait()
+
+        fanout = ConcurrentFanout(max_queue=2)
+        handler = fanout.add(blocked, name="blocked")
+        for n in range(3):
+            await handler({"type": "x"})
+        pending = asyncio.create_task(handler({"type": "x"}))
+        await asyncio.sleep(0.01)
+        self.assertFalse(pending.done())
+        release.set()
+        await pending
+        await fanout.join()
+        stats = fanout.snapshot()["blocked"]
+        self.assertEqual(stats["handled"], 4)
+        self.assertEqual(stats["blocked"], 2)
+        await fanout.close()
+
+    async def test_failure_is_isolated(self) -> None:
+        seen: list[int] = []
+
+        def flaky(event: dict) -> None:
+            if event["n"] == 1:
+                raise RuntimeError("boom")
+
+        fanout = ConcurrentFanout()
+        continuing = fanout.add(flaky, name="continue")
+        disabled = fanout.add(flaky, name="disable", on_error=ON_ERROR_DISABLE)
+        healthy = fanout.add(lambda event: seen.append(event["n"]), name="healthy")
+        with self.assertLogs("scenario.realtime_handlers", "ERROR"):
+            for n in range(3):
+                event = {"type": "x", "n": n}
+                for handler in (continuing, disabled, healthy):
+                    await handler(event)
+                await fanout.join()
+        stats = fanout.snapshot()
+        self.assertEqual(seen, [0, 1, 2])
+        self.assertEqual((stats["continue"]["handled"], stats["continue"]["failures"]), (2, 1))
+        self.assertEqual((stats["disable"]["handled"], stats["disable"]["skipped"]), (1, 1))
+        self.assertTrue(stats["disable"]["disabled"])
+        await fanout.close()
+
+    async def test_error_handler_receives_failures(self) -> None:
+        reported: list[str] = []
+
+        def failing(event: dict) -> None:
+            raise RuntimeError(event["n"])
+
+        async def report(exc: Exception) -> None:
+            reported.append(str(exc))
+
+        fanout = ConcurrentFanout()
+        handler = fanout.add(failing, name="pipeline", error_handler=report)
+        with self.assertLogs("scenario.realtime_handlers", "ERROR"):
+            for n in ("a", "b"):
+                await handler({"type": "x", "n": n})
+            await fanout.join()
+        self.assertEqual(reported, ["a", "b"])
+        await fanout.close()
+
+    async def test_raise_policy_ends_the_stream(self) -> None:
+        def failing(event: dict) -> None:
+            raise RuntimeError("boom")
+
+        fanout = ConcurrentFanout()
+        handler = fanout.add(failing, name="strict", on_error=ON_ERROR_RAISE)
+        await handler({"type": "x"})
+        await fanout.join()
+        with self.assertRaises(HandlerFailedError) as raised:
+            await handler({"type": "x"})
+        self.assertIsInstance(raised.exception.__cause__, RuntimeError)
+        await fanout.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
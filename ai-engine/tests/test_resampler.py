@@ -0,0 +1,50 @@
+import unittest
+
+import numpy as np
+
+from scenario.resampler import StreamingResampler
+
+
+def _tone(rate: int, freq: float, seconds: float = 1.0) -> bytes:
+    t = np.arange(int(rate * seconds)) / rate
+    return (8000 * np.sin(2 * np.pi * freq * t)).astype("<i2").tobytes()
+
+
+def _level_db(pcm: bytes) -> float:
+    samples = np.frombuffer(pcm, dtype="<i2").astype(np.float64)[2000:-2000]
+    return 20 * np.log10(samples.std() * np.sqrt(2) / 8000 + 1e-12)
+
+
+class StreamingResamplerTests(unittest.TestCase):
+    def test_output_length_and_passband(self) -> None:
+        for rate in (16000, 44100, 48000):
+            out = StreamingResampler(rate).process(_tone(rate, 1000))
+            self.assertEqual(len(out), 24000 * 2, msg=f"rate={rate}")
+            self.assertAlmostEqual(_level_db(out), 0.0, delta=0.2)
+
+    def test_chunked_matches_one_shot(self) -> None:
+        for rate in (16000, 44100, 48000):
+            pcm = _tone(rate, 440)
+            whole = StreamingResampler(rate).process(pcm)
+            resampler = StreamingResampler(rate)
+            sizes = [882, 7, 320, 1, 2048]
+            parts, offset, index = [], 0, 0
+            while offset < len(pcm):
+                size = sizes[index % len(sizes)]
+                parts.append(resampler.process(pcm[offset : offset + size]))
+                offset += size
+                index += 1
+            self.assertEqual(b"".join(parts), whole, msg=f"rate={rate}")
+
+    def test_rejects_aliasing_tones(self) -> None:
+        for rate in (44100, 48000):
+            out = StreamingResampler(rate).process(_tone(rate, 15000))
+            self.assertLess(_level_db(out), -60.0, msg=f"rate={rate}")
+
+    def test_native_rate_passes_through(self) -> None:
+        pcm = _tone(24000, 1000, 0.1)
+        self.assertEqual(StreamingResampler(24000).process(pcm), pcm)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,38 +1,79 @@
+import asyncio
 import unittest
 from typing import Optional
 
 from scenario.fallbacks import build_realtime_error_handler
 from scenario.prompts import KOREAN_FALLBACK_MESSAGE
+from scenario.realtime_pipeline import RealtimeScenarioPipeline
 from scenario.scenario_builder import ScenarioBuilder
 from scenario.scenario_state import ScenarioState
 
 
-class ScenarioBuilderTests(unittest.TestCase):
-    def test_finalize_when_complete(self) -> None:
+class ScenarioBuilderTests(unittest.IsolatedAsyncioTestCase):
+    async def test_finalize_when_complete(self) -> None:
         state = ScenarioState(place="cafe", partner="barista", goal="order coffee")
         builder = ScenarioBuilder(state=state)
-        response = builder.finalize_scenario()
+        response = await builder.finalize_scenario()
         self.assertIn("cafe", response)
         self.assertIn("barista", response)
 
-    def test_followup_when_missing(self) -> None:
+    async def test_followup_when_missing(self) -> None:
         def extractor(_: str) -> dict[str, Optional[str]]:
             return {"place": "cafe", "partner": None, "goal": None}
 
         builder = ScenarioBuilder(extractor=extractor)
-        builder.ingest_user_text("I am at a cafe")
-        question = builder.build_follow_up_question()
+        await builder.ingest_user_text("I am at a cafe")
+        question = await builder.build_follow_up_question()
         self.assertIsNotNone(question)
         self.assertIn("Who", question)
 
-    def test_finalize_after_max_attempts(self) -> None:
+    async def test_finalize_after_max_attempts(self) -> None:
         builder = ScenarioBuilder(max_attempts=3)
         for _ in range(3):
-            self.assertIsNotNone(builder.build_follow_up_question())
-        self.assertIsNone(builder.build_follow_up_question())
-        response = builder.finalize_scenario()
+            self.assertIsNotNone(await builder.build_follow_up_question())
+        self.assertIsNone(await builder.build_follow_up_question())
+        response = await builder.finalize_scenario()
         self.assertIn("Great.", response)
 
+    async def test_async_extractor_and_generator(self) -> None:
+        async def extractor(_: str) -> dict[str, Optional[str]]:
+            return {"place": "airport", "partner": None, "goal": None}
+
+        async def question_generator(_: ScenarioState, missing: list[str]) -> str:
+            return f"Who is the {missing[0]}?"
+
+        builder = ScenarioBuilder(extractor=extractor, question_generator=question_generator)
+        await builder.ingest_user_text("I am at the airport")
+        self.assertEqual(builder.state.place, "airport")
+        self.assertEqual(await builder.build_follow_up_question(), "Who is the partner?")
+
+
+class RealtimePipelineTests(unittest.IsolatedAsyncioTestCase):
+    async def test_slow_extraction_does_not_block_other_sessions(self) -> None:
+        release = asyncio.Event()
+
+        async def slow_extractor(_: str) -> dict[str, Optional[str]]:
+            await release.wait()
+            return {"place": "cafe", "partner": None, "goal": None}
+
+        def fast_extractor(_: str) -> dict[str, Optional[str]]:
+            return {"place": "hotel", "partner": None, "goal": None}
+
+        slow_sent: list[str] = []
+        fast_sent: list[str] = []
+        slow = RealtimeScenarioPipeline(ScenarioBuilder(extractor=slow_extractor), slow_sent.append)
+        fast = RealtimeScenarioPipeline(ScenarioBuilder(extractor=fast_extractor), fast_sent.append)
+        event = {"type": "conversation.item.input_audio_transcription.completed", "transcript": "hello"}
+
+        slow_task = asyncio.create_task(slow.handle_event(event))
+        await asyncio.wait_for(fast.handle_event(event), timeout=1.0)
+        self.assertEqual(len(fast_sent), 1)
+        self.assertEqual(slow_sent, [])
+
+        release.set()
+        await asyncio.wait_for(slow_task, timeout=1.0)
+        self.assertEqual(len(slow_sent), 1)
+
 
 class RealtimeFallbackTests(unittest.IsolatedAsyncioTestCase):
     async def test_realtime_error_fallback(self) -> None:
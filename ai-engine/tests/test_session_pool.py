@@ -0,0 +1,119 @@
+import asyncio
+import json
+import unittest
+
+import websockets
+
+from scenario.realtime_session import RealtimeConfig
+from scenario.session_pool import RealtimeSessionPool
+
+
+async def _fake_realtime(ws) -> None:
+    async for message in ws:
+        event = json.loads(message)
+        if event.get("type") == "session.update":
+            await ws.send(json.dumps({"type": "session.updated"}))
+        elif event.get("type") == "input_audio_buffer.clear":
+            await ws.send(json.dumps({"type": "input_audio_buffer.cleared"}))
+
+
+class RealtimeSessionPoolTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.server = await websockets.serve(_fake_realtime, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        self.config = RealtimeConfig(api_key="test", base_url=f"http://127.0.0.1:{port}")
+
+    async def asyncTearDown(self) -> None:
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _wait_idle(self, pool: RealtimeSessionPool, count: int) -> None:
+        for _ in range(200):
+            if pool.idle_count >= count:
+                return
+            await asyncio.sleep(0.01)
+        self.fail("pool did not warm up")
+
+    async def test_acquire_hit_returns_ready_client(self) -> None:
+        pool = RealtimeSessionPool(self.config, {"input_audio_format": "pcm16"}, target_size=1)
+        await pool.start()
+        try:
+            await self._wait_idle(pool, 1)
+            pooled = await pool.acquire()
+            self.assertIsNotNone(pooled)
+            self.assertTrue(pooled.is_alive())
+            self.assertEqual(pool.metrics.hits, 1)
+            await self._wait_idle(pool, 1)
+            await pooled.client.close()
+        finally:
+            await pool.close()
+
+    async def test_expired_entries_are_evicted(self) -> None:
+        pool = RealtimeSessionPool(self.config, {"input_audio_format": "pcm16"}, target_size=1, ttl_sec=0.0)
+        await pool.start()
+        try:
+            await self._wait_idle(pool, 1)
+            self.assertIsNone(await pool.acquire())
+            snapshot = pool.metrics.snapshot()
+            self.assertEqual(snapshot["misses"], 1)
+            self.assertGreaterEqual(snapshot["evictions"], 1)
+        finally:
+            await pool.close()
+
+    async def test_warm_up_failures_back_off(self) -> None:
+        pool = RealtimeSessionPool(
+            self.config,
+            {"input_audio_format": "pcm16"},
+            target_size=1,
+            maintain_interval=0.01,
+            backoff_base_sec=0.05,
+            backoff_max_sec=1.0,
+        )
+        attempts = []
+        failing = True
+        create_session_async = pool._manager.create_session_async
+
+        async def flaky_create_session():
+            attempts.append(asyncio.get_running_loop().time())
+            if failing:
+                raise RuntimeError("invalid api key")
+            return await create_session_async()
+
+        pool._manager.create_session_async = flaky_create_session
+        with self.assertLogs("scenario.session_pool", "WARNING"):
+            await pool.start()
+            await asyncio.sleep(0.3)
+        try:
+            # 0.05 + 0.1 + 0.2 s apart instead of one attempt per 10 ms maintenance tick
+            self.assertLessEqual(len(attempts), 4)
+            gaps = [later - earlier for earlier, later in zip(attempts, attempts[1:])]
+            self.assertTrue(all(later > earlier for earlier, later in zip(gaps, gaps[1:])))
+            self.assertEqual(pool.metrics.consecutive_failures, len(attempts))
+
+            failing = False
+            await self._wait_idle(pool, 1)
+            self.assertEqual(pool.metrics.snapshot()["consecutive_failures"], 0)
+        finally:
+            await pool.close()
+
+    async def test_warm_ups_use_the_given_client_registry(self) -> None:
+        class Registry:
+            def __init__(self) -> None:
+                self.api_keys = []
+
+            def client(self, api_key: str) -> object:
+                self.api_keys.append(api_key)
+                return object()
+
+        registry = Registry()
+        pool = RealtimeSessionPool(self.config, {"input_audio_format": "pcm16"}, target_size=1, clients=registry)
+        await pool.start()
+        try:
+            await self._wait_idle(pool, 1)
+            self.assertEqual(registry.api_keys, ["test"])
+        finally:
+            await pool.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import asyncio
+import unittest
+
+from scenario.audio_relay import RealtimeAudioRelay
+from scenario.transcript_coalescer import TranscriptDeltaCoalescer
+
+
+class TranscriptDeltaCoalescerTests(unittest.IsolatedAsyncioTestCase):
+    async def test_window_merges_deltas(self) -> None:
+        sent: list[str] = []
+        coalescer = TranscriptDeltaCoalescer(sent.append, window_ms=20, max_chars=100)
+        for token in ("Hel", "lo", ", ", "there"):
+            await coalescer.add(token)
+        self.assertEqual(sent, [])
+        await asyncio.sleep(0.05)
+        self.assertEqual(sent, ["Hello, there"])
+
+    async def test_max_chars_flushes_early(self) -> None:
+        sent: list[str] = []
+        coalescer = TranscriptDeltaCoalescer(sent.append, window_ms=1000, max_chars=5)
+        await coalescer.add("abc")
+        await coalescer.add("def")
+        await coalescer.add("g")
+        self.assertEqual(sent, ["abcdef"])
+        stats = await coalescer.end_response()
+        self.assertEqual(sent, ["abcdef", "g"])
+        self.assertEqual((stats["deltas_in"], stats["events_out"]), (3, 2))
+        self.assertEqual(coalescer.snapshot()["responses"], 1)
+
+    async def test_zero_window_forwards_each_delta(self) -> None:
+        sent: list[str] = []
+        coalescer = TranscriptDeltaCoalescer(sent.append, window_ms=0)
+        await coalescer.add("a")
+        await coalescer.add("b")
+        self.assertEqual(sent, ["a", "b"])
+
+    async def test_relay_flushes_before_done(self) -> None:
+        events: list[tuple[str, bool]] = []
+
+        async def on_transcript(text: str, is_final: bool) -> None:
+            events.append((text, is_final))
+
+        coalescer = TranscriptDeltaCoalescer(lambda text: on_transcript(text, False), window_ms=1000)
+        relay = RealtimeAudioRelay(on_transcript=on_transcript, transcript_coalescer=coalescer)
+        for token in ("Good", " morning"):
+            await relay.handle_event({"type": "response.audio_transcript.delta", "transcript_delta": token})
+        await relay.handle_event({"type": "response.audio_transcript.done", "transcript": "Good morning"})
+        self.assertEqual(events, [("Good morning", False), ("Good morning", True)])
+
+        await relay.handle_event({"type": "response.audio_transcript.delta", "transcript_delta": "Bye"})
+        await relay.handle_event({"type": "response.done"})
+        self.assertEqual(events[-1], ("Bye", False))
+        self.assertIsNone(coalescer._timer)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import asyncio
+import struct
+import unittest
+from types import SimpleNamespace
+
+from scenario.openai_clients import OpenAIClientRegistry
+from scenario.tts_stream import OpenAITTSProvider, WavStreamParser, stream_tts_pcm16
+
+
+def _wav_header(sample_rate: int, data_size: int, *, extra_chunk: bytes = b"") -> bytes:
+    fmt = struct.pack("<HHIIHH", 1, 1, sample_rate, sample_rate * 2, 2, 16)
+    body = b"WAVE" + b"fmt " + struct.pack("<I", len(fmt)) + fmt + extra_chunk
+    body += b"data" + struct.pack("<I", data_size)
+    return b"RIFF" + struct.pack("<I", 0xFFFFFFFF) + body
+
+
+class FakeProvider:
+    def __init__(self, chunks: list[bytes]) -> None:
+        self.chunks = chunks
+
+    async def stream(self, text: str):
+        for chunk in self.chunks:
+            yield chunk
+
+
+class WavStreamParserTests(unittest.TestCase):
+    def test_header_split_at_every_offset(self) -> None:
+        pcm = bytes(range(200))
+        wav = _wav_header(16000, len(pcm), extra_chunk=b"LIST" + struct.pack("<I", 3) + b"abc\x00") + pcm
+        for split in range(1, len(wav)):
+            parser = WavStreamParser()
+            out = parser.feed(wav[:split]) + parser.feed(wav[split:])
+            self.assertEqual(out, pcm, msg=f"split={split}")
+            self.assertEqual(parser.sample_rate, 16000)
+
+    def test_streaming_placeholder_size_runs_to_end(self) -> None:
+        parser = WavStreamParser()
+        out = parser.feed(_wav_header(24000, 0xFFFFFFFF) + b"\x01\x02")
+        out += parser.feed(b"\x03\x04\x05")
+        out += parser.feed(b"\x06")
+        self.assertEqual(out, b"\x01\x02\x03\x04\x05\x06")
+
+    def test_headerless_pcm_uses_default_rate(self) -> None:
+        parser = WavStreamParser(default_sample_rate=24000)
+        self.assertEqual(parser.feed(b"\x00\x01\x02"), b"\x00\x01")
+        self.assertEqual(parser.feed(b"\x03"), b"\x02\x03")
+        self.assertEqual(parser.sample_rate, 24000)
+
+
+class StreamTTSTests(unittest.IsolatedAsyncioTestCase):
+    async def test_yields_pcm_as_chunks_arrive(self) -> None:
+        header = _wav_header(22050, 0)
+        provider = FakeProvider([header[:10], header[10:] + b"\x01\x02", b"\x03\x04"])
+        chunks = [item async for item in stream_tts_pcm16(provider, "hi")]
+        self.assertEqual(chunks, [(b"\x01\x02", 22050), (b"\x03\x04", 22050)])
+
+    async def test_registry_slot_released_before_body_streams(self) -> None:
+        registry = OpenAIClientRegistry(max_concurrency=1)
+        body_started = asyncio.Event()
+        release_body = asyncio.Event()
+
+        class FakeResponse:
+            async def iter_bytes(self, chunk_size: int):
+                body_started.set()
+                await release_body.wait()
+                yield b"\x01\x02"
+
+        class FakeStreamingCreate:
+            async def __aenter__(self):
+                return FakeResponse()
+
+            async def __aexit__(self, *exc) -> None:
+                return None
+
+        client = SimpleNamespace(
+            audio=SimpleNamespace(
+                speech=SimpleNamespace(
+                    with_streaming_response=SimpleNamespace(create=lambda **kwargs: FakeStreamingCreate())
+                )
+            )
+        )
+        provider = OpenAITTSProvider(client, clients=registry)
+
+        async def consume() -> list[bytes]:
+            return [chunk async for chunk in provider.stream("hi")]
+
+        task = asyncio.create_task(consume())
+        await body_started.wait()
+        # Playback is still streaming, but another request gets the only slot right away.
+        async def other_request() -> None:
+            async with registry.slot():
+                pass
+
+        await asyncio.wait_for(other_request(), timeout=1.0)
+        self.assertEqual(registry.metrics.saturated, 0)
+        release_body.set()
+        self.assertEqual(await task, [b"\x01\x02"])
+        await registry.aclose()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,7 +14,7 @@ from app.services.user_service import UserService
 from app.services.auth_service import AuthService
 from app.services.chat_service import ChatService
 
-from app.db.database import get_db
+from app.db.database import AsyncSessionLocal, get_db
 
 # Repository Dependencies
 def get_user_repository(db: AsyncSession = Depends(get_db)) -> UserRepository:
@@ -33,6 +33,14 @@ def get_auth_service(repo: UserRepository = Depends(get_user_repository)) -> Aut
 def get_chat_service(repo: ChatRepository = Depends(get_chat_repository)) -> ChatService:
     return ChatService(repo)
 
+def get_chat_service_ws() -> ChatService:
+    """
+    WebSocket(실시간 대화)용 ChatService
+    요청 스코프 세션(get_db)에 의존하지 않으므로 연결 내내 DB 커넥션을 잡고 있지 않습니다.
+    DB 작업은 ChatService 내부에서 필요한 순간에만 짧은 작업 단위로 수행합니다.
+    """
+    return ChatService()
+
 # OAuth2 스킴 정의 (Token URL은 /api/v1/auth/login)
 reusable_oauth2 = OAuth2PasswordBearer(
     tokenUrl=f"{settings.API_V1_STR}/auth/login"
@@ -75,11 +83,10 @@ async def get_current_user(
 async def get_current_user_ws(
     websocket: WebSocket,
     token: Optional[str] = Query(None, description="JWT Access Token"),
-    auth_service: AuthService = Depends(get_auth_service),
-    user_service: UserService = Depends(get_user_service)
 ) -> models.User:
     """
     WebSocket 연결 전용 인증 의존성
+    (get_db 대신 짧은 DB 작업 단위로 유저를 조회하고 바로 커넥션을 반납 - 연결 수명 동안 점유하지 않음)
     우선순위:
     1. Header: Authorization (Bearer <token>)
     2. Header: Sec-WebSocket-Protocol (token, ...)
@@ -112,7 +119,9 @@ async def get_current_user_ws(
         raise WebSocketException(code=1008, reason="Missing authentication token")
 
     # 공통 인증 로직 사용
-    user = await _authenticate_user(token_str, auth_service, user_service)
+    async with AsyncSessionLocal() as db:
+        repo = UserRepository(db)
+        user = await _authenticate_user(token_str, AuthService(repo), UserService(repo))
     
     if not user:
         raise WebSocketException(code=1008, reason="Invalid token or user not found")
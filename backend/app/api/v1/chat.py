@@ -1,5 +1,5 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, WebSocket, Query
+from fastapi import APIRouter, Depends, HTTPException, WebSocket, Query, Response
 
 from app.api import deps
 from app.db import models
@@ -35,15 +35,28 @@ async def sync_guest_session(
 
 @router.get("/sessions", response_model=List[SessionSummary], summary="사용자 대화 세션 목록 조회")
 async def get_user_sessions(
+    response: Response,
     skip: int = 0,
     limit: int = 20,
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값 (keyset 페이지네이션)"),
     current_user: models.User = Depends(deps.get_current_user),
     service: ChatService = Depends(deps.get_chat_service),
 ):
     """
     사용자의 대화 세션 목록을 조회합니다. (메시지 내용 미포함, 개수만 포함)
+
+    [페이지네이션]
+    - 다음 페이지가 있으면 `X-Next-Cursor` 응답 헤더로 커서를 반환합니다.
+    - 다음 요청에 `cursor`로 넘기면 페이지 깊이와 관계없이 일정한 속도로 조회됩니다.
+    - 기존 `skip`(OFFSET) 방식도 계속 지원합니다.
     """
-    return await service.get_user_sessions(current_user.id, skip, limit)
+    try:
+        summaries, next_cursor = await service.get_user_sessions(current_user.id, skip, limit, cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return summaries
 
 @router.get("/sessions/{session_id}", response_model=SessionResponse, summary="대화 세션 상세 조회")
 async def get_session_detail(
@@ -83,12 +96,20 @@ async def websocket_chat(
     user: models.User = Depends(deps.get_current_user_ws),
     voice: Optional[str] = Query(None),
     show_text: Optional[bool] = Query(None),
-    chat_service: ChatService = Depends(deps.get_chat_service),
+    audio_transport: Optional[str] = Query(None, pattern="^(json|binary)$"),
+    vad_gate: Optional[bool] = Query(None),
+    audio_codec: Optional[str] = Query(None, pattern="^(pcm16|mulaw|adpcm)$"),
+    adaptive_audio: Optional[bool] = Query(None),
+    chat_service: ChatService = Depends(deps.get_chat_service_ws),
 ):
     """
     실시간 대화 WebSocket 엔드포인트 (회원용)
     - token: 쿼리 파라미터 or 헤더로 전달 (Strict Auth)
     - session_id: Path Parameter
+    - audio_transport: "binary"면 오디오를 바이너리 프레임(헤더 + PCM16)으로 송수신, 기본 "json"
+    - vad_gate: true면 서버 VAD 게이트로 긴 무음 구간을 OpenAI로 보내지 않음
+    - audio_codec: 클라이언트 구간 오디오 코덱 ("pcm16" 기본, "mulaw", "adpcm"), OpenAI 구간은 항상 PCM16
+    - adaptive_audio: true면 RTT(ping/pong)와 송신 큐 상태에 따라 출력 오디오를 24/16/8kHz로 조정
     """
     await websocket.accept()
     
@@ -99,7 +120,11 @@ async def websocket_chat(
         user_id=user.id, 
         session_id=session_id,
         voice=voice,
-        show_text=show_text
+        show_text=show_text,
+        audio_transport=audio_transport,
+        vad_gate=bool(vad_gate),
+        audio_codec=audio_codec,
+        adaptive_audio=bool(adaptive_audio)
     )
 
 @router.websocket("/ws/guest-chat/{session_id}")
@@ -108,12 +133,20 @@ async def websocket_guest_chat(
     session_id: str,
     voice: Optional[str] = Query(None),
     show_text: Optional[bool] = Query(None),
-    chat_service: ChatService = Depends(deps.get_chat_service),
+    audio_transport: Optional[str] = Query(None, pattern="^(json|binary)$"),
+    vad_gate: Optional[bool] = Query(None),
+    audio_codec: Optional[str] = Query(None, pattern="^(pcm16|mulaw|adpcm)$"),
+    adaptive_audio: Optional[bool] = Query(None),
+    chat_service: ChatService = Depends(deps.get_chat_service_ws),
 ):
     """
     실시간 대화 WebSocket 엔드포인트 (게스트용)
     - 인증 없음
     - session_id: Path Parameter
+    - audio_transport: "binary"면 오디오를 바이너리 프레임(헤더 + PCM16)으로 송수신, 기본 "json"
+    - vad_gate: true면 서버 VAD 게이트로 긴 무음 구간을 OpenAI로 보내지 않음
+    - audio_codec: 클라이언트 구간 오디오 코덱 ("pcm16" 기본, "mulaw", "adpcm"), OpenAI 구간은 항상 PCM16
+    - adaptive_audio: true면 RTT(ping/pong)와 송신 큐 상태에 따라 출력 오디오를 24/16/8kHz로 조정
     """
     await websocket.accept()
     
@@ -123,7 +156,11 @@ async def websocket_guest_chat(
         user_id=None, 
         session_id=session_id,
         voice=voice,
-        show_text=show_text
+        show_text=show_text,
+        audio_transport=audio_transport,
+        vad_gate=bool(vad_gate),
+        audio_codec=audio_codec,
+        adaptive_audio=bool(adaptive_audio)
     )
 
 @router.get("/hints/{session_id}", response_model=HintResponse, summary="대화 힌트 생성")
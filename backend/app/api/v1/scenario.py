@@ -3,8 +3,9 @@ from __future__ import annotations
 import json
 import sys
 from pathlib import Path
+from typing import Optional, Union
 
-from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, Depends, Query, WebSocket, WebSocketDisconnect
 from app.api import deps
 from app.db import models
 from websockets.exceptions import ConnectionClosedOK
@@ -29,28 +30,51 @@ class FastAPIWebSocketAdapter:
             return None
         return (client.host, client.port)
 
-    async def send(self, data: str) -> None:
-        await self.websocket.send_text(data)
+    async def send(self, data: Union[str, bytes]) -> None:
+        if isinstance(data, bytes):
+            await self.websocket.send_bytes(data)
+        else:
+            await self.websocket.send_text(data)
 
     def __aiter__(self):
         return self
 
-    async def __anext__(self) -> str:
+    async def __anext__(self) -> Union[str, bytes]:
         try:
-            return await self.websocket.receive_text()
+            message = await self.websocket.receive()
         except WebSocketDisconnect:
             raise StopAsyncIteration
+        if message["type"] == "websocket.disconnect":
+            raise StopAsyncIteration
+        if message.get("bytes") is not None:
+            return message["bytes"]
+        return message.get("text") or ""
 
 
 @router.websocket("/ws/scenario")
 async def websocket_scenario(
     websocket: WebSocket,
     user: models.User = Depends(deps.get_current_user_ws),
+    chunk_ms: Optional[int] = Query(None, ge=20, le=500),
+    burst_ms: Optional[int] = Query(None, ge=0, le=2000),
+    audio_transport: Optional[str] = Query(None, pattern="^(json|binary)$"),
+    vad_gate: Optional[bool] = Query(None),
+    audio_codec: Optional[str] = Query(None, pattern="^(pcm16|mulaw|adpcm)$"),
+    adaptive_audio: Optional[bool] = Query(None),
 ) -> None:
     await websocket.accept()
     adapter = FastAPIWebSocketAdapter(websocket)
     try:
-        await handle_client(adapter, user_id=user.id)
+        await handle_client(
+            adapter,
+            user_id=user.id,
+            chunk_ms=chunk_ms,
+            burst_ms=burst_ms,
+            audio_transport=audio_transport,
+            vad_gate=vad_gate,
+            audio_codec=audio_codec,
+            adaptive_audio=adaptive_audio,
+        )
     except (WebSocketDisconnect, ConnectionClosedOK):
         return
     except RuntimeError as exc:
@@ -59,11 +83,28 @@ async def websocket_scenario(
 
 
 @router.websocket("/ws/guest-scenario")
-async def websocket_guest_scenario(websocket: WebSocket) -> None:
+async def websocket_guest_scenario(
+    websocket: WebSocket,
+    chunk_ms: Optional[int] = Query(None, ge=20, le=500),
+    burst_ms: Optional[int] = Query(None, ge=0, le=2000),
+    audio_transport: Optional[str] = Query(None, pattern="^(json|binary)$"),
+    vad_gate: Optional[bool] = Query(None),
+    audio_codec: Optional[str] = Query(None, pattern="^(pcm16|mulaw|adpcm)$"),
+    adaptive_audio: Optional[bool] = Query(None),
+) -> None:
     await websocket.accept()
     adapter = FastAPIWebSocketAdapter(websocket)
     try:
-        await handle_client(adapter, user_id=None)
+        await handle_client(
+            adapter,
+            user_id=None,
+            chunk_ms=chunk_ms,
+            burst_ms=burst_ms,
+            audio_transport=audio_transport,
+            vad_gate=vad_gate,
+            audio_codec=audio_codec,
+            adaptive_audio=adaptive_audio,
+        )
     except (WebSocketDisconnect, ConnectionClosedOK):
         return
     except RuntimeError as exc:
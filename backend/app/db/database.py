@@ -1,6 +1,8 @@
+from sqlalchemy import func, inspect, select, text, update
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.db.models import Base, ChatMessage, ConversationSession
 
 engine = create_async_engine(
     settings.DATABASE_URL,
@@ -27,6 +29,62 @@ AsyncSessionLocal = sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
 
+def _upgrade_schema(conn) -> None:
+    """
+    create_all은 이미 있는 테이블에 새 컬럼/인덱스를 추가하지 않으므로 (마이그레이션 도구 없음)
+    모델에 추가된 컬럼과 인덱스를 기존 DB에 보충합니다.
+    - 추가되는 컬럼은 nullable이거나 server_default가 있어야 합니다.
+    """
+    inspector = inspect(conn)
+    added = set()
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            ddl = f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column.type.compile(dialect=conn.dialect)}"
+            if column.server_default is not None:
+                ddl += f" DEFAULT {column.server_default.arg}"
+            conn.execute(text(ddl))
+            added.add((table.name, column.name))
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+
+    sessions = ConversationSession.__tablename__
+    if (sessions, "message_count") in added or (sessions, "last_message_at") in added:
+        _backfill_session_counters(conn)
+
+def _backfill_session_counters(conn) -> None:
+    """
+    비정규화 컬럼(message_count, last_message_at)을 방금 추가한 경우, 같은 트랜잭션에서 기존 메시지로 채웁니다.
+    (기본값 0/NULL로 남으면 목록 API가 기존 세션의 메시지 수를 0으로 보여줌)
+    """
+    conn.execute(
+        update(ConversationSession)
+        .values(
+            message_count=(
+                select(func.count(ChatMessage.id))
+                .where(ChatMessage.session_id == ConversationSession.session_id)
+                .scalar_subquery()
+            ),
+            last_message_at=(
+                select(func.max(ChatMessage.timestamp))
+                .where(ChatMessage.session_id == ConversationSession.session_id)
+                .scalar_subquery()
+            ),
+            # 게스트 세션 만료 기준(updated_at)은 유지
+            updated_at=ConversationSession.updated_at,
+        )
+    )
+
+async def init_db() -> None:
+    """테이블 생성 + 기존 DB 스키마 보충 (앱 시작 시 호출)"""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_upgrade_schema)
+
 async def get_db():
     async with AsyncSessionLocal() as session:
         yield session
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Float, Integer, ForeignKey, Boolean, DateTime, Text
+from sqlalchemy import Column, String, Float, Integer, ForeignKey, Boolean, DateTime, Text, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import declarative_base, relationship
 
@@ -23,6 +23,10 @@ class User(Base):
 class ConversationSession(Base):
     """대화 세션 테이블"""
     __tablename__ = "conversation_sessions"
+    __table_args__ = (
+        # 세션 목록 keyset 페이지네이션 (user_id 범위 + ended_at DESC, session_id DESC 정렬을 인덱스 순서로 읽음)
+        Index("ix_conversation_sessions_user_ended", "user_id", "ended_at", "session_id"),
+    )
 
     session_id = Column(String, primary_key=True, index=True)
     title = Column(String, nullable=True)
@@ -32,6 +36,11 @@ class ConversationSession(Base):
     total_duration_sec = Column(Float, default=0.0)
     user_speech_duration_sec = Column(Float, default=0.0)
 
+    # 메시지 수/마지막 메시지 시각 (비정규화, 메시지 INSERT와 같은 트랜잭션에서 갱신)
+    # 세션 목록 조회가 chat_messages를 집계하지 않도록 함. 어긋나면 app.services.session_counters로 복구
+    message_count = Column(Integer, nullable=False, default=0, server_default="0")
+    last_message_at = Column(String, nullable=True)
+
     scenario_place = Column(String, nullable=True)
     scenario_partner = Column(String, nullable=True)
     scenario_goal = Column(String, nullable=True)
@@ -57,9 +66,19 @@ class ConversationSession(Base):
 class ChatMessage(Base):
     """개별 메시지 테이블"""
     __tablename__ = "chat_messages"
+    __table_args__ = (
+        # 체크포인트 재시도 시 같은 메시지가 중복 저장되지 않도록 하는 멱등 키
+        # 연결(connection_id)마다 분리되어, 재연결로 두 연결의 seq가 겹쳐도 서로의 메시지를 버리지 않음
+        # (기존 DB에도 init_db가 추가할 수 있도록 제약조건 대신 유니크 인덱스로 정의)
+        Index("uq_chat_messages_connection_seq", "session_id", "connection_id", "seq", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     session_id = Column(String, ForeignKey("conversation_sessions.session_id"), nullable=False, index=True)
+    # 세션 내 메시지 순번 (Tracker가 부여, 순번 없이 저장된 기존 메시지는 NULL)
+    seq = Column(Integer, nullable=True)
+    # 메시지를 기록한 연결(Tracker) 식별자 (새 메시지는 필수, 연결 ID 없이 저장된 기존 메시지만 NULL)
+    connection_id = Column(String, nullable=True)
     
     role = Column(String, nullable=False)
     content = Column(String, nullable=False)
@@ -67,3 +86,18 @@ class ChatMessage(Base):
     duration_sec = Column(Float, default=0.0)
 
     session = relationship("ConversationSession", back_populates="messages")
+
+class ScenarioCompletionOutbox(Base):
+    """시나리오 완료 후처리(세션 저장 + 제목 생성) 대기 작업 테이블 (Outbox)"""
+    __tablename__ = "scenario_completion_outbox"
+
+    # scenario.completed 전송 전에 기록되고, 서버가 재시작되면 미완료 작업을 이어서 처리함
+    session_id = Column(String, primary_key=True)
+    # pending: 세션 저장 전 / persisted: 제목 생성 대기 / failed: 저장 재시도 소진 (재개하지 않고 확인용으로 남김)
+    status = Column(String, nullable=False, default="pending", index=True)
+    payload_json = Column(Text, nullable=False)
+    last_error = Column(Text, nullable=True)
+
+    # Audit Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
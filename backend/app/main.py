@@ -1,23 +1,44 @@
 from contextlib import asynccontextmanager
 import asyncio
+import logging
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 from app.api.api import api_router
-from app.db.database import engine
-from app.db.models import Base
+from app.db.database import init_db
 from app.services.session_cleanup import run_cleanup_loop
+from scenario.openai_clients import start_openai_clients, stop_openai_clients
+from scenario.realtime_bridge import (
+    start_realtime_session_pool,
+    start_scenario_completion_queue,
+    stop_realtime_session_pool,
+    stop_scenario_completion_queue,
+)
+
+logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup: Create tables
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    # Startup: Create tables (+ 기존 DB에 추가된 컬럼/인덱스 보충)
+    await init_db()
     stop_event = asyncio.Event()
     cleanup_task = asyncio.create_task(run_cleanup_loop(stop_event))
+    # 워커 공용 OpenAI 클라이언트 (keep-alive 연결 재사용 + 동시 요청 상한)
+    start_openai_clients()
+    # 시나리오 완료 후처리 큐 (제목 생성 + 저장을 scenario.completed 응답 경로 밖에서 처리)
+    start_scenario_completion_queue()
+    # Realtime 세션 풀 예열 (시나리오 WS의 ready 지연 단축)
+    try:
+        await start_realtime_session_pool()
+    except RuntimeError as exc:
+        logger.warning(f"Realtime session pool disabled: {exc}")
     yield
     # Shutdown
+    await stop_realtime_session_pool()
+    # 남은 작업(제목 생성)이 OpenAI 클라이언트를 쓰므로 클라이언트보다 먼저 drain
+    await stop_scenario_completion_queue()
+    await stop_openai_clients()
     stop_event.set()
     cleanup_task.cancel()
     try:
@@ -40,6 +61,7 @@ if settings.BACKEND_CORS_ORIGINS:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor"],
     )
 
 app.include_router(api_router, prefix=settings.API_V1_STR)
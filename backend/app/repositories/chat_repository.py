@@ -3,18 +3,23 @@ from datetime import datetime
 import json
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import func
+from sqlalchemy import case, or_, tuple_, update
 from sqlalchemy.orm import selectinload
 from app.db.models import ConversationSession, ChatMessage
-from app.schemas.chat import SessionCreate
+from app.schemas.chat import SessionCreate, SessionCursor
 
 class ChatRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
 
     async def create_session_log(self, session_data: SessionCreate, user_id: int = None) -> ConversationSession:
-        # 1. Check if session exists
-        stmt = select(ConversationSession).where(ConversationSession.session_id == session_data.session_id).options(selectinload(ConversationSession.messages))
+        """
+        세션 로그를 저장합니다. (Append-only)
+        - 기존 메시지(relationship)는 로드하지 않습니다. 저장 비용이 대화 길이와 무관하도록
+          새 메시지는 executemany INSERT 한 번, 세션 갱신은 SQL 증분(UPDATE) 한 번으로 처리합니다.
+        """
+        # 1. Check if session exists (메시지 제외, 세션 행만 조회)
+        stmt = select(ConversationSession).where(ConversationSession.session_id == session_data.session_id)
         result = await self.db.execute(stmt)
         db_session = result.scalars().first()
 
@@ -40,45 +45,35 @@ class ChatRepository:
                 raise ValueError("Session is deleted")
             # [UPDATE]
             # Title은 업데이트하지 않음 (생성 시 또는 별도 API로만 관리)
-            
-            db_session.started_at = session_data.started_at
-            db_session.ended_at = session_data.ended_at
-            
-            # [Accumulate] 시간 누적 (기존 시간 + 이번 세션 시간)
-            # Tracker는 이번 연결의 시간만 계산해서 보내주므로, DB에는 계속 더해야 함
-            db_session.total_duration_sec += session_data.total_duration_sec
-            db_session.user_speech_duration_sec += session_data.user_speech_duration_sec
-            
+            values = {
+                "started_at": session_data.started_at,
+                "ended_at": session_data.ended_at,
+                # [Accumulate] 시간 누적 (기존 시간 + 이번 세션 시간)
+                # Tracker는 이번 연결의 시간만 계산해서 보내주므로, DB에서 SQL 증분으로 더함 (동시 저장에도 안전)
+                "total_duration_sec": ConversationSession.total_duration_sec + session_data.total_duration_sec,
+                "user_speech_duration_sec": (
+                    ConversationSession.user_speech_duration_sec + session_data.user_speech_duration_sec
+                ),
+            }
             if user_id is not None:
-                db_session.user_id = user_id
-
-            if session_data.scenario_place is not None:
-                db_session.scenario_place = session_data.scenario_place
-            if session_data.scenario_partner is not None:
-                db_session.scenario_partner = session_data.scenario_partner
-            if session_data.scenario_goal is not None:
-                db_session.scenario_goal = session_data.scenario_goal
-            if scenario_state_json is not None:
-                db_session.scenario_state_json = scenario_state_json
-            if scenario_completed_at is not None:
-                db_session.scenario_completed_at = scenario_completed_at
-            
-            if session_data.voice is not None:
-                db_session.voice = session_data.voice
-            if session_data.show_text is not None:
-                db_session.show_text = session_data.show_text
-            
-            # Tracker는 현재 세션의 '새로운' 메시지만 들고 있으므로,
-            # 슬라이싱 없이 그대로 기존 DB 메시지 뒤에 추가(Append)하면 됩니다.
-            for msg in session_data.messages:
-                db_msg = ChatMessage(
-                    session_id=session_data.session_id,
-                    role=msg.role,
-                    content=msg.content,
-                    timestamp=msg.timestamp,
-                    duration_sec=msg.duration_sec
-                )
-                db_session.messages.append(db_msg)
+                values["user_id"] = user_id
+
+            optional_values = {
+                "scenario_place": session_data.scenario_place,
+                "scenario_partner": session_data.scenario_partner,
+                "scenario_goal": session_data.scenario_goal,
+                "scenario_state_json": scenario_state_json,
+                "scenario_completed_at": scenario_completed_at,
+                "voice": session_data.voice,
+                "show_text": session_data.show_text,
+            }
+            values.update({key: value for key, value in optional_values.items() if value is not None})
+
+            await self.db.execute(
+                update(ConversationSession)
+                .where(ConversationSession.session_id == session_data.session_id)
+                .values(**values)
+            )
         else:
             # [INSERT]
             db_session = ConversationSession(
@@ -98,22 +93,83 @@ class ChatRepository:
                 user_id=user_id
             )
             self.db.add(db_session)
-            
-            # Add All Messages
-            for msg in session_data.messages:
-                db_msg = ChatMessage(
-                    session_id=session_data.session_id,
-                    role=msg.role,
-                    content=msg.content,
-                    timestamp=msg.timestamp,
-                    duration_sec=msg.duration_sec
-                )
-                db_session.messages.append(db_msg)
-        
+            # 메시지 INSERT 전에 세션 행을 먼저 기록 (FK)
+            await self.db.flush()
+
+        # Tracker는 현재 세션의 '새로운' 메시지만 들고 있으므로,
+        # 기존 메시지를 읽지 않고 새 메시지만 한 번에 추가(Append, executemany)합니다.
+        await self._append_messages(session_data.session_id, session_data.messages)
+
         await self.db.commit()
+        # 세션 컬럼만 다시 읽음 (messages는 lazy 상태 유지)
         await self.db.refresh(db_session)
         return db_session
 
+    async def checkpoint_messages(self, session_id: str, messages) -> None:
+        """
+        대화 중 메시지 체크포인트를 저장합니다.
+        (session_id, connection_id, seq) 기준 upsert이므로 같은 배치를 재시도하거나 종료 시 다시 보내도 행이 중복되지 않습니다.
+        """
+        await self._append_messages(session_id, messages)
+        await self.db.commit()
+
+    async def _append_messages(self, session_id: str, messages) -> None:
+        """
+        메시지를 추가하고, 실제로 추가된 행만큼 세션의 message_count/last_message_at을
+        같은 트랜잭션에서 SQL 증분으로 갱신합니다. (중복으로 건너뛴 체크포인트 메시지는 세지 않음)
+        """
+        rows = [
+            {
+                "session_id": session_id,
+                "seq": msg.seq,
+                "connection_id": msg.connection_id,
+                "role": msg.role,
+                "content": msg.content,
+                "timestamp": msg.timestamp,
+                "duration_sec": msg.duration_sec,
+            }
+            for msg in messages
+        ]
+        # 새 메시지는 모두 Tracker가 부여한 (connection_id, seq)를 가져야 함.
+        # 키가 NULL인 행은 유니크 인덱스가 중복을 막지 못해, 재시도 시 그대로 중복 저장되므로 받지 않음
+        if any(row["seq"] is None or row["connection_id"] is None for row in rows):
+            raise ValueError("Messages require seq and connection_id")
+        if not rows:
+            return
+        # 이미 저장된 (session_id, connection_id, seq)는 건너뜀 (멱등 저장), RETURNING으로 실제 추가된 행만 받음
+        result = await self.db.execute(
+            self._insert_messages_ignoring_duplicates().returning(ChatMessage.timestamp), rows
+        )
+        inserted_timestamps = result.scalars().all()
+        if not inserted_timestamps:
+            return
+
+        last_message_at = max(inserted_timestamps)
+        await self.db.execute(
+            update(ConversationSession)
+            .where(ConversationSession.session_id == session_id)
+            .values(
+                message_count=ConversationSession.message_count + len(inserted_timestamps),
+                last_message_at=case(
+                    (
+                        or_(
+                            ConversationSession.last_message_at.is_(None),
+                            ConversationSession.last_message_at < last_message_at,
+                        ),
+                        last_message_at,
+                    ),
+                    else_=ConversationSession.last_message_at,
+                ),
+            )
+        )
+
+    def _insert_messages_ignoring_duplicates(self):
+        if self.db.bind.dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        return dialect_insert(ChatMessage).on_conflict_do_nothing(index_elements=["session_id", "connection_id", "seq"])
+
     async def get_recent_session_by_user(self, user_id: int) -> Optional[ConversationSession]:
         stmt = (
             select(ConversationSession)
@@ -146,18 +202,30 @@ class ChatRepository:
         result = await self.db.execute(stmt)
         return result.scalars().first()
 
-    async def get_sessions_by_user(self, user_id: int, skip: int = 0, limit: int = 20):
+    async def get_sessions_by_user(self, user_id: int, skip: int = 0, limit: int = 20, cursor: Optional[SessionCursor] = None):
+        """
+        사용자 세션 목록을 최근 종료 순(ended_at DESC, session_id DESC)으로 조회합니다.
+        - cursor: keyset 페이지네이션. 커서 다음 행부터 인덱스(ix_conversation_sessions_user_ended) 범위로 읽으므로
+          페이지 깊이와 무관하게 limit개만 읽습니다.
+        - skip: 기존 OFFSET 방식 (호환용, cursor와 함께 주면 커서 이후에서 건너뜀)
+        - 메시지 수는 세션 행의 message_count(비정규화 컬럼)를 그대로 쓰므로 chat_messages는 읽지 않습니다.
+        """
         stmt = (
-            select(ConversationSession, func.count(ChatMessage.id))
-            .outerjoin(ChatMessage, ChatMessage.session_id == ConversationSession.session_id)
+            select(ConversationSession)
             .where(ConversationSession.user_id == user_id)
-            .group_by(ConversationSession.session_id)
-            .order_by(ConversationSession.ended_at.desc())
-            .offset(skip)
+            .order_by(ConversationSession.ended_at.desc(), ConversationSession.session_id.desc())
             .limit(limit)
         )
+        if cursor is not None:
+            # ended_at은 ISO-8601 문자열(UTC)이라 문자열 순서 = 시간 순서
+            stmt = stmt.where(
+                tuple_(ConversationSession.ended_at, ConversationSession.session_id)
+                < tuple_(cursor.ended_at, cursor.session_id)
+            )
+        if skip:
+            stmt = stmt.offset(skip)
         result = await self.db.execute(stmt)
-        return result.all()
+        return result.scalars().all()
 
     async def update_session_owner(self, session_id: str, user_id: int) -> bool:
         stmt = select(ConversationSession).where(ConversationSession.session_id == session_id)
@@ -171,6 +239,20 @@ class ChatRepository:
             return True
         return False
 
+    async def update_session_title(self, session_id: str, title: str) -> bool:
+        """
+        시나리오 완료 후 백그라운드에서 생성된 제목으로 세션 제목을 갱신(backfill)합니다.
+        """
+        stmt = select(ConversationSession).where(ConversationSession.session_id == session_id)
+        result = await self.db.execute(stmt)
+        session = result.scalars().first()
+
+        if session:
+            session.title = title
+            await self.db.commit()
+            return True
+        return False
+
     async def update_preferences(self, session_id: str, voice: Optional[str], show_text: Optional[bool]) -> bool:
         """
         사용자 선호 설정(보이스, 자막)을 업데이트합니다.
@@ -0,0 +1,48 @@
+import json
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy import delete, update
+from app.db.models import ScenarioCompletionOutbox
+
+# 재시작 시 이어서 처리할 상태 (failed는 재개하지 않음)
+UNFINISHED_STATUSES = ("pending", "persisted")
+
+
+class ScenarioOutboxRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def add(self, session_id: str, payload: dict) -> None:
+        """
+        완료 작업을 pending으로 기록합니다. (같은 세션이 다시 완료되면 최신 작업으로 덮어씀)
+        """
+        await self.db.merge(ScenarioCompletionOutbox(
+            session_id=session_id,
+            status="pending",
+            payload_json=json.dumps(payload, ensure_ascii=False),
+            last_error=None,
+        ))
+        await self.db.commit()
+
+    async def mark(self, session_id: str, status: str, error: Optional[str] = None) -> None:
+        await self.db.execute(
+            update(ScenarioCompletionOutbox)
+            .where(ScenarioCompletionOutbox.session_id == session_id)
+            .values(status=status, last_error=error)
+        )
+        await self.db.commit()
+
+    async def remove(self, session_id: str) -> None:
+        await self.db.execute(
+            delete(ScenarioCompletionOutbox).where(ScenarioCompletionOutbox.session_id == session_id)
+        )
+        await self.db.commit()
+
+    async def list_unfinished(self) -> List[ScenarioCompletionOutbox]:
+        result = await self.db.execute(
+            select(ScenarioCompletionOutbox)
+            .where(ScenarioCompletionOutbox.status.in_(UNFINISHED_STATUSES))
+            .order_by(ScenarioCompletionOutbox.created_at)
+        )
+        return result.scalars().all()
@@ -1,8 +1,12 @@
 from typing import List, Optional, Dict, Any
 from datetime import datetime
+import base64
+import json
 from pydantic import BaseModel
 
 class MessageSchema(BaseModel):
+    seq: Optional[int] = None
+    connection_id: Optional[str] = None
     role: str
     content: str
     timestamp: str
@@ -39,10 +43,33 @@ class SessionSummary(SessionBase):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     message_count: int
+    last_message_at: Optional[str] = None
 
     class Config:
         from_attributes = True
 
+class SessionCursor(BaseModel):
+    """
+    세션 목록 keyset 페이지네이션 커서 (정렬 키 ended_at DESC, session_id DESC의 마지막 값)
+    클라이언트에는 불투명한 base64url 문자열로 전달합니다.
+    """
+    ended_at: str
+    session_id: str
+
+    def encode(self) -> str:
+        raw = json.dumps([self.ended_at, self.session_id], separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "SessionCursor":
+        """잘못된 커서면 ValueError"""
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            ended_at, session_id = json.loads(raw)
+            return cls(ended_at=ended_at, session_id=session_id)
+        except (ValueError, TypeError) as e:
+            raise ValueError("Invalid cursor") from e
+
 class SyncSessionResponse(BaseModel):
     """
     세션 동기화 응답 스키마
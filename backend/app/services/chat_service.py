@@ -1,19 +1,73 @@
-from typing import Optional, List, Dict, Any
+from contextlib import asynccontextmanager
+from typing import Optional, List, Dict, Any, Tuple
 from app.repositories.chat_repository import ChatRepository
-from app.schemas.chat import SessionCreate, SessionSummary, SessionResponse
+from app.schemas.chat import MessageSchema, SessionCreate, SessionCursor, SessionSummary, SessionResponse
 from app.db.models import ConversationSession, User
 from realtime_conversation.connection_handler import ConnectionHandler
 from fastapi import WebSocket
 from fastapi import WebSocket
 from sqlalchemy.future import select
 from app.core.config import settings
+from app.db.database import AsyncSessionLocal
 from realtime_conversation.session_manager import SessionManager
+from scenario.completion_queue import COMPLETION_FAILED, COMPLETION_PERSISTED
+from scenario.realtime_bridge import wait_for_scenario_session
 
 class ChatService:
-    def __init__(self, chat_repo: ChatRepository):
+    def __init__(self, chat_repo: Optional[ChatRepository] = None, session_factory=AsyncSessionLocal):
+        # chat_repo: 요청 스코프 세션(get_db) 기반, HTTP 엔드포인트용
+        # session_factory: WebSocket 등 장시간 연결에서 필요한 순간에만 여는 짧은 DB 작업 단위용
         self.chat_repo = chat_repo
+        self.session_factory = session_factory
         self.session_manager = SessionManager()
 
+    @asynccontextmanager
+    async def _unit_of_work(self):
+        """
+        짧은 DB 작업 단위를 엽니다.
+        블록이 끝나면 세션을 닫아 커넥션을 풀에 즉시 반납하므로, 대화(수 분) 동안 커넥션을 점유하지 않습니다.
+        """
+        async with self.session_factory() as db:
+            yield ChatRepository(db)
+
+    async def _checkpoint_messages(self, session_id: str, messages: List[Dict]) -> None:
+        """
+        대화 중 체크포인트 writer (ConnectionHandler -> MessageCheckpointer가 호출)
+        배치마다 짧은 DB 작업 단위를 열고 (session_id, connection_id, seq) upsert로 저장합니다.
+        """
+        async with self._unit_of_work() as chat_repo:
+            await chat_repo.checkpoint_messages(session_id, [MessageSchema(**msg) for msg in messages])
+
+    async def _load_session_for_websocket(self, session_id: str, voice: Optional[str], show_text: Optional[bool]) -> Optional[ConversationSession]:
+        """
+        WebSocket 시작 시 필요한 DB 작업(선호 설정 저장 + 세션/히스토리 조회)을 하나의 짧은 작업 단위로 수행합니다.
+        반환된 세션 객체는 messages까지 로드된 상태로 세션에서 분리(detach)되어 있습니다.
+        """
+        async with self._unit_of_work() as chat_repo:
+            # 사용자 선호 설정 선 저장 (DB First) - 파라미터가 들어온 경우에만 업데이트
+            if voice is not None or show_text is not None:
+                await chat_repo.update_preferences(session_id, voice, show_text)
+
+            # user_id 필터 없이 조회 후, 호출부에서 소유권 검증 수행
+            session_obj = await chat_repo.get_session_by_id(session_id)
+            if session_obj:
+                return session_obj
+
+            print(f"Session {session_id} not found via get_session_by_id.")
+            # [DEBUG] 혹시 삭제된 세션인지, 아니면 정말 없는지 확인
+            try:
+                stmt = select(ConversationSession).where(ConversationSession.session_id == session_id)
+                result = await chat_repo.db.execute(stmt)
+                debug_session = result.scalars().first()
+
+                if debug_session:
+                    print(f"[DEBUG] Session FOUND but match failed. check: deleted={debug_session.deleted}, user_id={debug_session.user_id}")
+                else:
+                    print(f"[DEBUG] Session REALLY NOT FOUND in DB. session_id={session_id}")
+            except Exception as e:
+                print(f"[DEBUG] DB Check failed: {e}")
+            return None
+
     async def save_chat_log(self, session_data: SessionCreate, user_id: int = None) -> ConversationSession:
         return await self.chat_repo.create_session_log(session_data, user_id)
 
@@ -23,10 +77,15 @@ class ChatService:
     async def get_recent_session(self, user_id: int) -> Optional[ConversationSession]:
         return await self.chat_repo.get_recent_session_by_user(user_id)
 
-    async def get_user_sessions(self, user_id: int, skip: int = 0, limit: int = 20) -> List[SessionSummary]:
-        results = await self.chat_repo.get_sessions_by_user(user_id, skip, limit)
+    async def get_user_sessions(self, user_id: int, skip: int = 0, limit: int = 20, cursor: Optional[str] = None) -> Tuple[List[SessionSummary], Optional[str]]:
+        """
+        세션 목록과 다음 페이지 커서를 반환합니다. (마지막 페이지면 커서 None)
+        잘못된 cursor면 ValueError
+        """
+        decoded = SessionCursor.decode(cursor) if cursor else None
+        results = await self.chat_repo.get_sessions_by_user(user_id, skip, limit, decoded)
         summaries = []
-        for session, count in results:
+        for session in results:
             # SQLAlchemy model to Pydantic mapping
             summary = SessionSummary(
                 session_id=session.session_id,
@@ -37,10 +96,16 @@ class ChatService:
                 user_speech_duration_sec=session.user_speech_duration_sec,
                 created_at=session.created_at,
                 updated_at=session.updated_at,
-                message_count=count
+                message_count=session.message_count,
+                last_message_at=session.last_message_at,
             )
             summaries.append(summary)
-        return summaries
+
+        next_cursor = None
+        if limit and len(results) == limit:
+            last = results[-1]
+            next_cursor = SessionCursor(ended_at=last.ended_at, session_id=last.session_id).encode()
+        return summaries, next_cursor
 
     async def get_session_detail(self, session_id: str, user_id: int) -> Optional[SessionResponse]:
         session = await self.chat_repo.get_session_by_id(session_id, user_id)
@@ -64,13 +129,15 @@ class ChatService:
         
         return history_messages
 
-    async def start_ai_session(self, websocket: WebSocket, user_id: Optional[int], session_id: str = None, voice: str = None, show_text: bool = None):
+    async def start_ai_session(self, websocket: WebSocket, user_id: Optional[int], session_id: str = None, voice: str = None, show_text: bool = None, audio_transport: str = None, vad_gate: bool = False, audio_codec: str = None, adaptive_audio: bool = False):
         """
         AI와의 실시간 대화 세션을 시작합니다.
         - OpenAI API Key 로드
         - [New] 사용자 선호 설정(보이스, 자막) 선 저장
         - 최신 세션 정보 및 히스토리 조회
         - ConnectionHandler 시작
+        - 종료 후 리포트 저장
+        DB는 조회/저장 시점에만 짧은 작업 단위(_unit_of_work)로 사용하고, 대화 중에는 커넥션을 점유하지 않습니다.
         """
         print(f"[DEBUG] start_ai_session called. session_id={session_id}, user_id={user_id}")
         # 1. OpenAI API Key 확인
@@ -81,37 +148,29 @@ class ChatService:
             await websocket.close(code=1008, reason="Server configuration error")
             return
 
-        # 2. 사용자 선호 설정 선 저장 (DB First)
-        # 파라미터가 들어온 경우에만 업데이트를 수행합니다.
-        if session_id and (voice is not None or show_text is not None):
-            await self.chat_repo.update_preferences(session_id, voice, show_text)
+        # 2~3. 선호 설정 선 저장 + 최신 세션 정보 조회 (짧은 DB 작업 단위, 조회 후 커넥션 즉시 반납)
+        session_obj = None
+        if session_id:
+            session_obj = await self._load_session_for_websocket(session_id, voice, show_text)
+
+            # 시나리오 완료 직후라면 저장이 아직 백그라운드 큐에 있을 수 있으므로 저장될 때까지 대기 후 재조회
+            # (대기 중에는 DB 커넥션을 잡고 있지 않음)
+            if not session_obj:
+                completion = await wait_for_scenario_session(session_id)
+                if completion == COMPLETION_FAILED:
+                    # 저장 재시도가 모두 실패 (작업은 outbox에 failed로 남음)
+                    await websocket.close(code=1011, reason="Scenario save failed")
+                    return
+                if completion == COMPLETION_PERSISTED:
+                    session_obj = await self._load_session_for_websocket(session_id, voice, show_text)
 
-        # 3. 최신 세션 정보 및 히스토리 조회
         history_messages = []
         conversation_context = None
         voice_config = None # DB에서 가져온 보이스 설정
+        message_seq_start = 0 # 이어서 기록할 메시지 순번 (저장된 최대 seq + 1)
 
         if session_id:
-            # DB에서 최신 세션 정보 조회
-            # user_id 필터 없이 조회 후, 로직에서 소유권 검증 수행
-            session_obj = await self.chat_repo.get_session_by_id(session_id)
-            
             if not session_obj:
-                print(f"Session {session_id} not found via get_session_by_id.")
-                
-                # [DEBUG] 혹시 삭제된 세션인지, 아니면 정말 없는지 확인
-                try:
-                    stmt = select(ConversationSession).where(ConversationSession.session_id == session_id)
-                    result = await self.chat_repo.db.execute(stmt)
-                    debug_session = result.scalars().first()
-                    
-                    if debug_session:
-                        print(f"[DEBUG] Session FOUND but match failed. check: deleted={debug_session.deleted}, user_id={debug_session.user_id}")
-                    else:
-                        print(f"[DEBUG] Session REALLY NOT FOUND in DB. session_id={session_id}")
-                except Exception as e:
-                    print(f"[DEBUG] DB Check failed: {e}")
-
                 await websocket.close(code=4004, reason="Session not found")
                 return
 
@@ -142,6 +201,8 @@ class ChatService:
                         "role": msg.role,
                         "content": msg.content
                     })
+                    if msg.seq is not None:
+                        message_seq_start = max(message_seq_start, msg.seq + 1)
 
         # 4. ConnectionHandler 시작
         if ConnectionHandler:
@@ -152,7 +213,14 @@ class ChatService:
                 history=history_messages, 
                 session_id=session_id,
                 context=conversation_context,
-                voice=voice_config # [New]
+                voice=voice_config, # [New]
+                audio_transport=audio_transport,
+                vad_gate=vad_gate,
+                audio_codec=audio_codec,
+                adaptive_audio=adaptive_audio,
+                # [Checkpoint] 대화 중 N개/T초마다 메시지 upsert 저장 (세션이 있을 때만)
+                message_seq_start=message_seq_start,
+                checkpoint_writer=self._checkpoint_messages if session_id else None
             )
             
             # [Manager] 세션 등록
@@ -166,13 +234,18 @@ class ChatService:
                 # user_id가 없어도(Guest/Demo) 저장합니다. (DB에는 user_id=NULL로 저장됨)
                 if report:
                     try:
-                        session_data = SessionCreate(**report)
+                        # 대화 중 체크포인트된 메시지는 제외하고 남은 delta만 저장
+                        # (중복으로 보내더라도 (session_id, connection_id, seq) upsert라 행이 늘어나지 않음)
+                        checkpointed = report.get("checkpointed_messages", 0)
+                        session_data = SessionCreate(**{**report, "messages": report["messages"][checkpointed:]})
                         # 중요: 종료 시점의 설정값도 저장하고 싶다면 report에 포함되어야 함.
                         # 하지만 이미 시작할 때 update_preferences로 저장했으므로,
                         # 여기서는 변동사항이 없다면 건너뛰어도 됨.
                         # 다만 SessionCreate에 voice, show_text 필드가 추가되었으므로 
                         # Tracker가 이를 채워서 보내준다면 업데이트될 것임.
-                        await self.save_chat_log(session_data, user_id)
+                        # 대화가 끝난 뒤 새 DB 작업 단위로 저장 (대화 중에는 커넥션을 점유하지 않음)
+                        async with self._unit_of_work() as chat_repo:
+                            await chat_repo.create_session_log(session_data, user_id)
                         print(f"Session {session_data.session_id} saved (User: {user_id})")
                     except Exception as e:
                         print(f"Failed to auto-save session log: {e}")
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+
+from sqlalchemy import func, or_, select, update
+
+from app.db.database import AsyncSessionLocal, init_db
+from app.db.models import ChatMessage, ConversationSession
+
+logger = logging.getLogger(__name__)
+
+
+async def repair_session_counters(batch_size: int = 1000) -> int:
+    """
+    세션의 비정규화 컬럼(message_count, last_message_at)을 chat_messages 기준으로 다시 계산합니다.
+    - 용도: 직접 수정 등으로 어긋난 값 복구 (컬럼 추가 시 backfill은 init_db가 같은 트랜잭션에서 처리)
+    - session_id 순으로 batch_size개씩 나눠 커밋하므로 큰 테이블도 긴 트랜잭션 없이 처리합니다.
+    - 값이 다른 세션만 갱신하며, updated_at(게스트 세션 만료 기준)은 바꾸지 않습니다.
+    Returns: 수정된 세션 수
+    """
+    message_count = (
+        select(func.count(ChatMessage.id))
+        .where(ChatMessage.session_id == ConversationSession.session_id)
+        .scalar_subquery()
+    )
+    last_message_at = (
+        select(func.max(ChatMessage.timestamp))
+        .where(ChatMessage.session_id == ConversationSession.session_id)
+        .scalar_subquery()
+    )
+
+    repaired = 0
+    last_session_id = None
+    async with AsyncSessionLocal() as session:
+        while True:
+            stmt = select(ConversationSession.session_id).order_by(ConversationSession.session_id).limit(batch_size)
+            if last_session_id is not None:
+                stmt = stmt.where(ConversationSession.session_id > last_session_id)
+            session_ids = (await session.execute(stmt)).scalars().all()
+            if not session_ids:
+                break
+            last_session_id = session_ids[-1]
+
+            result = await session.execute(
+                update(ConversationSession)
+                .where(
+                    ConversationSession.session_id.in_(session_ids),
+                    or_(
+                        ConversationSession.message_count != message_count,
+                        ConversationSession.last_message_at.is_distinct_from(last_message_at),
+                    ),
+                )
+                .values(
+                    message_count=message_count,
+                    last_message_at=last_message_at,
+                    updated_at=ConversationSession.updated_at,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await session.commit()
+            repaired += result.rowcount or 0
+
+    logger.info(f"Repaired message counters of {repaired} sessions.")
+    return repaired
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="세션 message_count/last_message_at 복구")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    await init_db()
+    repaired = await repair_session_counters(batch_size=args.batch_size)
+    print(f"repaired sessions: {repaired}")
+
+
+if __name__ == "__main__":
+    # 사용법: python -m app.services.session_counters
+    asyncio.run(main())
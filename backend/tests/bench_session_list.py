@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Latency of GET /chat/sessions pages vs. page depth (OFFSET vs. keyset cursor).
+
+Seeds `--sessions` sessions (default 100k) for one user, `--messages` messages
+each, in a scratch SQLite database (or `--db-url`), then reads one `--limit`
+page at each depth in `--depths` and reports the median of `--rounds` reads.
+"offset" is the previous query for comparison: join every message, GROUP BY
+session, ORDER BY ended_at, OFFSET depth. "cursor" is
+ChatRepository.get_sessions_by_user with the cursor of the row before the page,
+which reads message_count from the session row; raise `--messages` to check
+that it stays flat while the offset query grows with message volume.
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.models import Base, ChatMessage, ConversationSession, User
+from app.repositories.chat_repository import ChatRepository
+from app.schemas.chat import SessionCursor
+
+
+async def legacy_page(db: AsyncSession, user_id: int, skip: int, limit: int):
+    stmt = (
+        select(ConversationSession, func.count(ChatMessage.id))
+        .outerjoin(ChatMessage, ChatMessage.session_id == ConversationSession.session_id)
+        .where(ConversationSession.user_id == user_id)
+        .group_by(ConversationSession.session_id)
+        .order_by(ConversationSession.ended_at.desc())
+        .offset(skip)
+        .limit(limit)
+    )
+    return (await db.execute(stmt)).all()
+
+
+async def seed(factory, sessions: int, messages: int) -> int:
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    async with factory() as db:
+        user = User(login_id="bench", hashed_password="x", nickname="bench", is_active=True)
+        db.add(user)
+        await db.flush()
+        for start in range(0, sessions, 5000):
+            session_rows, message_rows = [], []
+            for i in range(start, min(start + 5000, sessions)):
+                ended_at = (base + timedelta(seconds=i)).isoformat()
+                session_id = f"{i:08d}"
+                session_rows.append({
+                    "session_id": session_id, "title": "bench", "started_at": ended_at, "ended_at": ended_at,
+                    "total_duration_sec": 0.0, "user_speech_duration_sec": 0.0, "user_id": user.id,
+                    "message_count": messages, "last_message_at": ended_at if messages else None,
+                })
+                message_rows.extend(
+                    {"session_id": session_id, "role": "user", "content": "message", "timestamp": ended_at}
+                    for _ in range(messages)
+                )
+            await db.execute(insert(ConversationSession), session_rows)
+            if message_rows:
+                await db.execute(insert(ChatMessage), message_rows)
+        await db.commit()
+        return user.id
+
+
+async def cursor_at(factory, user_id: int, depth: int):
+    """depth번째 행 직전 행의 커서 (클라이언트가 이전 페이지 응답에서 받은 값에 해당)"""
+    if depth == 0:
+        return None
+    async with factory() as db:
+        row = (await db.execute(
+            select(ConversationSession.ended_at, ConversationSession.session_id)
+            .where(ConversationSession.user_id == user_id)
+            .order_by(ConversationSession.ended_at.desc(), ConversationSession.session_id.desc())
+            .offset(depth - 1)
+            .limit(1)
+        )).one()
+    return SessionCursor(ended_at=row.ended_at, session_id=row.session_id)
+
+
+async def measure(factory, mode: str, user_id: int, depth: int, args) -> float:
+    cursor = await cursor_at(factory, user_id, depth) if mode == "cursor" else None
+    samples = []
+    for _ in range(args.rounds):
+        async with factory() as db:
+            started = time.perf_counter()
+            if mode == "offset":
+                rows = await legacy_page(db, user_id, depth, args.limit)
+            else:
+                rows = await ChatRepository(db).get_sessions_by_user(user_id, limit=args.limit, cursor=cursor)
+            samples.append((time.perf_counter() - started) * 1000.0)
+        assert len(rows) == args.limit
+    return statistics.median(samples)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=100_000, help="sessions for the user")
+    parser.add_argument("--messages", type=int, default=2, help="messages per session")
+    parser.add_argument("--depths", default="0,1000,10000,50000,99000", help="rows before the page")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--db-url", help="defaults to a scratch SQLite file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(args.db_url or f"sqlite+aiosqlite:///{tmp}/bench.db")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        user_id = await seed(factory, args.sessions, args.messages)
+
+        print(f"{'depth':>7} {'offset ms':>10} {'cursor ms':>10} {'speedup':>8}")
+        for depth in (int(value) for value in args.depths.split(",")):
+            offset = await measure(factory, "offset", user_id, depth, args)
+            cursor = await measure(factory, "cursor", user_id, depth, args)
+            print(f"{depth:>7} {offset:>10.2f} {cursor:>10.2f} {offset / cursor:>7.1f}x")
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Save latency of ChatRepository.create_session_log vs. prior conversation length.
+
+Seeds one session per size (`--sizes`, default 10 / 1k / 10k prior messages)
+in a scratch SQLite database (or `--db-url`), then saves `--rounds` deltas of
+`--delta` new messages into each and reports the median save time.
+"legacy" is the previous write path for comparison: selectinload every
+historical message, append the new ones to the relationship, commit, refresh.
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import selectinload, sessionmaker
+
+from app.db.models import Base, ChatMessage, ConversationSession
+from app.repositories.chat_repository import ChatRepository
+from app.schemas.chat import MessageSchema, SessionCreate
+
+
+async def legacy_save(db: AsyncSession, session_data: SessionCreate) -> None:
+    stmt = (
+        select(ConversationSession)
+        .where(ConversationSession.session_id == session_data.session_id)
+        .options(selectinload(ConversationSession.messages))
+    )
+    db_session = (await db.execute(stmt)).scalars().first()
+    db_session.ended_at = session_data.ended_at
+    db_session.total_duration_sec += session_data.total_duration_sec
+    db_session.user_speech_duration_sec += session_data.user_speech_duration_sec
+    for msg in session_data.messages:
+        db_session.messages.append(ChatMessage(session_id=session_data.session_id, **msg.model_dump()))
+    await db.commit()
+    await db.refresh(db_session)
+
+
+async def seed(factory, prior: int) -> str:
+    now = datetime.now(timezone.utc).isoformat()
+    session_id = str(uuid.uuid4())
+    async with factory() as db:
+        db.add(ConversationSession(
+            session_id=session_id, title="bench", started_at=now, ended_at=now,
+            total_duration_sec=0.0, user_speech_duration_sec=0.0,
+        ))
+        await db.flush()
+        rows = [
+            {"session_id": session_id, "role": "user" if i % 2 else "assistant",
+             "content": f"message {i} " * 8, "timestamp": now, "duration_sec": 1.0}
+            for i in range(prior)
+        ]
+        if rows:
+            await db.execute(insert(ChatMessage), rows)
+        await db.commit()
+    return session_id
+
+
+def delta(session_id: str, count: int) -> SessionCreate:
+    now = datetime.now(timezone.utc).isoformat()
+    # fresh connection per round: a repeated (connection_id, seq) would be skipped by the upsert
+    connection_id = uuid.uuid4().hex
+    return SessionCreate(
+        session_id=session_id, started_at=now, ended_at=now,
+        total_duration_sec=30.0, user_speech_duration_sec=10.0,
+        messages=[
+            MessageSchema(seq=seq, connection_id=connection_id, role="user", content="new message " * 8, timestamp=now)
+            for seq in range(count)
+        ],
+    )
+
+
+async def measure(factory, mode: str, prior: int, args) -> float:
+    session_id = await seed(factory, prior)
+    samples = []
+    for _ in range(args.rounds):
+        data = delta(session_id, args.delta)
+        async with factory() as db:
+            started = time.perf_counter()
+            if mode == "legacy":
+                await legacy_save(db, data)
+            else:
+                await ChatRepository(db).create_session_log(data)
+            samples.append((time.perf_counter() - started) * 1000.0)
+    return statistics.median(samples)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="10,1000,10000", help="prior messages per session")
+    parser.add_argument("--delta", type=int, default=20, help="new messages per save")
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--db-url", help="defaults to a scratch SQLite file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(args.db_url or f"sqlite+aiosqlite:///{tmp}/bench.db")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+        print(f"{'prior':>7} {'legacy ms':>10} {'append ms':>10} {'speedup':>8}")
+        for prior in (int(size) for size in args.sizes.split(",")):
+            legacy = await measure(factory, "legacy", prior, args)
+            append = await measure(factory, "append", prior, args)
+            print(f"{prior:>7} {legacy:>10.2f} {append:>10.2f} {legacy / append:>7.1f}x")
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
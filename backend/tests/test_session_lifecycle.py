@@ -2,18 +2,22 @@ import uuid
 from datetime import datetime, timezone, timedelta
 
 import pytest
-from sqlalchemy import delete, update, select
+from sqlalchemy import delete, update, select, inspect, text
+from sqlalchemy.ext.asyncio import create_async_engine
 
-from app.db.database import engine, AsyncSessionLocal
-from app.db.models import Base, ConversationSession, User
+from app.db.database import init_db, AsyncSessionLocal, _upgrade_schema
+from app.db.models import Base, ChatMessage, ConversationSession, ScenarioCompletionOutbox, User
 from app.repositories.chat_repository import ChatRepository
-from app.schemas.chat import SessionCreate
+from app.repositories.scenario_outbox_repository import ScenarioOutboxRepository
+from app.schemas.chat import MessageSchema, SessionCreate
+from app.services.chat_service import ChatService
 from app.services.session_cleanup import soft_delete_expired_sessions
+from app.services.session_counters import repair_session_counters
+from realtime_conversation.conversation_tracker import ConversationTracker
 
 
 async def _init_db() -> None:
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    await init_db()
 
 
 async def _reset_db() -> None:
@@ -136,3 +140,294 @@ async def test_get_recent_session_excludes_deleted() -> None:
         repo = ChatRepository(db)
         recent = await repo.get_recent_session_by_user(user_id=user.id)
         assert recent is None
+
+
+@pytest.mark.asyncio
+async def test_create_session_log_appends_without_loading_history() -> None:
+    await _init_db()
+    await _reset_db()
+
+    now = datetime.now(timezone.utc).isoformat()
+    session_id = str(uuid.uuid4())
+
+    def session_data(contents: list[str], start_seq: int = 0) -> SessionCreate:
+        return SessionCreate(
+            session_id=session_id,
+            title="Append",
+            started_at=now,
+            ended_at=now,
+            total_duration_sec=10.0,
+            user_speech_duration_sec=4.0,
+            messages=[
+                MessageSchema(seq=start_seq + i, connection_id="c1", role="user", content=content, timestamp=now)
+                for i, content in enumerate(contents)
+            ],
+        )
+
+    async with AsyncSessionLocal() as db:
+        await ChatRepository(db).create_session_log(session_data(["a", "b"]))
+
+    async with AsyncSessionLocal() as db:
+        saved = await ChatRepository(db).create_session_log(session_data(["c"], start_seq=2), user_id=None)
+        # 기존 메시지(relationship)는 로드하지 않음
+        assert "messages" not in inspect(saved).dict
+        assert saved.total_duration_sec == 20.0
+        assert saved.user_speech_duration_sec == 8.0
+
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(ChatMessage.content).where(ChatMessage.session_id == session_id).order_by(ChatMessage.id)
+        )
+        assert result.scalars().all() == ["a", "b", "c"]
+
+    # 멱등 키(seq, connection_id)가 없는 메시지는 중복을 막을 수 없으므로 저장하지 않음
+    async with AsyncSessionLocal() as db:
+        with pytest.raises(ValueError):
+            await ChatRepository(db).checkpoint_messages(
+                session_id, [MessageSchema(seq=3, role="user", content="d", timestamp=now)]
+            )
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_messages_is_idempotent() -> None:
+    await _init_db()
+    await _reset_db()
+
+    now = datetime.now(timezone.utc).isoformat()
+    session_id = str(uuid.uuid4())
+    async with AsyncSessionLocal() as db:
+        await ChatRepository(db).create_session_log(SessionCreate(
+            session_id=session_id,
+            started_at=now,
+            ended_at=now,
+            total_duration_sec=0.0,
+            user_speech_duration_sec=0.0,
+            messages=[],
+        ))
+
+    def batch(*seqs: int) -> list[MessageSchema]:
+        return [
+            MessageSchema(seq=seq, connection_id="c1", role="user", content=f"m{seq}", timestamp=now)
+            for seq in seqs
+        ]
+
+    # 체크포인트 재시도 + 최종 저장에서 겹치는 메시지가 다시 와도 행은 한 번만 저장
+    async with AsyncSessionLocal() as db:
+        repo = ChatRepository(db)
+        await repo.checkpoint_messages(session_id, batch(0, 1))
+        await repo.checkpoint_messages(session_id, batch(0, 1))
+        await repo.checkpoint_messages(session_id, batch(1, 2))
+
+    async with AsyncSessionLocal() as db:
+        await ChatRepository(db).create_session_log(SessionCreate(
+            session_id=session_id,
+            started_at=now,
+            ended_at=now,
+            total_duration_sec=5.0,
+            user_speech_duration_sec=1.0,
+            messages=batch(2, 3),
+        ))
+
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(ChatMessage.seq, ChatMessage.content)
+            .where(ChatMessage.session_id == session_id)
+            .order_by(ChatMessage.seq)
+        )
+        assert result.all() == [(0, "m0"), (1, "m1"), (2, "m2"), (3, "m3")]
+        # 비정규화 카운터도 실제로 추가된 행만 셈
+        saved = await db.get(ConversationSession, session_id)
+        assert (saved.message_count, saved.last_message_at) == (4, now)
+
+
+@pytest.mark.asyncio
+async def test_overlapping_connections_keep_all_messages() -> None:
+    """빠른 재연결: 이전 연결이 아직 저장하지 않은 메시지와 새 연결의 seq가 겹쳐도 둘 다 저장"""
+    await _init_db()
+    await _reset_db()
+
+    session_id = str(uuid.uuid4())
+    old = ConversationTracker(session_id=session_id)
+    old.add_transcript("user", "old 0")
+
+    def to_schema(messages: list[dict]) -> list[MessageSchema]:
+        return [MessageSchema(**message) for message in messages]
+
+    async with AsyncSessionLocal() as db:
+        report = old.finalize()
+        await ChatRepository(db).create_session_log(SessionCreate(**{**report, "messages": []}))
+        await ChatRepository(db).checkpoint_messages(session_id, to_schema(old.pending_messages()))
+        old.mark_checkpointed(1)
+
+    # 이전 연결의 미저장 메시지 (seq 1, 2)
+    old.add_transcript("user", "old A")
+    old.add_transcript("assistant", "old B")
+
+    # 새 연결은 DB의 마지막 seq + 1 = 1부터 시작해 같은 seq를 사용
+    new = ConversationTracker(session_id=session_id, start_seq=1)
+    new.add_transcript("user", "new A")
+    new.add_transcript("assistant", "new B")
+    async with AsyncSessionLocal() as db:
+        await ChatRepository(db).checkpoint_messages(session_id, to_schema(new.pending_messages()))
+
+    # 이전 연결의 최종 저장이 늦게 도착
+    old.add_transcript("user", "old C")
+    async with AsyncSessionLocal() as db:
+        report = old.finalize()
+        await ChatRepository(db).create_session_log(
+            SessionCreate(**{**report, "messages": report["messages"][report["checkpointed_messages"]:]})
+        )
+
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(ChatMessage.content).where(ChatMessage.session_id == session_id).order_by(ChatMessage.id)
+        )
+        assert result.scalars().all() == ["old 0", "new A", "new B", "old A", "old B", "old C"]
+        saved = await db.get(ConversationSession, session_id)
+        assert saved.message_count == 6
+
+
+@pytest.mark.asyncio
+async def test_session_list_cursor_matches_skip_paging() -> None:
+    await _init_db()
+    await _reset_db()
+
+    async with AsyncSessionLocal() as db:
+        user = User(login_id="pager", hashed_password="hashed", nickname="pager", is_active=True)
+        db.add(user)
+        await db.commit()
+        await db.refresh(user)
+
+        prefix = uuid.uuid4().hex
+        base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        for i in range(7):
+            # 같은 ended_at이 있어도 session_id로 순서가 고정되어야 함
+            ended_at = (base + timedelta(minutes=i // 2)).isoformat()
+            db.add(ConversationSession(
+                session_id=f"{prefix}-{i}",
+                started_at=ended_at,
+                ended_at=ended_at,
+                total_duration_sec=0.0,
+                user_speech_duration_sec=0.0,
+                user_id=user.id,
+            ))
+        await db.commit()
+        await ChatRepository(db).checkpoint_messages(
+            f"{prefix}-6", [MessageSchema(seq=0, connection_id="c1", role="user", content="hi", timestamp=base.isoformat())]
+        )
+
+    async with AsyncSessionLocal() as db:
+        service = ChatService(ChatRepository(db))
+        by_skip = []
+        for skip in range(0, 7, 3):
+            page, _ = await service.get_user_sessions(user.id, skip=skip, limit=3)
+            by_skip.extend(page)
+
+        by_cursor, cursor, pages = [], None, 0
+        while True:
+            page, cursor = await service.get_user_sessions(user.id, limit=3, cursor=cursor)
+            by_cursor.extend(page)
+            pages += 1
+            if cursor is None:
+                break
+
+        with pytest.raises(ValueError):
+            await service.get_user_sessions(user.id, cursor="not-a-cursor")
+
+    assert pages == 3
+    assert [s.session_id for s in by_cursor] == [s.session_id for s in by_skip] == [f"{prefix}-{i}" for i in range(6, -1, -1)]
+    assert by_cursor[0].message_count == 1
+    assert by_cursor[1].message_count == 0
+
+
+@pytest.mark.asyncio
+async def test_repair_session_counters() -> None:
+    await _init_db()
+    await _reset_db()
+
+    now = datetime.now(timezone.utc).isoformat()
+    session_id = str(uuid.uuid4())
+    async with AsyncSessionLocal() as db:
+        await ChatRepository(db).create_session_log(SessionCreate(
+            session_id=session_id,
+            started_at=now,
+            ended_at=now,
+            total_duration_sec=0.0,
+            user_speech_duration_sec=0.0,
+            messages=[
+                MessageSchema(seq=seq, connection_id="c1", role="user", content=c, timestamp=now)
+                for seq, c in enumerate(("a", "b"))
+            ],
+        ))
+        # 카운터를 거치지 않고 추가된 메시지 (컬럼 추가 이전 데이터 등)
+        db.add(ChatMessage(session_id=session_id, role="user", content="c", timestamp="9999-01-01T00:00:00"))
+        await db.execute(
+            update(ConversationSession)
+            .where(ConversationSession.session_id == session_id)
+            .values(message_count=0, last_message_at=None)
+        )
+        await db.commit()
+
+    assert await repair_session_counters(batch_size=1) >= 1
+    assert await repair_session_counters() == 0
+
+    async with AsyncSessionLocal() as db:
+        saved = await db.get(ConversationSession, session_id)
+        assert (saved.message_count, saved.last_message_at) == (3, "9999-01-01T00:00:00")
+
+
+@pytest.mark.asyncio
+async def test_upgrade_schema_backfills_added_session_counters(tmp_path) -> None:
+    """카운터 컬럼이 없던 기존 DB: 컬럼을 추가하는 init_db 트랜잭션에서 기존 메시지로 채움"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/legacy.db")
+    now = datetime.now(timezone.utc).isoformat()
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(text(
+            "INSERT INTO conversation_sessions "
+            "(session_id, started_at, ended_at, total_duration_sec, user_speech_duration_sec, deleted) "
+            "VALUES ('legacy', :now, :now, 0, 0, 0), ('empty', :now, :now, 0, 0, 0)"
+        ), {"now": now})
+        await conn.execute(text(
+            "INSERT INTO chat_messages (session_id, role, content, timestamp) "
+            "VALUES ('legacy', 'user', 'a', '2026-01-01T00:00:00'), ('legacy', 'assistant', 'b', '2026-01-02T00:00:00')"
+        ))
+        await conn.execute(text("ALTER TABLE conversation_sessions DROP COLUMN message_count"))
+        await conn.execute(text("ALTER TABLE conversation_sessions DROP COLUMN last_message_at"))
+
+    async with engine.begin() as conn:
+        await conn.run_sync(_upgrade_schema)
+
+    async with engine.connect() as conn:
+        result = await conn.execute(
+            select(ConversationSession.session_id, ConversationSession.message_count, ConversationSession.last_message_at)
+            .order_by(ConversationSession.session_id)
+        )
+        assert result.all() == [("empty", 0, None), ("legacy", 2, "2026-01-02T00:00:00")]
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_scenario_outbox_keeps_unfinished_jobs() -> None:
+    await _init_db()
+
+    prefix = uuid.uuid4().hex
+    async with AsyncSessionLocal() as db:
+        repo = ScenarioOutboxRepository(db)
+        for name in ("pending", "persisted", "failed", "done"):
+            await repo.add(f"{prefix}-{name}", {"session_id": f"{prefix}-{name}", "fallback_title": "카페"})
+        await repo.mark(f"{prefix}-persisted", "persisted")
+        await repo.mark(f"{prefix}-failed", "failed", "disk full")
+        await repo.remove(f"{prefix}-done")
+        # 같은 세션이 다시 완료되면 pending으로 덮어씀
+        await repo.add(f"{prefix}-pending", {"session_id": f"{prefix}-pending", "fallback_title": "공항"})
+
+    async with AsyncSessionLocal() as db:
+        rows = [row for row in await ScenarioOutboxRepository(db).list_unfinished() if row.session_id.startswith(prefix)]
+        assert sorted((row.session_id, row.status) for row in rows) == [
+            (f"{prefix}-pending", "pending"),
+            (f"{prefix}-persisted", "persisted"),
+        ]
+        assert "공항" in next(row.payload_json for row in rows if row.status == "pending")
+        await db.execute(delete(ScenarioCompletionOutbox).where(ScenarioCompletionOutbox.session_id.startswith(prefix)))
+        await db.commit()
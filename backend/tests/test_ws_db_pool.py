@@ -0,0 +1,124 @@
+import asyncio
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import delete, select, text
+
+from app.db.database import engine, init_db, AsyncSessionLocal
+from app.db.models import ChatMessage, ConversationSession
+from app.core.config import settings
+from app.services import chat_service as chat_service_module
+from app.services.chat_service import ChatService
+
+
+async def _init_db() -> None:
+    await init_db()
+
+
+async def _reset_db() -> None:
+    async with AsyncSessionLocal() as session:
+        await session.execute(delete(ChatMessage))
+        await session.execute(delete(ConversationSession))
+        await session.commit()
+
+
+class _FakeWebSocket:
+    def __init__(self) -> None:
+        self.closed = None
+
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        self.closed = (code, reason)
+
+
+class _HeldConversation:
+    """handler.start()가 release 될 때까지 대화가 진행 중인 것처럼 대기하는 ConnectionHandler 대역"""
+
+    started = 0
+    release: asyncio.Event
+
+    def __init__(self, websocket, api_key, *, history=None, session_id=None, **kwargs) -> None:
+        self.session_id = session_id
+        self.history = history
+
+    async def start(self):
+        type(self).started += 1
+        await type(self).release.wait()
+        now = datetime.now(timezone.utc).isoformat()
+        return {
+            "session_id": self.session_id,
+            "started_at": now,
+            "ended_at": now,
+            "total_duration_sec": 1.0,
+            "user_speech_duration_sec": 0.5,
+            "messages": [
+                {"seq": 0, "connection_id": uuid.uuid4().hex, "role": "user", "content": "hello", "timestamp": now}
+            ],
+        }
+
+
+@pytest.mark.asyncio
+async def test_concurrent_chat_websockets_exceed_pool_size(monkeypatch) -> None:
+    """
+    부하 테스트: 동시 WebSocket 대화 수가 커넥션 풀 크기(pool_size + max_overflow)를 넘어도
+    모든 대화가 시작되고, 대화 중에는 커넥션을 점유하지 않으며, 종료 후 모두 저장되는지 확인합니다.
+    """
+    await _init_db()
+    await _reset_db()
+
+    pool = engine.pool
+    capacity = pool.size() + pool._max_overflow
+    sessions = capacity + 10
+
+    now = datetime.now(timezone.utc).isoformat()
+    session_ids = [str(uuid.uuid4()) for _ in range(sessions)]
+    async with AsyncSessionLocal() as db:
+        for session_id in session_ids:
+            db.add(ConversationSession(
+                session_id=session_id,
+                title="Load",
+                started_at=now,
+                ended_at=now,
+                total_duration_sec=0.0,
+                user_speech_duration_sec=0.0,
+            ))
+        await db.commit()
+
+    _HeldConversation.started = 0
+    _HeldConversation.release = asyncio.Event()
+    monkeypatch.setattr(chat_service_module, "ConnectionHandler", _HeldConversation)
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", "sk-test")
+
+    websockets = [_FakeWebSocket() for _ in session_ids]
+    tasks = [
+        asyncio.create_task(ChatService().start_ai_session(ws, user_id=None, session_id=session_id, voice="alloy"))
+        for ws, session_id in zip(websockets, session_ids)
+    ]
+
+    # pool_timeout(30초) 안에 끝나야 하는 것이 아니라, 풀 대기 없이 바로 전원이 대화 단계에 진입해야 함
+    async def all_started() -> None:
+        while _HeldConversation.started < sessions:
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(all_started(), timeout=10)
+    assert pool.checkedout() == 0
+
+    # 대화 진행 중에도 다른 요청은 커넥션을 바로 얻을 수 있음
+    async with AsyncSessionLocal() as db:
+        assert (await asyncio.wait_for(db.execute(text("SELECT 1")), timeout=1)).scalar() == 1
+
+    _HeldConversation.release.set()
+    await asyncio.wait_for(asyncio.gather(*tasks), timeout=30)
+    assert all(ws.closed is None for ws in websockets)
+    assert pool.checkedout() == 0
+
+    async with AsyncSessionLocal() as db:
+        saved = (await db.execute(
+            select(ConversationSession.total_duration_sec, ConversationSession.voice)
+            .where(ConversationSession.session_id.in_(session_ids))
+        )).all()
+        message_count = (await db.execute(
+            select(ChatMessage.id).where(ChatMessage.session_id.in_(session_ids))
+        )).all()
+    assert sorted(saved) == [(1.0, "alloy")] * sessions
+    assert len(message_count) == sessions